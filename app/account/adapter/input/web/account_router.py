@@ -1,12 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException
 
-from app.auth.adapter.input.web.dependencies import (
-    get_optional_jwt_payload,
-    get_optional_session,
-)
-from app.auth.application.port.jwt_token_port import TokenPayload
-from app.auth.domain.entity.session import Session
-from app.config.database.session import get_db_session
+from app.auth.adapter.input.web.dependencies import AuthContext, get_account_usecase, get_auth_context
 
 from app.account.adapter.input.web.response.update_mbti_gender_response import UpdateMbtiGenderResponse
 from app.account.adapter.input.web.request.update_mbti_gender_Request import UpdateMbtiGenderRequest
@@ -15,14 +9,6 @@ from app.account.adapter.input.web.response.update_mbti_gender_response import (
     UpdateMbtiGenderResponse,
 )
 from app.account.application.usecase.account_usecase import AccountUseCase
-from app.account.infrastructure.repository.account_repository_impl import AccountRepositoryImpl
-
-
-# =============================
-# DI 객체 (conversation_router 스타일)
-# =============================
-account_repo = AccountRepositoryImpl()
-account_usecase = AccountUseCase(account_repo)
 
 router = APIRouter(prefix="/account", tags=["account"])
 
@@ -30,15 +16,12 @@ router = APIRouter(prefix="/account", tags=["account"])
 # =============================
 # 인증 관련
 # =============================
-def get_current_account_id(
-    jwt_payload: TokenPayload | None = Depends(get_optional_jwt_payload),
-    session: Session | None = Depends(get_optional_session),
+async def get_current_account_id(
+    auth: AuthContext = Depends(get_auth_context),
 ) -> int:
-
-    if jwt_payload:
-        return jwt_payload.account_id
-    if session:
-        return session.account_id
+    # JWT 가 유효하면 세션 조회 없이 바로 결정됨
+    if auth.is_authenticated:
+        return auth.account_id
     raise HTTPException(status_code=401, detail="Not authenticated")
 
 
@@ -46,18 +29,16 @@ def get_current_account_id(
 # PATCH 내 MBTI / Gender 수정
 # =============================
 @router.patch("/my/profile/mbti-gender/edit", response_model=UpdateMbtiGenderResponse)
-def edit_my_mbti_gender(
+async def edit_my_mbti_gender(
     req: UpdateMbtiGenderRequest,
     account_id: int = Depends(get_current_account_id),
-    db: Session = Depends(get_db_session),
+    # 요청당 세션 하나: 조회한 계정을 그대로 수정 (커밋 후 계정 캐시 무효화)
+    usecase: AccountUseCase = Depends(get_account_usecase),
 ):
     if req.gender is None and req.mbti is None:
         raise HTTPException(status_code=400, detail="Nothing to update")
 
-    repo = AccountRepositoryImpl(db)
-    usecase = AccountUseCase(repo)
-
-    updated = usecase.update_my_mbti_gender(
+    updated = await usecase.update_my_mbti_gender(
         account_id=account_id,
         gender=req.gender,
         mbti=req.mbti,
@@ -6,16 +6,16 @@ from typing import Optional
 from app.account.domain.entity.account import Account
 
 
-class AccountRepositoryPort(ABC):
-    """Port (interface) for account repository.
+class AccountReaderPort(ABC):
+    """Port (interface) for read-only account lookups.
 
-    This defines the contract that any account persistence adapter must implement.
-    Following hexagonal architecture, the application layer defines this port,
-    and the infrastructure layer provides the implementation.
+    Lookups may be served from a cache, so results can be slightly stale.
+    Writes go through AccountUnitOfWorkPort.accounts, which reads from the
+    database in the same transaction.
     """
 
     @abstractmethod
-    def find_by_id(self, account_id: int) -> Optional[Account]:
+    async def find_by_id(self, account_id: int) -> Optional[Account]:
         """Find an account by its ID.
 
         Args:
@@ -27,7 +27,7 @@ class AccountRepositoryPort(ABC):
         pass
 
     @abstractmethod
-    def find_by_email(self, email: str) -> Optional[Account]:
+    async def find_by_email(self, email: str) -> Optional[Account]:
         """Find an account by email address.
 
         Args:
@@ -39,25 +39,50 @@ class AccountRepositoryPort(ABC):
         pass
 
     @abstractmethod
-    def save(self, account: Account) -> Account:
-        """Save an account (create or update).
+    async def exists_by_email(self, email: str) -> bool:
+        """Check if an account exists with the given email.
 
         Args:
-            account: The account to save.
+            email: The email address to check.
 
         Returns:
-            The saved account with updated fields (e.g., ID for new accounts).
+            True if an account exists, False otherwise.
         """
         pass
 
+
+class AccountRepositoryPort(AccountReaderPort):
+    """Port (interface) for account repository.
+
+    This defines the contract that any account persistence adapter must implement.
+    Following hexagonal architecture, the application layer defines this port,
+    and the infrastructure layer provides the implementation.
+    """
+
     @abstractmethod
-    def exists_by_email(self, email: str) -> bool:
-        """Check if an account exists with the given email.
+    async def get_or_create_by_email(self, email: str, nickname: str) -> Account:
+        """Find the account with the given email, creating it if there is none.
+
+        Must be safe under concurrency: simultaneous calls with the same
+        email all return the same account and never fail on the unique index.
 
         Args:
-            email: The email address to check.
+            email: The email address to look up.
+            nickname: Display name for a newly created account.
 
         Returns:
-            True if an account exists, False otherwise.
+            The existing or newly created account.
+        """
+        pass
+
+    @abstractmethod
+    async def save(self, account: Account) -> Account:
+        """Save an account (create or update).
+
+        Args:
+            account: The account to save.
+
+        Returns:
+            The saved account with updated fields (e.g., ID for new accounts).
         """
         pass
@@ -0,0 +1,40 @@
+"""Account unit of work port - Interface for transactional account writes."""
+
+from abc import ABC, abstractmethod
+
+from app.account.application.port.account_repository_port import AccountRepositoryPort
+
+
+class AccountUnitOfWorkPort(ABC):
+    """Port (interface) for a unit of work over account persistence.
+
+    Every read and write made through accounts shares one database session,
+    so an entity loaded by find_by_id is updated by save without being
+    fetched again. Nothing is persisted until commit is called; leaving the
+    context without committing rolls the work back.
+
+    Usage:
+        async with unit_of_work:
+            account = await unit_of_work.accounts.find_by_id(account_id)
+            ...
+            await unit_of_work.accounts.save(account)
+            await unit_of_work.commit()
+    """
+
+    accounts: AccountRepositoryPort
+
+    async def __aenter__(self) -> "AccountUnitOfWorkPort":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.rollback()
+
+    @abstractmethod
+    async def commit(self) -> None:
+        """Commit all changes made through accounts."""
+        pass
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        """Discard uncommitted changes (no-op after commit)."""
+        pass
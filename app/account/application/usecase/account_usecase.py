@@ -3,7 +3,8 @@
 from typing import Optional
 
 from app.account.domain.entity.account import Account
-from app.account.application.port.account_repository_port import AccountRepositoryPort
+from app.account.application.port.account_repository_port import AccountReaderPort
+from app.account.application.port.account_unit_of_work_port import AccountUnitOfWorkPort
 from app.account.domain.entity.account_enums import Gender, Mbti
 from app.common.domain.exceptions import AccountNotFoundException
 
@@ -11,18 +12,22 @@ from app.common.domain.exceptions import AccountNotFoundException
 class AccountUseCase:
     """UseCase for account management.
 
-    Handles account creation, retrieval, and updates.
+    Handles account creation, retrieval, and updates. Lookups go through
+    the (possibly cached) repository; every write runs in the unit of work,
+    which loads and saves the account in one session and one transaction.
     """
 
-    def __init__(self, account_repository: AccountRepositoryPort):
+    def __init__(self, account_repository: AccountReaderPort, unit_of_work: AccountUnitOfWorkPort):
         """Initialize account usecase.
 
         Args:
-            account_repository: Repository for account persistence.
+            account_repository: Repository for account lookups.
+            unit_of_work: Unit of work for account writes.
         """
         self._repository = account_repository
+        self._uow = unit_of_work
 
-    def get_or_create_account(self, email: str, nickname: str) -> Account:
+    async def get_or_create_account(self, email: str, nickname: str) -> Account:
         """Get an existing account by email or create a new one.
 
         This is the primary method used during OAuth login.
@@ -34,19 +39,13 @@ class AccountUseCase:
         Returns:
             The existing or newly created account.
         """
-        existing = self._repository.find_by_email(email)
+        async with self._uow:
+            # Atomic: simultaneous first logins with the same email get one account
+            account = await self._uow.accounts.get_or_create_by_email(email, nickname)
+            await self._uow.commit()
+            return account
 
-        if existing:
-            return existing
-
-        # Create new account
-        account = Account(
-            email=email,
-            nickname=nickname,
-        )
-        return self._repository.save(account)
-
-    def get_account_by_id(self, account_id: int) -> Optional[Account]:
+    async def get_account_by_id(self, account_id: int) -> Optional[Account]:
         """Get an account by its ID.
 
         Args:
@@ -55,9 +54,9 @@ class AccountUseCase:
         Returns:
             The account if found, None otherwise.
         """
-        return self._repository.find_by_id(account_id)
+        return await self._repository.find_by_id(account_id)
 
-    def get_account_by_email(self, email: str) -> Optional[Account]:
+    async def get_account_by_email(self, email: str) -> Optional[Account]:
         """Get an account by email address.
 
         Args:
@@ -66,9 +65,9 @@ class AccountUseCase:
         Returns:
             The account if found, None otherwise.
         """
-        return self._repository.find_by_email(email)
+        return await self._repository.find_by_email(email)
 
-    def update_account(self, account: Account) -> Account:
+    async def update_account(self, account: Account) -> Account:
         """Update an account.
 
         Args:
@@ -83,13 +82,16 @@ class AccountUseCase:
         if account.id is None:
             raise ValueError("Cannot update account without ID")
 
-        existing = self._repository.find_by_id(account.id)
-        if not existing:
-            raise AccountNotFoundException(account.id)
+        async with self._uow:
+            existing = await self._uow.accounts.find_by_id(account.id)
+            if not existing:
+                raise AccountNotFoundException(account.id)
 
-        return self._repository.save(account)
+            saved = await self._uow.accounts.save(account)
+            await self._uow.commit()
+            return saved
 
-    def agree_to_terms(self, account_id: int) -> Account:
+    async def agree_to_terms(self, account_id: int) -> Account:
         """Mark an account as having agreed to terms.
 
         Args:
@@ -101,15 +103,18 @@ class AccountUseCase:
         Raises:
             AccountNotFoundException: If account doesn't exist.
         """
-        account = self._repository.find_by_id(account_id)
+        async with self._uow:
+            account = await self._uow.accounts.find_by_id(account_id)
 
-        if not account:
-            raise AccountNotFoundException(account_id)
+            if not account:
+                raise AccountNotFoundException(account_id)
 
-        account.agree_to_terms()
-        return self._repository.save(account)
+            account.agree_to_terms()
+            saved = await self._uow.accounts.save(account)
+            await self._uow.commit()
+            return saved
 
-    def update_my_mbti_gender(self, account_id: int, gender: Optional[Gender] = None, mbti: Optional[Mbti] = None,) -> Account:
+    async def update_my_mbti_gender(self, account_id: int, gender: Optional[Gender] = None, mbti: Optional[Mbti] = None,) -> Account:
         """Update the authenticated user's MBTI and/or gender.
 
         Args:
@@ -123,14 +128,18 @@ class AccountUseCase:
         Raises:
             AccountNotFoundException: If account doesn't exist.
         """
-        account = self._repository.find_by_id(account_id)
-        if not account:
-            raise AccountNotFoundException(account_id)
-
-        # Update only provided fields
-        if gender is not None:
-            account.gender = gender
-        if mbti is not None:
-            account.mbti = mbti
-
-        return self._repository.save(account)
+        async with self._uow:
+            account = await self._uow.accounts.find_by_id(account_id)
+            if not account:
+                raise AccountNotFoundException(account_id)
+
+            # Update only provided fields
+            if gender is not None:
+                account.gender = gender
+            if mbti is not None:
+                account.mbti = mbti
+
+            # find_by_id loaded the row into this session, so save issues only the UPDATE
+            saved = await self._uow.accounts.save(account)
+            await self._uow.commit()
+            return saved
@@ -51,6 +51,47 @@ class Account:
         if isinstance(self.status, str):
             self.status = AccountStatus.from_string(self.status)
 
+    def to_dict(self) -> dict:
+        """Convert account to dictionary for serialization."""
+        return {
+            "id": self.id,
+            "email": self.email,
+            "nickname": self.nickname,
+            "terms_agreed": self.terms_agreed,
+            "terms_agreed_at": _isoformat(self.terms_agreed_at),
+            "created_at": _isoformat(self.created_at),
+            "updated_at": _isoformat(self.updated_at),
+            "role": self.role.value,
+            "plan": self.plan.value,
+            "plan_started_at": _isoformat(self.plan_started_at),
+            "plan_ends_at": _isoformat(self.plan_ends_at),
+            "billing_customer_id": self.billing_customer_id,
+            "gender": self.gender.value if self.gender else None,
+            "mbti": self.mbti.value if self.mbti else None,
+            "status": self.status.value,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Account":
+        """Create account from dictionary."""
+        return cls(
+            id=data["id"],
+            email=data["email"],
+            nickname=data["nickname"],
+            terms_agreed=data["terms_agreed"],
+            terms_agreed_at=_fromisoformat(data.get("terms_agreed_at")),
+            created_at=_fromisoformat(data.get("created_at")),
+            updated_at=_fromisoformat(data.get("updated_at")),
+            role=data["role"],
+            plan=data["plan"],
+            plan_started_at=_fromisoformat(data.get("plan_started_at")),
+            plan_ends_at=_fromisoformat(data.get("plan_ends_at")),
+            billing_customer_id=data.get("billing_customer_id"),
+            gender=Gender(data["gender"]) if data.get("gender") else None,
+            mbti=Mbti(data["mbti"]) if data.get("mbti") else None,
+            status=data["status"],
+        )
+
     def agree_to_terms(self) -> None:
         """Mark that user has agreed to terms of service."""
         self.terms_agreed = True
@@ -140,3 +181,11 @@ class Account:
         """Demote the admin to regular user role."""
         self.role = AccountRole.USER
         self.updated_at = datetime.now()
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def _fromisoformat(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
@@ -0,0 +1,142 @@
+"""Read-through account cache (in-process + Redis)."""
+
+import json
+import logging
+import time
+from typing import Optional
+
+import redis.asyncio as aioredis
+
+from app.account.domain.entity.account import Account
+from app.config.redis_config import get_async_redis
+
+logger = logging.getLogger(__name__)
+
+
+class AccountCache:
+    """Two-tier account cache keyed by account id.
+
+    - Local tier: per-worker dict with a short TTL, no network hop.
+    - Redis tier: shared by all workers with a longer TTL.
+      Key format: account:{account_id}
+
+    Entries are dropped from both tiers when AccountUnitOfWorkImpl commits a
+    change to the account. Another worker's local copy can stay stale for
+    up to local_ttl_seconds, and stats() reports how old served entries were.
+    Redis errors are treated as misses.
+    """
+
+    KEY_PREFIX = "account:"
+    MAX_LOCAL_ENTRIES = 10_000
+
+    def __init__(
+        self,
+        redis_client: Optional[aioredis.Redis] = None,
+        local_ttl_seconds: float = 5.0,
+        redis_ttl_seconds: int = 60,
+    ):
+        """Initialize the cache.
+
+        Args:
+            redis_client: Async Redis client. Uses the shared pool if not provided.
+            local_ttl_seconds: TTL of the in-process tier (0 disables it).
+            redis_ttl_seconds: TTL of the Redis tier (0 disables it).
+        """
+        self._redis = redis_client or get_async_redis()
+        self.local_ttl_seconds = local_ttl_seconds
+        self.redis_ttl_seconds = redis_ttl_seconds
+        # account_id -> (account dict, cached_at wall clock, local expiry monotonic)
+        self._local: dict[int, tuple[dict, float, float]] = {}
+        self._stats = {
+            "local_hits": 0,
+            "redis_hits": 0,
+            "misses": 0,
+            "invalidations": 0,
+            "redis_errors": 0,
+        }
+        self._age_total = 0.0
+        self._age_max = 0.0
+
+    def _make_key(self, account_id: int) -> str:
+        """Create Redis key for an account."""
+        return f"{self.KEY_PREFIX}{account_id}"
+
+    async def get(self, account_id: int) -> Optional[Account]:
+        """Get a cached account, or None on a miss."""
+        now = time.monotonic()
+        entry = self._local.get(account_id)
+        if entry is not None:
+            data, cached_at, expires_at = entry
+            if expires_at > now:
+                self._record_hit("local_hits", cached_at)
+                return Account.from_dict(data)
+            del self._local[account_id]
+
+        if self.redis_ttl_seconds:
+            try:
+                raw = await self._redis.get(self._make_key(account_id))
+            except Exception:
+                self._stats["redis_errors"] += 1
+                logger.warning("Account cache read failed account_id=%s", account_id, exc_info=True)
+                raw = None
+            if raw is not None:
+                payload = json.loads(raw)
+                self._remember_local(account_id, payload["account"], payload["cached_at"])
+                self._record_hit("redis_hits", payload["cached_at"])
+                return Account.from_dict(payload["account"])
+
+        self._stats["misses"] += 1
+        return None
+
+    async def put(self, account: Account) -> None:
+        """Store an account loaded from the database in both tiers."""
+        data = account.to_dict()
+        cached_at = time.time()
+        self._remember_local(account.id, data, cached_at)
+
+        if self.redis_ttl_seconds:
+            payload = json.dumps({"account": data, "cached_at": cached_at})
+            try:
+                await self._redis.set(self._make_key(account.id), payload, ex=self.redis_ttl_seconds)
+            except Exception:
+                self._stats["redis_errors"] += 1
+                logger.warning("Account cache write failed account_id=%s", account.id, exc_info=True)
+
+    async def invalidate(self, account_id: int) -> None:
+        """Drop an account from both tiers (call after it changes)."""
+        self._stats["invalidations"] += 1
+        self._local.pop(account_id, None)
+        try:
+            await self._redis.delete(self._make_key(account_id))
+        except Exception:
+            self._stats["redis_errors"] += 1
+            logger.warning("Account cache invalidation failed account_id=%s", account_id, exc_info=True)
+
+    def stats(self) -> dict:
+        """Hit ratio and staleness of served entries since start."""
+        hits = self._stats["local_hits"] + self._stats["redis_hits"]
+        lookups = hits + self._stats["misses"]
+        return {
+            **self._stats,
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+            "local_entries": len(self._local),
+            # Age of served entries = upper bound on how stale a hit could be
+            "mean_hit_age_seconds": round(self._age_total / hits, 3) if hits else 0.0,
+            "max_hit_age_seconds": round(self._age_max, 3),
+        }
+
+    def _remember_local(self, account_id: int, data: dict, cached_at: float) -> None:
+        if not self.local_ttl_seconds:
+            return
+        now = time.monotonic()
+        if len(self._local) >= self.MAX_LOCAL_ENTRIES:
+            self._local = {k: v for k, v in self._local.items() if v[2] > now}
+            if len(self._local) >= self.MAX_LOCAL_ENTRIES:
+                self._local.clear()
+        self._local[account_id] = (data, cached_at, now + self.local_ttl_seconds)
+
+    def _record_hit(self, tier: str, cached_at: float) -> None:
+        self._stats[tier] += 1
+        age = max(time.time() - cached_at, 0.0)
+        self._age_total += age
+        self._age_max = max(self._age_max, age)
@@ -0,0 +1,50 @@
+"""Account repository decorator backed by AccountCache."""
+
+from typing import Optional
+
+from app.account.application.port.account_repository_port import AccountReaderPort
+from app.account.domain.entity.account import Account
+from app.account.infrastructure.cache.account_cache import AccountCache
+
+
+class CachedAccountRepository(AccountReaderPort):
+    """Read-through cache in front of another AccountReaderPort.
+
+    find_by_id is served from the cache when possible and fills it on a miss.
+    Lookups by email always go to the wrapped repository.
+
+    It is read-only on purpose. Writes go through AccountUnitOfWorkImpl,
+    which reads from the database, commits, and only then invalidates the
+    cache: save copies every field of the entity, so saving a stale cached
+    copy would overwrite newer data (e.g. a plan change made through another
+    worker).
+    """
+
+    def __init__(self, repository: AccountReaderPort, cache: AccountCache):
+        """Initialize the decorator.
+
+        Args:
+            repository: The repository that owns persistence.
+            cache: Process-wide account cache.
+        """
+        self._repository = repository
+        self._cache = cache
+
+    async def find_by_id(self, account_id: int) -> Optional[Account]:
+        """Find an account by its ID, from the cache when possible."""
+        account = await self._cache.get(account_id)
+        if account is not None:
+            return account
+
+        account = await self._repository.find_by_id(account_id)
+        if account is not None:
+            await self._cache.put(account)
+        return account
+
+    async def find_by_email(self, email: str) -> Optional[Account]:
+        """Find an account by email address."""
+        return await self._repository.find_by_email(email)
+
+    async def exists_by_email(self, email: str) -> bool:
+        """Check if an account exists with the given email."""
+        return await self._repository.exists_by_email(email)
@@ -1,9 +1,13 @@
 """Account repository implementation using SQLAlchemy."""
 
+from datetime import datetime
 from typing import Optional
 
-from sqlalchemy.orm import Session as DBSession
-from app.config.database.session import get_db_session
+from sqlalchemy import select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.dml import Insert
 
 from app.account.domain.entity.account import Account
 from app.account.domain.entity.account_enums import (
@@ -19,101 +23,128 @@ class AccountRepositoryImpl(AccountRepositoryPort):
     """SQLAlchemy implementation of AccountRepositoryPort.
 
     This adapter implements the application port using SQLAlchemy for persistence.
+    save only flushes; committing is up to the owner of the session
+    (see AccountUnitOfWorkImpl).
     """
 
-    def __init__(self, db_session: Optional[DBSession] = None):
+    def __init__(self, db_session: AsyncSession):
         """Initialize with a database session.
 
         Args:
-            db_session: SQLAlchemy database session.
+            db_session: SQLAlchemy async session owned by the caller.
         """
-        self._session: DBSession = db_session or get_db_session()
+        self._session = db_session
+        # The session's identity map only holds weak references, so keep the
+        # loaded rows alive for save() to update without selecting them again
+        self._loaded: dict[int, AccountModel] = {}
 
-    def find_by_id(self, account_id: int) -> Optional[Account]:
+    async def find_by_id(self, account_id: int) -> Optional[Account]:
         """Find an account by its ID."""
-        try:
-            model = (
-                self._session.query(AccountModel)
-                .filter(AccountModel.id == account_id)
-                .first()
-            )
-            return self._to_entity(model) if model else None
-        finally:
-            self._session.close()
-
-    def find_by_email(self, email: str) -> Optional[Account]:
+        model = await self._session.get(AccountModel, account_id)
+        return self._remember(model)
+
+    async def find_by_email(self, email: str) -> Optional[Account]:
         """Find an account by email address."""
-        try:
-            model = (
-                self._session.query(AccountModel)
-                .filter(AccountModel.email == email)
-                .first()
-            )
-            return self._to_entity(model) if model else None
-        finally:
-            self._session.close()
-
-    def save(self, account: Account) -> Account:
-        """Save an account (create or update)."""
-        try:
-            if account.is_new():
-                # Create new account
-                model = self._to_model(account)
-                self._session.add(model)
-                self._session.commit()
-                self._session.refresh(model)
-                return self._to_entity(model)
-            else:
-                # Update existing account
-                model = (
-                    self._session.query(AccountModel)
-                    .filter(AccountModel.id == account.id)
-                    .first()
-                )
-                if model:
-                    model.email = account.email
-                    model.nickname = account.nickname
-                    model.terms_agreed = account.terms_agreed
-                    model.terms_agreed_at = account.terms_agreed_at
-                    # Update new fields
-                    model.role = account.role.value if isinstance(account.role, AccountRole) else account.role
-                    model.plan = account.plan.value if isinstance(account.plan, AccountPlan) else account.plan
-                    model.plan_started_at = account.plan_started_at
-                    model.plan_ends_at = account.plan_ends_at
-                    model.billing_customer_id = account.billing_customer_id
-                    model.status = account.status.value if isinstance(account.status, AccountStatus) else account.status
-
-                    # 추가 : mbti /gender
-                    model.mbti = account.mbti.value if account.mbti else None
-                    model.gender = account.gender.value if account.gender else None
-
-                    self._session.commit()
-                    self._session.refresh(model)
-                    return self._to_entity(model)
-                else:
-                    # Account not found, create new
-                    return self.save(Account(
-                        email=account.email,
-                        nickname=account.nickname,
-                        terms_agreed=account.terms_agreed,
-                        terms_agreed_at=account.terms_agreed_at,
-                        mbti=account.mbti,
-                        gender=account.gender,
-                    ))
-        finally:
-            self._session.close()
-
-    def exists_by_email(self, email: str) -> bool:
+        result = await self._session.execute(
+            select(AccountModel).where(AccountModel.email == email).limit(1)
+        )
+        model = result.scalar_one_or_none()
+        return self._remember(model)
+
+    async def get_or_create_by_email(self, email: str, nickname: str) -> Account:
+        """Find or atomically create an account by email.
+
+        Returning users cost a single SELECT. Otherwise one INSERT that
+        ignores a duplicate email creates the row, so concurrent first
+        logins never fail on the unique index, and the row is read back
+        with a locking read: under REPEATABLE READ a plain SELECT would
+        still use the snapshot of the first lookup and miss a row that a
+        concurrent login committed in the meantime.
+        """
+        existing = await self.find_by_email(email)
+        if existing:
+            return existing
+
+        model = self._to_model(Account(email=email, nickname=nickname))
+        values = {
+            column.name: getattr(model, column.key)
+            for column in AccountModel.__table__.columns
+            if column.key != "id"
+        }
+        await self._session.execute(self._insert_ignoring_duplicate(values))
+
+        result = await self._session.execute(
+            select(AccountModel).where(AccountModel.email == email).with_for_update(read=True)
+        )
+        return self._remember(result.scalar_one())
+
+    def _insert_ignoring_duplicate(self, values: dict) -> Insert:
+        """INSERT that is a no-op when the email already exists."""
+        if self._session.get_bind().dialect.name == "mysql":
+            stmt = mysql_insert(AccountModel).values(**values)
+            return stmt.on_duplicate_key_update(id=AccountModel.id)
+        # SQLite (local runs and benchmarks)
+        stmt = sqlite_insert(AccountModel).values(**values)
+        return stmt.on_conflict_do_nothing(index_elements=[AccountModel.email])
+
+    async def save(self, account: Account) -> Account:
+        """Save an account (create or update) and flush it, without committing."""
+        if account.is_new():
+            # Create new account (timestamps come from the entity, so no refresh is needed)
+            model = self._to_model(account)
+            self._session.add(model)
+            await self._session.flush()
+            return self._remember(model)
+
+        # Update existing account (no SELECT if it was loaded through this repository)
+        model = self._loaded.get(account.id) or await self._session.get(AccountModel, account.id)
+        if model:
+            model.email = account.email
+            model.nickname = account.nickname
+            model.terms_agreed = account.terms_agreed
+            model.terms_agreed_at = account.terms_agreed_at
+            # Update new fields
+            model.role = account.role.value if isinstance(account.role, AccountRole) else account.role
+            model.plan = account.plan.value if isinstance(account.plan, AccountPlan) else account.plan
+            model.plan_started_at = account.plan_started_at
+            model.plan_ends_at = account.plan_ends_at
+            model.billing_customer_id = account.billing_customer_id
+            model.status = account.status.value if isinstance(account.status, AccountStatus) else account.status
+
+            # 추가 : mbti /gender
+            model.mbti = account.mbti.value if account.mbti else None
+            model.gender = account.gender.value if account.gender else None
+
+            # Set updated_at here instead of the column's onupdate=func.now(),
+            # which would expire it and cost a SELECT to read back
+            if self._session.is_modified(model):
+                model.updated_at = datetime.now()
+                await self._session.flush()
+            return self._to_entity(model)
+
+        # Account not found, create new
+        return await self.save(Account(
+            email=account.email,
+            nickname=account.nickname,
+            terms_agreed=account.terms_agreed,
+            terms_agreed_at=account.terms_agreed_at,
+            mbti=account.mbti,
+            gender=account.gender,
+        ))
+
+    async def exists_by_email(self, email: str) -> bool:
         """Check if an account exists with the given email."""
-        try:
-            return (
-                self._session.query(AccountModel)
-                .filter(AccountModel.email == email)
-                .first()
-                is not None
-            )
-        finally:
-            self._session.close()
+        result = await self._session.execute(
+            select(AccountModel.id).where(AccountModel.email == email).limit(1)
+        )
+        return result.first() is not None
+
+    def _remember(self, model: Optional[AccountModel]) -> Optional[Account]:
+        """Keep a loaded row for later saves and convert it to an entity."""
+        if model is None:
+            return None
+        self._loaded[model.id] = model
+        return self._to_entity(model)
 
     @staticmethod
     def _to_entity(model: AccountModel) -> Account:
@@ -153,4 +184,6 @@ class AccountRepositoryImpl(AccountRepositoryPort):
             gender=entity.gender.value if entity.gender else None,
             mbti=entity.mbti.value if entity.mbti else None,
             status=entity.status.value if isinstance(entity.status, AccountStatus) else entity.status,
+            created_at=entity.created_at,
+            updated_at=entity.updated_at,
         )
@@ -0,0 +1,56 @@
+"""Account unit of work implementation using SQLAlchemy."""
+
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.account.application.port.account_unit_of_work_port import AccountUnitOfWorkPort
+from app.account.infrastructure.cache.account_cache import AccountCache
+from app.account.infrastructure.orm.account_model import AccountModel
+from app.account.infrastructure.repository.account_repository_impl import AccountRepositoryImpl
+
+
+class AccountUnitOfWorkImpl(AccountUnitOfWorkPort):
+    """SQLAlchemy implementation of AccountUnitOfWorkPort.
+
+    Wraps the request's AsyncSession (expire_on_commit=False). The
+    repository only flushes; the transaction ends in commit. Reads always
+    go to the database, never the account cache, so an update cannot start
+    from a stale cached copy. Accounts written in the transaction are
+    dropped from the cache once it commits.
+    """
+
+    def __init__(self, db_session: AsyncSession, account_cache: Optional[AccountCache] = None):
+        """Initialize with a database session.
+
+        Args:
+            db_session: SQLAlchemy async session owned by the caller (one per request).
+            account_cache: Cache to invalidate after commit (optional).
+        """
+        self._session = db_session
+        self._cache = account_cache
+        self._written_ids: set[int] = set()
+        self.accounts = AccountRepositoryImpl(db_session)
+        event.listen(db_session.sync_session, "after_flush", self._collect_written)
+
+    def _collect_written(self, session, flush_context) -> None:
+        """Remember which accounts each flush inserted or updated."""
+        # dirty also holds rows whose attributes were set to the same values
+        for obj in (*session.new, *session.dirty):
+            if isinstance(obj, AccountModel) and (obj in session.new or session.is_modified(obj)):
+                self._written_ids.add(obj.id)
+
+    async def commit(self) -> None:
+        """Commit the transaction, then invalidate cached copies of written accounts."""
+        await self._session.commit()
+        written, self._written_ids = self._written_ids, set()
+        if self._cache is not None:
+            for account_id in written:
+                await self._cache.invalidate(account_id)
+
+    async def rollback(self) -> None:
+        """Roll back anything not yet committed."""
+        self._written_ids.clear()
+        if self._session.in_transaction():
+            await self._session.rollback()
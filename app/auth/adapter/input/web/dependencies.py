@@ -1,9 +1,10 @@
 """Auth API dependencies - FastAPI dependency injection."""
 
-from typing import Generator, Optional
+from dataclasses import dataclass
+from typing import Optional
 
 from fastapi import Depends, HTTPException, Request, status
-from sqlalchemy.orm import Session as DBSession
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.account.application.usecase.account_usecase import AccountUseCase
 from app.auth.application.port.jwt_token_port import TokenPayload
@@ -11,63 +12,103 @@ from app.auth.application.usecase.csrf_usecase import CSRFUseCase
 from app.auth.application.usecase.auth_usecase import AuthUseCase
 from app.auth.application.usecase.session_usecase import SessionUseCase
 from app.auth.domain.entity.session import Session
+from app.auth.application.port.token_blacklist_port import TokenBlacklistPort
+from app.auth.infrastructure.cache.cached_token_blacklist import CachedTokenBlacklist
 from app.auth.infrastructure.cache.session_repository_impl import SessionRepositoryImpl
 from app.auth.infrastructure.cache.token_blacklist_impl import TokenBlacklistImpl
 from app.auth.infrastructure.jwt.jwt_token_service import JWTTokenService
+from app.account.application.port.account_repository_port import AccountReaderPort
+from app.account.application.port.account_unit_of_work_port import AccountUnitOfWorkPort
+from app.account.infrastructure.cache.account_cache import AccountCache
+from app.account.infrastructure.cache.cached_account_repository import CachedAccountRepository
 from app.account.infrastructure.repository.account_repository_impl import AccountRepositoryImpl
-from app.config.database.session import SessionLocal
+from app.account.infrastructure.repository.account_unit_of_work_impl import AccountUnitOfWorkImpl
+from app.config.database.session import get_async_db_session
+from app.config.settings import settings
+
+# Process-wide stateless services, built once instead of on every request
+# (JWTTokenService derives its master key in __init__).
+# The blacklist's revocation cache is synced from the app lifespan.
+token_blacklist: TokenBlacklistPort = (
+    CachedTokenBlacklist(TokenBlacklistImpl())
+    if settings.JWT_REVOCATION_CACHE_ENABLED
+    else TokenBlacklistImpl()
+)
+jwt_service = JWTTokenService(blacklist=token_blacklist)
+session_repository = SessionRepositoryImpl()
+session_usecase = SessionUseCase(session_repository)
+csrf_usecase = CSRFUseCase()
+account_cache = AccountCache(
+    local_ttl_seconds=settings.ACCOUNT_CACHE_LOCAL_TTL_SECONDS,
+    redis_ttl_seconds=settings.ACCOUNT_CACHE_REDIS_TTL_SECONDS,
+)
+
+
+@dataclass(frozen=True)
+class AuthContext:
+    """Authentication result for one request.
+
+    Resolved once per request by get_auth_context: a valid JWT wins and the
+    session store is only consulted when there is none.
+    """
 
+    account_id: Optional[int] = None
+    jwt_payload: Optional[TokenPayload] = None
+    session: Optional[Session] = None
 
-def get_db() -> Generator[DBSession, None, None]:
-    """Get database session dependency."""
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+    @property
+    def is_authenticated(self) -> bool:
+        return self.account_id is not None
 
 
 def get_session_repository() -> SessionRepositoryImpl:
     """Get session repository dependency."""
-    return SessionRepositoryImpl()
+    return session_repository
 
 
 def get_account_repository(
-    db: DBSession = Depends(get_db),
-) -> AccountRepositoryImpl:
-    """Get account repository dependency."""
-    return AccountRepositoryImpl(db)
+    db: AsyncSession = Depends(get_async_db_session),
+) -> AccountReaderPort:
+    """Get read-only account repository dependency (read-through cached by id)."""
+    repository = AccountRepositoryImpl(db)
+    if not settings.ACCOUNT_CACHE_ENABLED:
+        return repository
+    return CachedAccountRepository(repository, account_cache)
+
+
+def get_account_unit_of_work(
+    db: AsyncSession = Depends(get_async_db_session),
+) -> AccountUnitOfWorkPort:
+    """Get account unit of work dependency (shares the request's session)."""
+    return AccountUnitOfWorkImpl(db, account_cache if settings.ACCOUNT_CACHE_ENABLED else None)
 
 
 def get_csrf_usecase() -> CSRFUseCase:
     """Get CSRF usecase dependency."""
-    return CSRFUseCase()
+    return csrf_usecase
 
 
-def get_session_usecase(
-    session_repo: SessionRepositoryImpl = Depends(get_session_repository),
-) -> SessionUseCase:
+def get_session_usecase() -> SessionUseCase:
     """Get session usecase dependency."""
-    return SessionUseCase(session_repo)
+    return session_usecase
 
 
 def get_account_usecase(
-    account_repo: AccountRepositoryImpl = Depends(get_account_repository),
+    account_repo: AccountReaderPort = Depends(get_account_repository),
+    unit_of_work: AccountUnitOfWorkPort = Depends(get_account_unit_of_work),
 ) -> AccountUseCase:
     """Get account usecase dependency."""
-    return AccountUseCase(account_repo)
+    return AccountUseCase(account_repo, unit_of_work)
 
 
-def get_token_blacklist() -> TokenBlacklistImpl:
+def get_token_blacklist() -> TokenBlacklistPort:
     """Get token blacklist dependency."""
-    return TokenBlacklistImpl()
+    return token_blacklist
 
 
-def get_jwt_service(
-    blacklist: TokenBlacklistImpl = Depends(get_token_blacklist),
-) -> JWTTokenService:
+def get_jwt_service() -> JWTTokenService:
     """Get JWT token service dependency with blacklist support."""
-    return JWTTokenService(blacklist=blacklist)
+    return jwt_service
 
 
 def get_auth_usecase(
@@ -80,7 +121,19 @@ def get_auth_usecase(
     return AuthUseCase(session_usecase, csrf_usecase, account_usecase, jwt_service)
 
 
-def get_current_session(
+def get_access_token(request: Request) -> Optional[str]:
+    """Get the JWT from the access_token cookie, then the Authorization header."""
+    token = request.cookies.get("access_token")
+
+    if not token:
+        auth_header = request.headers.get("Authorization")
+        if auth_header and auth_header.startswith("Bearer "):
+            token = auth_header[7:]
+
+    return token
+
+
+async def get_current_session(
     request: Request,
     session_usecase: SessionUseCase = Depends(get_session_usecase),
 ) -> Session:
@@ -99,7 +152,7 @@ def get_current_session(
             detail="Not authenticated",
         )
 
-    session = session_usecase.validate_session(session_id)
+    session = await session_usecase.validate_session(session_id)
 
     if not session:
         raise HTTPException(
@@ -110,7 +163,7 @@ def get_current_session(
     return session
 
 
-def get_optional_session(
+async def get_optional_session(
     request: Request,
     session_usecase: SessionUseCase = Depends(get_session_usecase),
 ) -> Session | None:
@@ -123,10 +176,10 @@ def get_optional_session(
     if not session_id:
         return None
 
-    return session_usecase.validate_session(session_id)
+    return await session_usecase.validate_session(session_id)
 
 
-def get_current_jwt_payload(
+async def get_current_jwt_payload(
     request: Request,
     jwt_service: JWTTokenService = Depends(get_jwt_service),
 ) -> TokenPayload:
@@ -137,13 +190,7 @@ def get_current_jwt_payload(
     Raises:
         HTTPException: 401 if not authenticated or token invalid.
     """
-    # Try to get token from cookie first, then from Authorization header
-    token = request.cookies.get("access_token")
-
-    if not token:
-        auth_header = request.headers.get("Authorization")
-        if auth_header and auth_header.startswith("Bearer "):
-            token = auth_header[7:]
+    token = get_access_token(request)
 
     if not token:
         raise HTTPException(
@@ -151,7 +198,7 @@ def get_current_jwt_payload(
             detail="Not authenticated",
         )
 
-    payload = jwt_service.validate_token(token)
+    payload = await jwt_service.validate_token(token)
 
     if not payload:
         raise HTTPException(
@@ -162,7 +209,7 @@ def get_current_jwt_payload(
     return payload
 
 
-def get_optional_jwt_payload(
+async def get_optional_jwt_payload(
     request: Request,
     jwt_service: JWTTokenService = Depends(get_jwt_service),
 ) -> Optional[TokenPayload]:
@@ -170,17 +217,43 @@ def get_optional_jwt_payload(
 
     Unlike get_current_jwt_payload, this doesn't raise an error if not authenticated.
     """
-    token = request.cookies.get("access_token")
-
-    if not token:
-        auth_header = request.headers.get("Authorization")
-        if auth_header and auth_header.startswith("Bearer "):
-            token = auth_header[7:]
+    token = get_access_token(request)
 
     if not token:
         return None
 
-    return jwt_service.validate_token(token)
+    return await jwt_service.validate_token(token)
+
+
+async def get_auth_context(
+    request: Request,
+    jwt_service: JWTTokenService = Depends(get_jwt_service),
+    session_usecase: SessionUseCase = Depends(get_session_usecase),
+) -> AuthContext:
+    """Resolve who is calling, once per request.
+
+    A valid JWT is used as-is and the session lookup is skipped. Only
+    requests without one fall back to the legacy session cookie. The
+    result is kept on request.state so later callers reuse it.
+    """
+    cached = getattr(request.state, "auth_context", None)
+    if cached is not None:
+        return cached
+
+    context = AuthContext()
+    token = get_access_token(request)
+    payload = await jwt_service.validate_token(token) if token else None
+
+    if payload:
+        context = AuthContext(account_id=payload.account_id, jwt_payload=payload)
+    else:
+        session_id = request.cookies.get("session_id")
+        session = await session_usecase.validate_session(session_id) if session_id else None
+        if session:
+            context = AuthContext(account_id=session.account_id, session=session)
+
+    request.state.auth_context = context
+    return context
 
 
 def verify_csrf(
@@ -204,7 +277,7 @@ def verify_csrf(
     return True
 
 
-def verify_jwt_csrf(
+async def verify_jwt_csrf(
     request: Request,
     jwt_service: JWTTokenService = Depends(get_jwt_service),
 ) -> bool:
@@ -215,12 +288,7 @@ def verify_jwt_csrf(
     Raises:
         HTTPException: 403 if CSRF validation fails.
     """
-    # Get token
-    token = request.cookies.get("access_token")
-    if not token:
-        auth_header = request.headers.get("Authorization")
-        if auth_header and auth_header.startswith("Bearer "):
-            token = auth_header[7:]
+    token = get_access_token(request)
 
     if not token:
         raise HTTPException(
@@ -238,7 +306,7 @@ def verify_jwt_csrf(
         )
 
     # Validate CSRF token against JWT
-    if not jwt_service.validate_csrf(token, header_csrf):
+    if not await jwt_service.validate_csrf(token, header_csrf):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="CSRF token validation failed",
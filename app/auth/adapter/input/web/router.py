@@ -4,7 +4,10 @@ from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from fastapi.responses import RedirectResponse
 
 from app.auth.adapter.input.web.dependencies import (
+    AuthContext,
+    get_access_token,
     get_account_usecase,
+    get_auth_context,
     get_auth_usecase,
     get_current_session,
     get_current_jwt_payload,
@@ -38,8 +41,7 @@ async def get_providers(
 
 @router.get("/status", response_model=AuthStatusResponse)
 async def get_auth_status(
-    jwt_payload: TokenPayload | None = Depends(get_optional_jwt_payload),
-    session: Session | None = Depends(get_optional_session),
+    auth: AuthContext = Depends(get_auth_context),
     account_usecase: AccountUseCase = Depends(get_account_usecase),
 ) -> AuthStatusResponse:
     """Check authentication status.
@@ -47,18 +49,11 @@ async def get_auth_status(
     Returns authentication status and user info if authenticated.
     Supports both JWT and session-based authentication.
     """
-    # Try JWT first, then fall back to session
-    account_id = None
-
-    if jwt_payload:
-        account_id = jwt_payload.account_id
-    elif session:
-        account_id = session.account_id
-
-    if not account_id:
+    # JWT first; the session is only looked up when there is no valid JWT
+    if not auth.is_authenticated:
         return AuthStatusResponse(is_authenticated=False)
 
-    account = account_usecase.get_account_by_id(account_id)
+    account = await account_usecase.get_account_by_id(auth.account_id)
 
     if not account:
         return AuthStatusResponse(is_authenticated=False)
@@ -75,7 +70,7 @@ async def get_current_user(
     auth_usecase: AuthUseCase = Depends(get_auth_usecase),
 ) -> UserResponse:
     """Get current authenticated user (JWT-based)."""
-    account = auth_usecase.get_account_by_id(jwt_payload.account_id)
+    account = await auth_usecase.get_account_by_id(jwt_payload.account_id)
 
     if not account:
         raise HTTPException(
@@ -92,7 +87,7 @@ async def get_current_user_session(
     account_usecase: AccountUseCase = Depends(get_account_usecase),
 ) -> UserResponse:
     """Get current authenticated user (session-based, legacy)."""
-    account = account_usecase.get_account_by_id(session.account_id)
+    account = await account_usecase.get_account_by_id(session.account_id)
 
     if not account:
         raise HTTPException(
@@ -119,11 +114,11 @@ async def logout(
     # Blacklist JWT token if exists
     token = request.cookies.get("access_token")
     if token:
-        auth_usecase.blacklist_jwt(token)
+        await auth_usecase.blacklist_jwt(token)
 
     # Destroy session if exists
     if session:
-        auth_usecase.logout(session.session_id)
+        await auth_usecase.logout(session.session_id)
 
     # Clear all auth cookies
     response.delete_cookie("access_token")
@@ -321,11 +316,7 @@ async def refresh_token(
     Returns a new token pair if the current token is still valid.
     """
     # Get current token from cookie or header
-    token = request.cookies.get("access_token")
-    if not token:
-        auth_header = request.headers.get("Authorization")
-        if auth_header and auth_header.startswith("Bearer "):
-            token = auth_header[7:]
+    token = get_access_token(request)
 
     if not token:
         raise HTTPException(
@@ -334,7 +325,7 @@ async def refresh_token(
         )
 
     # Refresh the token
-    new_token_pair = auth_usecase.refresh_jwt(token)
+    new_token_pair = await auth_usecase.refresh_jwt(token)
 
     if not new_token_pair:
         raise HTTPException(
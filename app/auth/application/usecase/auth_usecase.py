@@ -51,9 +51,8 @@ class AuthUseCase:
         Raises:
             UnsupportedOAuthProviderException: If provider is not supported.
         """
-        # Validate provider using SSOLoginType enum
-        sso_type = SSOLoginType.from_string(provider_name)
-        provider = OAuthProviderFactory.get_provider(sso_type.value)
+        # Validate provider against the registry (built-ins + register_provider)
+        provider = OAuthProviderFactory.get_provider(provider_name)
         state = secrets.token_urlsafe(32)
         url = provider.get_authorization_url(state)
         return url, state
@@ -84,7 +83,7 @@ class AuthUseCase:
         user_info = await provider.get_user_info(access_token)
 
         # Get or create account
-        account = self._account_usecase.get_or_create_account(
+        account = await self._account_usecase.get_or_create_account(
             email=user_info.email,
             nickname=user_info.name,
         )
@@ -93,7 +92,7 @@ class AuthUseCase:
         csrf_token = self._csrf_usecase.generate_token()
 
         # Create session with CSRF token
-        session = self._session_usecase.create_session(
+        session = await self._session_usecase.create_session(
             account_id=account.id,
             csrf_token=csrf_token,
         )
@@ -123,9 +122,8 @@ class AuthUseCase:
         if self._jwt_service is None:
             raise ValueError("JWT service is not configured")
 
-        # Validate provider using SSOLoginType enum
-        sso_type = SSOLoginType.from_string(provider_name)
-        provider = OAuthProviderFactory.get_provider(sso_type.value)
+        # Validate provider against the registry (built-ins + register_provider)
+        provider = OAuthProviderFactory.get_provider(provider_name)
 
         # Exchange code for access token
         access_token = await provider.exchange_code_for_token(code)
@@ -134,7 +132,7 @@ class AuthUseCase:
         user_info = await provider.get_user_info(access_token)
 
         # Get or create account
-        account = self._account_usecase.get_or_create_account(
+        account = await self._account_usecase.get_or_create_account(
             email=user_info.email,
             nickname=user_info.name,
         )
@@ -142,12 +140,12 @@ class AuthUseCase:
         # Create JWT token pair
         token_pair = self._jwt_service.create_token(
             account_id=account.id,
-            provider=sso_type.value,
+            provider=provider.provider_name,
         )
 
         return token_pair
 
-    def validate_jwt(self, token: str) -> Optional[TokenPayload]:
+    async def validate_jwt(self, token: str) -> Optional[TokenPayload]:
         """Validate a JWT token.
 
         Args:
@@ -158,9 +156,9 @@ class AuthUseCase:
         """
         if self._jwt_service is None:
             return None
-        return self._jwt_service.validate_token(token)
+        return await self._jwt_service.validate_token(token)
 
-    def validate_jwt_csrf(self, token: str, csrf_token: str) -> bool:
+    async def validate_jwt_csrf(self, token: str, csrf_token: str) -> bool:
         """Validate JWT CSRF token.
 
         Args:
@@ -172,9 +170,9 @@ class AuthUseCase:
         """
         if self._jwt_service is None:
             return False
-        return self._jwt_service.validate_csrf(token, csrf_token)
+        return await self._jwt_service.validate_csrf(token, csrf_token)
 
-    def refresh_jwt(self, token: str) -> Optional[TokenPair]:
+    async def refresh_jwt(self, token: str) -> Optional[TokenPair]:
         """Refresh a JWT token.
 
         Args:
@@ -185,17 +183,17 @@ class AuthUseCase:
         """
         if self._jwt_service is None:
             return None
-        return self._jwt_service.refresh_token(token)
+        return await self._jwt_service.refresh_token(token)
 
-    def logout(self, session_id: str) -> None:
+    async def logout(self, session_id: str) -> None:
         """Logout by destroying session.
 
         Args:
             session_id: The session ID to destroy.
         """
-        self._session_usecase.destroy_session(session_id)
+        await self._session_usecase.destroy_session(session_id)
 
-    def blacklist_jwt(self, token: str) -> bool:
+    async def blacklist_jwt(self, token: str) -> bool:
         """Blacklist a JWT token to prevent reuse.
 
         Args:
@@ -206,9 +204,9 @@ class AuthUseCase:
         """
         if self._jwt_service is None:
             return False
-        return self._jwt_service.blacklist_token(token)
+        return await self._jwt_service.blacklist_token(token)
 
-    def validate_session(self, session_id: str) -> Session | None:
+    async def validate_session(self, session_id: str) -> Session | None:
         """Validate a session.
 
         Args:
@@ -217,7 +215,7 @@ class AuthUseCase:
         Returns:
             The session if valid, None otherwise.
         """
-        return self._session_usecase.validate_session(session_id)
+        return await self._session_usecase.validate_session(session_id)
 
     def get_supported_providers(self) -> list[str]:
         """Get list of supported OAuth providers.
@@ -227,7 +225,7 @@ class AuthUseCase:
         """
         return SSOLoginType.get_supported_providers()
 
-    def get_account_by_id(self, account_id: int):
+    async def get_account_by_id(self, account_id: int):
         """Get account by ID.
 
         Args:
@@ -236,4 +234,4 @@ class AuthUseCase:
         Returns:
             The account if found.
         """
-        return self._account_usecase.get_account_by_id(account_id)
+        return await self._account_usecase.get_account_by_id(account_id)
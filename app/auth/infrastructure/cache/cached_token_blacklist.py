@@ -0,0 +1,164 @@
+"""In-process revocation cache in front of the Redis token blacklist."""
+
+import asyncio
+import json
+import logging
+import time
+from typing import Optional
+
+from app.auth.application.port.token_blacklist_port import TokenBlacklistPort
+from app.auth.infrastructure.cache.token_blacklist_impl import TokenBlacklistImpl
+
+logger = logging.getLogger(__name__)
+
+
+class CachedTokenBlacklist(TokenBlacklistPort):
+    """Two-tier TokenBlacklistPort: local revoked-jti set backed by Redis.
+
+    The worker keeps every currently revoked jti in memory (jti -> expiry).
+    The set is loaded with a SCAN of the Redis blacklist on start and kept
+    current through the blacklist pub/sub channel. Once it is in sync,
+    is_blacklisted is answered locally, so the common not-revoked path
+    needs no network hop.
+
+    Until the first sync completes, or while the subscription is down,
+    lookups fall back to Redis EXISTS. The cache is then rebuilt from a
+    fresh SCAN after reconnecting, so missed events cannot leave a revoked
+    token accepted.
+
+    Revocations made by this worker apply locally at once. Other workers
+    see them after pub/sub delivery, which is normally a few milliseconds.
+    """
+
+    # Poll interval for pub/sub reads; must stay below REDIS_SOCKET_TIMEOUT
+    LISTEN_TIMEOUT_SECONDS = 10.0
+    RECONNECT_BACKOFF_SECONDS = (0.5, 1.0, 2.0, 5.0)
+    # Expired entries are pruned once the set grows past this many entries
+    PRUNE_THRESHOLD = 10_000
+
+    def __init__(self, backend: TokenBlacklistImpl):
+        """Initialize with the Redis blacklist.
+
+        Args:
+            backend: The Redis blacklist used for writes, bootstrap and fallback.
+        """
+        self._backend = backend
+        self._revoked: dict[str, float] = {}
+        self._ready = False
+        self._listener: Optional[asyncio.Task] = None
+        self._prune_at = self.PRUNE_THRESHOLD
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether lookups are currently served from the local set."""
+        return self._ready
+
+    async def start(self) -> None:
+        """Start syncing from Redis in the background."""
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen(), name="token-blacklist-sync")
+
+    async def stop(self) -> None:
+        """Stop syncing and fall back to Redis lookups."""
+        self._ready = False
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+
+    async def add_to_blacklist(self, jti: str, ttl_seconds: int) -> None:
+        """Add a token ID to the blacklist (Redis first, then locally).
+
+        Args:
+            jti: The JWT ID (jti claim) to blacklist.
+            ttl_seconds: Time-to-live in seconds (should match token expiry).
+        """
+        await self._backend.add_to_blacklist(jti, ttl_seconds)
+        self._remember(jti, ttl_seconds)
+
+    async def is_blacklisted(self, jti: str) -> bool:
+        """Check if a token ID is blacklisted.
+
+        Args:
+            jti: The JWT ID (jti claim) to check.
+
+        Returns:
+            True if the token is blacklisted, False otherwise.
+        """
+        if not self._ready:
+            return await self._backend.is_blacklisted(jti)
+
+        expires_at = self._revoked.get(jti)
+        if expires_at is None:
+            return False
+        if expires_at <= time.monotonic():
+            self._revoked.pop(jti, None)
+            return False
+        return True
+
+    async def remove_from_blacklist(self, jti: str) -> None:
+        """Remove a token ID from the blacklist.
+
+        Args:
+            jti: The JWT ID (jti claim) to remove.
+        """
+        await self._backend.remove_from_blacklist(jti)
+        self._revoked.pop(jti, None)
+
+    def _remember(self, jti: str, ttl_seconds: float) -> None:
+        self._revoked[jti] = time.monotonic() + ttl_seconds
+        if len(self._revoked) >= self._prune_at:
+            now = time.monotonic()
+            self._revoked = {k: v for k, v in self._revoked.items() if v > now}
+            self._prune_at = max(self.PRUNE_THRESHOLD, len(self._revoked) * 2)
+
+    def _apply(self, data: str) -> None:
+        """Apply one pub/sub event to the local set."""
+        try:
+            event = json.loads(data)
+            if event["op"] == "add":
+                self._remember(event["jti"], event["ttl"])
+            elif event["op"] == "remove":
+                self._revoked.pop(event["jti"], None)
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Ignoring malformed blacklist event: %r", data)
+
+    async def _sync(self) -> None:
+        """Subscribe, rebuild the local set from Redis, then apply events."""
+        pubsub = await self._backend.subscribe()
+        try:
+            # Subscribe before scanning so revocations made during the scan are not lost
+            revoked = {}
+            now = time.monotonic()
+            async for jti, ttl_seconds in self._backend.scan_entries():
+                revoked[jti] = now + ttl_seconds
+            self._revoked = revoked
+            self._prune_at = max(self.PRUNE_THRESHOLD, len(revoked) * 2)
+            self._ready = True
+            logger.info("Token blacklist cache in sync (%d revoked tokens)", len(revoked))
+
+            while True:
+                message = await pubsub.get_message(timeout=self.LISTEN_TIMEOUT_SECONDS)
+                if message is not None and message["type"] == "message":
+                    self._apply(message["data"])
+        finally:
+            self._ready = False
+            await pubsub.aclose()
+
+    async def _listen(self) -> None:
+        failures = 0
+        while True:
+            started = time.monotonic()
+            try:
+                await self._sync()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Token blacklist cache lost sync, using Redis lookups", exc_info=True)
+
+            # Reset the backoff after a connection that stayed up for a while
+            if time.monotonic() - started > 60:
+                failures = 0
+            backoff = self.RECONNECT_BACKOFF_SECONDS
+            await asyncio.sleep(backoff[min(failures, len(backoff) - 1)])
+            failures += 1
@@ -1,11 +1,13 @@
 """Token Blacklist Repository implementation using Redis."""
 
-from typing import Optional
+import json
+from typing import AsyncIterator, Optional
 
-import redis
+import redis.asyncio as aioredis
+from redis.asyncio.client import PubSub
 
 from app.auth.application.port.token_blacklist_port import TokenBlacklistPort
-from app.config.redis_config import get_redis
+from app.config.redis_config import get_async_redis
 
 
 class TokenBlacklistImpl(TokenBlacklistPort):
@@ -17,23 +19,28 @@ class TokenBlacklistImpl(TokenBlacklistPort):
 
     The TTL should match the token's remaining validity period,
     so entries auto-expire when the token would have expired anyway.
+
+    Every change is also published on CHANNEL so that in-process
+    revocation caches in other workers can update without polling.
     """
 
     KEY_PREFIX = "blacklist:"
+    CHANNEL = "blacklist-events"
+    SCAN_COUNT = 1000
 
-    def __init__(self, redis_client: Optional[redis.Redis] = None):
+    def __init__(self, redis_client: Optional[aioredis.Redis] = None):
         """Initialize with Redis client.
 
         Args:
-            redis_client: Redis client instance. Uses default if not provided.
+            redis_client: Async Redis client. Uses the shared pool if not provided.
         """
-        self._redis = redis_client or get_redis()
+        self._redis = redis_client or get_async_redis()
 
     def _make_key(self, jti: str) -> str:
         """Create Redis key for blacklisted token."""
         return f"{self.KEY_PREFIX}{jti}"
 
-    def add_to_blacklist(self, jti: str, ttl_seconds: int) -> None:
+    async def add_to_blacklist(self, jti: str, ttl_seconds: int) -> None:
         """Add a token ID to the blacklist.
 
         Args:
@@ -41,9 +48,13 @@ class TokenBlacklistImpl(TokenBlacklistPort):
             ttl_seconds: Time-to-live in seconds (should match token expiry).
         """
         key = self._make_key(jti)
-        self._redis.setex(key, ttl_seconds, "1")
+        event = json.dumps({"op": "add", "jti": jti, "ttl": ttl_seconds})
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.setex(key, ttl_seconds, "1")
+            pipe.publish(self.CHANNEL, event)
+            await pipe.execute()
 
-    def is_blacklisted(self, jti: str) -> bool:
+    async def is_blacklisted(self, jti: str) -> bool:
         """Check if a token ID is blacklisted.
 
         Args:
@@ -53,13 +64,59 @@ class TokenBlacklistImpl(TokenBlacklistPort):
             True if the token is blacklisted, False otherwise.
         """
         key = self._make_key(jti)
-        return self._redis.exists(key) > 0
+        return await self._redis.exists(key) > 0
 
-    def remove_from_blacklist(self, jti: str) -> None:
+    async def remove_from_blacklist(self, jti: str) -> None:
         """Remove a token ID from the blacklist.
 
         Args:
             jti: The JWT ID (jti claim) to remove.
         """
         key = self._make_key(jti)
-        self._redis.delete(key)
+        event = json.dumps({"op": "remove", "jti": jti})
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.delete(key)
+            pipe.publish(self.CHANNEL, event)
+            await pipe.execute()
+
+    async def subscribe(self) -> PubSub:
+        """Open a pub/sub connection subscribed to blacklist change events.
+
+        Returns:
+            A subscribed PubSub. The caller owns it and must close it.
+        """
+        pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(self.CHANNEL)
+        return pubsub
+
+    async def scan_entries(self) -> AsyncIterator[tuple[str, float]]:
+        """Iterate over every blacklisted token with its remaining TTL.
+
+        Yields:
+            (jti, remaining TTL in seconds) pairs. Entries that expire
+            during the scan are skipped.
+        """
+        keys: list[str] = []
+        async for key in self._redis.scan_iter(match=f"{self.KEY_PREFIX}*", count=self.SCAN_COUNT):
+            keys.append(key)
+            if len(keys) >= self.SCAN_COUNT:
+                async for entry in self._with_ttl(keys):
+                    yield entry
+                keys = []
+        if keys:
+            async for entry in self._with_ttl(keys):
+                yield entry
+
+    async def _with_ttl(self, keys: list[str]) -> AsyncIterator[tuple[str, float]]:
+        """Fetch the remaining TTL of a batch of keys in one round-trip."""
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.pttl(key)
+            ttls = await pipe.execute()
+
+        for key, ttl_ms in zip(keys, ttls):
+            # -2: already expired, -1: no TTL (should not happen, keep it anyway)
+            if ttl_ms == -2:
+                continue
+            ttl_seconds = ttl_ms / 1000 if ttl_ms > 0 else float("inf")
+            yield key[len(self.KEY_PREFIX):], ttl_seconds
@@ -7,6 +7,7 @@ from urllib.parse import urlencode
 import httpx
 
 from app.auth.application.port.oauth_provider_port import OAuthProviderPort, OAuthUserInfo
+from app.auth.infrastructure.oauth.http_client import OAuthHttpClient, oauth_http_client
 from app.common.domain.exceptions import OAuthException
 
 
@@ -15,6 +16,9 @@ class BaseOAuthProvider(OAuthProviderPort):
 
     Provides common functionality for OAuth 2.0 authorization code flow.
     Subclasses must implement provider-specific details.
+
+    Requests go through the shared OAuthHttpClient, so connections to the
+    provider are reused across logins.
     """
 
     # Override these in subclasses
@@ -28,6 +32,7 @@ class BaseOAuthProvider(OAuthProviderPort):
         client_id: str,
         client_secret: str,
         redirect_uri: str,
+        http_client: Optional[OAuthHttpClient] = None,
     ):
         """Initialize OAuth provider.
 
@@ -35,10 +40,12 @@ class BaseOAuthProvider(OAuthProviderPort):
             client_id: OAuth client ID.
             client_secret: OAuth client secret.
             redirect_uri: Callback URL after authorization.
+            http_client: HTTP client pool. Uses the shared pool if not provided.
         """
         self.client_id = client_id
         self.client_secret = client_secret
         self.redirect_uri = redirect_uri
+        self._http = http_client or oauth_http_client
 
     def get_authorization_url(self, state: str) -> str:
         """Get the OAuth authorization URL."""
@@ -67,26 +74,26 @@ class BaseOAuthProvider(OAuthProviderPort):
             "grant_type": "authorization_code",
         }
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    self.TOKEN_URL,
-                    data=data,
-                    headers={"Accept": "application/json"},
-                )
-                response.raise_for_status()
-                token_data = response.json()
-                return token_data.get("access_token", "")
-            except httpx.HTTPStatusError as e:
-                raise OAuthException(
-                    self.provider_name,
-                    f"Token exchange failed: {e.response.status_code}",
-                )
-            except Exception as e:
-                raise OAuthException(
-                    self.provider_name,
-                    f"Token exchange failed: {str(e)}",
-                )
+        try:
+            response = await self._http.request(
+                "POST",
+                self.TOKEN_URL,
+                data=data,
+                headers={"Accept": "application/json"},
+            )
+            response.raise_for_status()
+            token_data = response.json()
+            return token_data.get("access_token", "")
+        except httpx.HTTPStatusError as e:
+            raise OAuthException(
+                self.provider_name,
+                f"Token exchange failed: {e.response.status_code}",
+            )
+        except Exception as e:
+            raise OAuthException(
+                self.provider_name,
+                f"Token exchange failed: {str(e)}",
+            )
 
     @abstractmethod
     async def get_user_info(self, access_token: str) -> OAuthUserInfo:
@@ -102,22 +109,22 @@ class BaseOAuthProvider(OAuthProviderPort):
         """Fetch user info from provider's userinfo endpoint."""
         url = url or self.USERINFO_URL
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    url,
-                    headers={"Authorization": f"Bearer {access_token}"},
-                    params=params,
-                )
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                raise OAuthException(
-                    self.provider_name,
-                    f"Failed to fetch user info: {e.response.status_code}",
-                )
-            except Exception as e:
-                raise OAuthException(
-                    self.provider_name,
-                    f"Failed to fetch user info: {str(e)}",
-                )
+        try:
+            response = await self._http.request(
+                "GET",
+                url,
+                headers={"Authorization": f"Bearer {access_token}"},
+                params=params,
+            )
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            raise OAuthException(
+                self.provider_name,
+                f"Failed to fetch user info: {e.response.status_code}",
+            )
+        except Exception as e:
+            raise OAuthException(
+                self.provider_name,
+                f"Failed to fetch user info: {str(e)}",
+            )
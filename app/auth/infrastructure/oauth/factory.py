@@ -8,11 +8,14 @@ from app.auth.infrastructure.oauth.google import GoogleOAuthProvider
 from app.auth.infrastructure.oauth.kakao import KakaoOAuthProvider
 from app.auth.infrastructure.oauth.naver import NaverOAuthProvider
 from app.auth.infrastructure.oauth.meta import MetaOAuthProvider
+from app.auth.infrastructure.oauth.mock import MockOAuthProvider
+from app.config.settings import settings
 
 class OAuthProviderFactory:
     """Factory for creating OAuth providers.
 
     Uses a registry pattern for easy addition of new providers.
+    Providers are stateless, so each is built once and reused.
     """
 
     # Provider registry: name -> provider class
@@ -22,6 +25,8 @@ class OAuthProviderFactory:
         "naver": NaverOAuthProvider,
         "meta": MetaOAuthProvider,
     }
+    # Provider instances: name -> provider (built on first use)
+    _instances: Dict[str, OAuthProviderPort] = {}
 
     @classmethod
     def get_provider(cls, provider_name: str) -> OAuthProviderPort:
@@ -31,18 +36,23 @@ class OAuthProviderFactory:
             provider_name: Name of the provider (e.g., "google", "kakao", "naver", "meta").
 
         Returns:
-            An instance of the OAuth provider.
+            The shared instance of the OAuth provider.
 
         Raises:
             UnsupportedOAuthProviderException: If provider is not supported.
         """
         provider_name = provider_name.lower()
+        provider = cls._instances.get(provider_name)
+        if provider is not None:
+            return provider
+
         provider_class = cls._providers.get(provider_name)
 
         if provider_class is None:
             raise UnsupportedOAuthProviderException(provider_name)
 
-        return provider_class()
+        provider = cls._instances[provider_name] = provider_class()
+        return provider
 
     @classmethod
     def register_provider(
@@ -57,6 +67,7 @@ class OAuthProviderFactory:
             provider_class: The provider class to register.
         """
         cls._providers[name.lower()] = provider_class
+        cls._instances.pop(name.lower(), None)
 
     @classmethod
     def get_supported_providers(cls) -> list[str]:
@@ -67,3 +78,8 @@ class OAuthProviderFactory:
     def is_supported(cls, provider_name: str) -> bool:
         """Check if a provider is supported."""
         return provider_name.lower() in cls._providers
+
+
+# Local mock identity provider for offline runs and login benchmarks
+if settings.OAUTH_MOCK_ENABLED and not settings.is_production:
+    OAuthProviderFactory.register_provider("mock", MockOAuthProvider)
@@ -0,0 +1,181 @@
+"""Shared HTTP client for OAuth provider calls."""
+
+import asyncio
+import logging
+import random
+from typing import Optional
+
+import httpx
+
+from app.config.settings import settings
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:  # HTTP/2 needs the optional h2 package; fall back to HTTP/1.1
+    HTTP2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class OAuthHttpClient:
+    """Pooled, reused HTTP client for OAuth token and userinfo requests.
+
+    Keeps one httpx.AsyncClient per provider origin (scheme, host, port),
+    so connection limits apply per host and a slow provider cannot use up
+    the connections of the others. Connections are kept alive between
+    logins, so a callback normally skips the TCP and TLS handshakes.
+    HTTP/2 is used when enabled and the h2 package is installed.
+
+    Failed requests are retried with full-jitter exponential backoff:
+    - Connection failures are retried for every request (nothing was sent).
+    - Read errors and 429/502/503/504 responses are retried only for
+      idempotent requests. A token exchange is not retried once sent,
+      because authorization codes are single-use.
+
+    Clients are created lazily; aclose() is called from the app lifespan.
+    """
+
+    RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+    BACKOFF_BASE_SECONDS = 0.1
+    BACKOFF_MAX_SECONDS = 2.0
+
+    def __init__(
+        self,
+        timeout_seconds: float = 10.0,
+        connect_timeout_seconds: float = 3.0,
+        max_connections: int = 50,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry_seconds: float = 15.0,
+        max_retries: int = 2,
+        http2: bool = True,
+    ):
+        """Initialize the client pool.
+
+        Args:
+            timeout_seconds: Read / write / pool timeout per request.
+            connect_timeout_seconds: Timeout for opening a connection.
+            max_connections: Connection limit per provider host.
+            max_keepalive_connections: Idle connections kept per provider host.
+            keepalive_expiry_seconds: How long an idle connection is kept.
+            max_retries: Retries after the first attempt (0 disables retries).
+            http2: Use HTTP/2 when the h2 package is installed.
+        """
+        self._timeout = httpx.Timeout(timeout_seconds, connect=connect_timeout_seconds)
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry_seconds,
+        )
+        self.max_retries = max_retries
+        self.http2 = http2 and HTTP2_AVAILABLE
+        if http2 and not HTTP2_AVAILABLE:
+            logger.info("h2 is not installed, OAuth requests use HTTP/1.1")
+        self._clients: dict[tuple[str, str, Optional[int]], httpx.AsyncClient] = {}
+        self._transports: dict[tuple[str, str, Optional[int]], httpx.AsyncBaseTransport] = {}
+
+    @classmethod
+    def from_settings(cls) -> "OAuthHttpClient":
+        """Create a client pool configured from application settings."""
+        return cls(
+            timeout_seconds=settings.OAUTH_HTTP_TIMEOUT_SECONDS,
+            connect_timeout_seconds=settings.OAUTH_HTTP_CONNECT_TIMEOUT_SECONDS,
+            max_connections=settings.OAUTH_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.OAUTH_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry_seconds=settings.OAUTH_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+            max_retries=settings.OAUTH_HTTP_MAX_RETRIES,
+            http2=settings.OAUTH_HTTP2,
+        )
+
+    @staticmethod
+    def _origin(url: str) -> tuple[str, str, Optional[int]]:
+        parsed = httpx.URL(url)
+        return parsed.scheme, parsed.host, parsed.port
+
+    def register_transport(self, base_url: str, transport: httpx.AsyncBaseTransport) -> None:
+        """Send requests for base_url's origin through a custom transport.
+
+        Used to serve a provider from an in-process ASGI app
+        (httpx.ASGITransport), e.g. the mock identity provider in benchmarks.
+
+        Args:
+            base_url: Any URL on the origin to route.
+            transport: Transport to use for that origin.
+        """
+        origin = self._origin(base_url)
+        self._transports[origin] = transport
+        self._clients.pop(origin, None)
+
+    def _client_for(self, url: str) -> httpx.AsyncClient:
+        """Get (or create) the client for the URL's origin."""
+        origin = self._origin(url)
+        client = self._clients.get(origin)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                timeout=self._timeout,
+                limits=self._limits,
+                http2=self.http2,
+                transport=self._transports.get(origin),
+            )
+            self._clients[origin] = client
+        return client
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        idempotent: Optional[bool] = None,
+        **kwargs,
+    ) -> httpx.Response:
+        """Send a request through the pooled client for the URL's host.
+
+        Args:
+            method: HTTP method.
+            url: Absolute URL.
+            idempotent: Whether the request may be retried after it was sent.
+                Defaults to True for GET / HEAD / OPTIONS.
+            **kwargs: Passed to httpx.AsyncClient.request (data, headers, params, ...).
+
+        Returns:
+            The last response (raise_for_status is up to the caller).
+
+        Raises:
+            httpx.HTTPError: If the request still fails after the retries.
+        """
+        if idempotent is None:
+            idempotent = method.upper() in ("GET", "HEAD", "OPTIONS")
+        client = self._client_for(url)
+
+        for attempt in range(self.max_retries + 1):
+            last_attempt = attempt == self.max_retries
+            try:
+                response = await client.request(method, url, **kwargs)
+            except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout):
+                if last_attempt:
+                    raise
+            except (httpx.ReadTimeout, httpx.ReadError, httpx.RemoteProtocolError):
+                if last_attempt or not idempotent:
+                    raise
+            else:
+                if last_attempt or not idempotent or response.status_code not in self.RETRY_STATUS_CODES:
+                    return response
+                await response.aclose()
+
+            logger.info("Retrying OAuth request %s %s (attempt %d)", method, url, attempt + 2)
+            await asyncio.sleep(self._backoff(attempt))
+
+    def _backoff(self, attempt: int) -> float:
+        """Full jitter: uniform in [0, min(max, base * 2^attempt)]."""
+        return random.uniform(0, min(self.BACKOFF_MAX_SECONDS, self.BACKOFF_BASE_SECONDS * 2 ** attempt))
+
+    async def aclose(self) -> None:
+        """Close every pooled connection."""
+        clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            await client.aclose()
+
+
+# Process-wide pool shared by all OAuth providers
+oauth_http_client = OAuthHttpClient.from_settings()
@@ -0,0 +1,50 @@
+"""Mock OAuth provider implementation (local runs and benchmarks)."""
+
+from app.auth.application.port.oauth_provider_port import OAuthUserInfo
+from app.auth.infrastructure.oauth.base import BaseOAuthProvider
+from app.config.settings import settings
+
+
+class MockOAuthProvider(BaseOAuthProvider):
+    """OAuth 2.0 provider backed by the local mock identity provider.
+
+    Talks to the stand-in in mock_idp.py, which speaks the same
+    authorization code flow as the real providers with configurable latency.
+    Never registered in production.
+
+    Register it with:
+        OAuthProviderFactory.register_provider("mock", MockOAuthProvider)
+    or set OAUTH_MOCK_ENABLED=true.
+    """
+
+    SCOPES = ["openid", "email", "profile"]
+    CLIENT_ID = "mock-client"
+    CLIENT_SECRET = "mock-secret"
+
+    def __init__(self):
+        """Initialize mock OAuth provider with settings."""
+        super().__init__(
+            client_id=self.CLIENT_ID,
+            client_secret=self.CLIENT_SECRET,
+            redirect_uri=settings.OAUTH_MOCK_REDIRECT_URI,
+        )
+        base_url = settings.OAUTH_MOCK_BASE_URL.rstrip("/")
+        self.AUTHORIZE_URL = f"{base_url}/authorize"
+        self.TOKEN_URL = f"{base_url}/token"
+        self.USERINFO_URL = f"{base_url}/userinfo"
+
+    @property
+    def provider_name(self) -> str:
+        """Get the provider name."""
+        return "mock"
+
+    async def get_user_info(self, access_token: str) -> OAuthUserInfo:
+        """Get user info from the mock identity provider (OpenID Connect style)."""
+        data = await self._fetch_user_info(access_token)
+
+        return OAuthUserInfo(
+            email=data.get("email", ""),
+            name=data.get("name", data.get("email", "").split("@")[0]),
+            picture=data.get("picture"),
+            provider=self.provider_name,
+        )
@@ -0,0 +1,145 @@
+"""Local mock OAuth identity provider (ASGI app).
+
+Stand-in for Google / Kakao / Naver / Meta so the login path can be run
+and measured offline. Implements the authorization code flow used by
+BaseOAuthProvider:
+
+- GET  /authorize  redirects back to redirect_uri with a code and the state.
+                   The user is taken from login_hint (an email), or a new
+                   random user is made up.
+- POST /token      exchanges the code for an access token.
+- GET  /userinfo   returns {"sub", "email", "name"} for a Bearer token.
+
+Codes and tokens carry the user themselves, so the stand-in keeps no
+state and several instances can serve the same flow. Codes are therefore
+not single-use.
+
+Usage:
+    # In-process (benchmarks)
+    oauth_http_client.register_transport(base_url, httpx.ASGITransport(app=create_mock_idp_app()))
+
+    # Standalone, for a server running with OAUTH_MOCK_ENABLED=true
+    python -m app.auth.infrastructure.oauth.mock_idp --port 8765 --latency-ms 50
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import random
+import secrets
+from typing import Optional
+from urllib.parse import parse_qs, urlencode
+
+from fastapi import FastAPI, Header, Request
+from fastapi.responses import JSONResponse, RedirectResponse
+
+from app.auth.infrastructure.oauth.mock import MockOAuthProvider
+
+
+def _encode(data: dict) -> str:
+    raw = json.dumps(data, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode(value: str) -> Optional[dict]:
+    try:
+        data = json.loads(base64.urlsafe_b64decode(value + "=" * (-len(value) % 4)))
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) and data.get("email") else None
+
+
+def create_mock_idp_app(
+    latency_ms: float = 0.0,
+    jitter_ms: float = 0.0,
+    failure_rate: float = 0.0,
+    seed: Optional[int] = None,
+) -> FastAPI:
+    """Create the mock identity provider.
+
+    Args:
+        latency_ms: Delay added to every response.
+        jitter_ms: Extra random delay, uniform in [0, jitter_ms].
+        failure_rate: Probability of answering /token or /userinfo with 503.
+        seed: Seed for jitter and failures, for reproducible runs.
+
+    Returns:
+        The ASGI app.
+    """
+    app = FastAPI(title="Mock OAuth IdP", docs_url=None, redoc_url=None, openapi_url=None)
+    rng = random.Random(seed)
+
+    async def delay() -> None:
+        seconds = (latency_ms + (rng.uniform(0, jitter_ms) if jitter_ms else 0.0)) / 1000
+        if seconds > 0:
+            await asyncio.sleep(seconds)
+
+    def injected_failure() -> Optional[JSONResponse]:
+        if failure_rate > 0 and rng.random() < failure_rate:
+            return JSONResponse({"error": "temporarily_unavailable"}, status_code=503)
+        return None
+
+    @app.get("/authorize")
+    async def authorize(redirect_uri: str, state: str, client_id: str, login_hint: Optional[str] = None):
+        await delay()
+        email = login_hint or f"user-{secrets.token_hex(6)}@example.com"
+        user = {"sub": email, "email": email, "name": email.split("@")[0]}
+        code = f"{_encode(user)}.{secrets.token_urlsafe(8)}"
+        separator = "&" if "?" in redirect_uri else "?"
+        return RedirectResponse(f"{redirect_uri}{separator}{urlencode({'code': code, 'state': state})}", 302)
+
+    @app.post("/token")
+    async def token(request: Request):
+        await delay()
+        failure = injected_failure()
+        if failure is not None:
+            return failure
+
+        # application/x-www-form-urlencoded (parsed here so python-multipart is not needed)
+        form = {k: v[0] for k, v in parse_qs((await request.body()).decode()).items()}
+        user = _decode(form.get("code", "").split(".", 1)[0])
+        if (
+            form.get("grant_type") != "authorization_code"
+            or form.get("client_id") != MockOAuthProvider.CLIENT_ID
+            or form.get("client_secret") != MockOAuthProvider.CLIENT_SECRET
+            or user is None
+        ):
+            return JSONResponse({"error": "invalid_grant"}, status_code=400)
+        return {"access_token": f"at.{_encode(user)}", "token_type": "Bearer", "expires_in": 3600}
+
+    @app.get("/userinfo")
+    async def userinfo(authorization: str = Header(default="")):
+        await delay()
+        failure = injected_failure()
+        if failure is not None:
+            return failure
+
+        scheme, _, access_token = authorization.partition(" ")
+        prefix, _, payload = access_token.partition(".")
+        user = _decode(payload) if scheme.lower() == "bearer" and prefix == "at" else None
+        if user is None:
+            return JSONResponse({"error": "invalid_token"}, status_code=401)
+        return user
+
+    return app
+
+
+def main() -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Run the mock OAuth identity provider.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    app = create_mock_idp_app(args.latency_ms, args.jitter_ms, args.failure_rate, args.seed)
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
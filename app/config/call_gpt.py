@@ -7,17 +7,11 @@ from dotenv import load_dotenv
 from openai import AsyncOpenAI
 from openai.types.chat import ChatCompletionMessageParam
 
-load_dotenv()
+from app.conversation.application.port.out.llm_chat_port import LlmChatPort, TokenUsage
 
-# 환경 변수 검증
-MAX_TOKENS_ENV = os.getenv("MAX_TOKENS")
-if not MAX_TOKENS_ENV:
-    raise ValueError("MAX_TOKENS environment variable is required")
+load_dotenv()
 
-try:
-    MAX_TOKENS = int(MAX_TOKENS_ENV)
-except ValueError as e:
-    raise ValueError(f"MAX_TOKENS must be a valid integer: {e}") from e
+DEFAULT_MODEL = "gpt-4.1"
 
 # OpenAI 클라이언트 초기화
 _async_client: Optional[AsyncOpenAI] = None
@@ -31,54 +25,123 @@ def get_async_client() -> AsyncOpenAI:
     return _async_client
 
 
-async def _create_chat_completion_stream(prompt: str) -> AsyncIterator[str]:
+def _resolve_max_tokens(max_tokens: Optional[int]) -> int:
+    """max_tokens 인자가 없으면 MAX_TOKENS 환경 변수를 검증해 사용합니다.
+
+    Raises:
+        ValueError: MAX_TOKENS 가 없거나 정수가 아닌 경우
+    """
+    if max_tokens is not None:
+        return max_tokens
+
+    max_tokens_env = os.getenv("MAX_TOKENS")
+    if not max_tokens_env:
+        raise ValueError("MAX_TOKENS environment variable is required")
+
+    try:
+        return int(max_tokens_env)
+    except ValueError as e:
+        raise ValueError(f"MAX_TOKENS must be a valid integer: {e}") from e
+
+
+async def _create_chat_completion_stream(
+    messages: list[dict],
+    model: str,
+    max_tokens: int,
+    usage: Optional[TokenUsage] = None,
+) -> AsyncIterator[str]:
     """비동기 방식으로 GPT API를 호출합니다.
     
     Args:
-        prompt: 사용자 프롬프트
+        messages: system / user / assistant 역할이 지정된 메시지 배열
+        model: 사용할 모델 이름
+        max_tokens: 응답 최대 토큰 수
+        usage: 주어지면 스트림 마지막 청크의 토큰 사용량을 채움
         
     Returns:
         GPT 응답 텍스트
         
     Raises:
-        ValueError: 프롬프트가 비어있는 경우
+        ValueError: 메시지가 비어있는 경우
         Exception: OpenAI API 호출 실패 시
     """
 
-    if not prompt or not prompt.strip():
-        raise ValueError("Prompt cannot be empty")
+    if not messages or not any((m.get("content") or "").strip() for m in messages):
+        raise ValueError("Messages cannot be empty")
 
     client = get_async_client()
-    
-    # 타입 안전성을 위해 딕셔너리를 명시적으로 구성
-    message: dict[str, str] = {"role": "user", "content": prompt}
-    messages: list[ChatCompletionMessageParam] = [
-        message  # type: ignore[list-item]
+
+    # 타입 안전성을 위해 role / content 만 담아 명시적으로 구성
+    chat_messages: list[ChatCompletionMessageParam] = [
+        {"role": m["role"], "content": m["content"]}  # type: ignore[misc]
+        for m in messages
     ]
 
     try:
         response = await client.chat.completions.create(
-            model="gpt-4.1",
-            messages=messages,
-            max_tokens=MAX_TOKENS,
+            model=model,
+            messages=chat_messages,
+            max_tokens=max_tokens,
             temperature=0,
-            stream=True
+            stream=True,
+            # 마지막 청크(choices 없음)에 입력 / 출력 토큰 수를 담아 보내도록 요청
+            stream_options={"include_usage": True},
         )
 
         async for chunk in response:
             if chunk.choices and chunk.choices[0].delta.content:
                 yield chunk.choices[0].delta.content
+            if chunk.usage is not None and usage is not None:
+                usage.prompt_tokens = chunk.usage.prompt_tokens
+                usage.completion_tokens = chunk.usage.completion_tokens
+                details = chunk.usage.prompt_tokens_details
+                usage.cached_prompt_tokens = (details.cached_tokens or 0) if details else 0
+                usage.model = chunk.model or model
+                usage.reported = True
 
     except Exception as e:
         raise Exception(f"Failed to call GPT API: {str(e)}") from e
 
 
-class CallGPT:
+class CallGPT(LlmChatPort):
     """OpenAI GPT API를 비동기로 호출하는 클래스."""
 
-    @staticmethod
-    async def call_gpt(prompt: str) -> AsyncIterator[str]:
-        """비동기 방식으로 GPT API를 호출합니다.
+    def __init__(self, model: Optional[str] = None, max_tokens: Optional[int] = None):
+        """
+        Args:
+            model: 사용할 모델 이름 (기본값: gpt-4.1)
+            max_tokens: 응답 최대 토큰 수 (없으면 MAX_TOKENS 환경 변수)
+
+        Raises:
+            ValueError: max_tokens 를 결정할 수 없는 경우
+        """
+        self.model = model or DEFAULT_MODEL
+        self.max_tokens = _resolve_max_tokens(max_tokens)
+
+    async def stream_chat(self, messages: list[dict], usage: Optional[TokenUsage] = None) -> AsyncIterator[str]:
+        """역할별 메시지 배열로 GPT API를 스트리밍 호출합니다.
+
+        고정된 system 지침을 항상 맨 앞에 두면 동일한 접두부에 대해
+        OpenAI 프롬프트 캐싱이 적용되어 입력 토큰 비용과 첫 토큰 지연이 줄어듭니다.
+
+        Args:
+            messages: [{"role": "system|user|assistant", "content": "..."}]
+            usage: 주어지면 OpenAI 가 보고한 토큰 사용량을 채움
+
+        Returns:
+            GPT 응답 텍스트 조각
+
+        Raises:
+            Exception: OpenAI API 호출 실패 시
+        """
+        try:
+            async for chunk in _create_chat_completion_stream(messages, self.model, self.max_tokens, usage):
+                yield chunk
+        except Exception as e:
+            raise Exception(f"CallGPT 중계 에러: {str(e)}")
+
+    async def call_gpt(self, prompt: str) -> AsyncIterator[str]:
+        """단일 문자열 프롬프트를 user 메시지 하나로 감싸 호출합니다.
         
         Args:
             prompt: 사용자 프롬프트
@@ -90,8 +153,8 @@ class CallGPT:
             ValueError: 프롬프트가 비어있는 경우
             Exception: OpenAI API 호출 실패 시
         """
-        try:
-            async for chunk in _create_chat_completion_stream(prompt):
-                yield chunk
-        except Exception as e:
-            raise Exception(f"CallGPT 중계 에러: {str(e)}")
+        if not prompt or not prompt.strip():
+            raise ValueError("Prompt cannot be empty")
+
+        async for chunk in self.stream_chat([{"role": "user", "content": prompt}]):
+            yield chunk
@@ -3,6 +3,7 @@ import urllib.parse
 
 from dotenv import load_dotenv
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 
 load_dotenv()
@@ -14,18 +15,48 @@ DATABASE_URL = (
     f"@{os.getenv('MYSQL_HOST')}:{os.getenv('MYSQL_PORT')}/{os.getenv('MYSQL_DATABASE')}"
 )
 
+# 비동기 드라이버(aiomysql) - 이벤트 루프를 막지 않는 대화 도메인 전용
+ASYNC_DATABASE_URL = (
+    f"mysql+aiomysql://{os.getenv('MYSQL_USER')}:{password}"
+    f"@{os.getenv('MYSQL_HOST')}:{os.getenv('MYSQL_PORT')}/{os.getenv('MYSQL_DATABASE')}"
+)
+
+# 커넥션 풀 설정 (대화 스트리밍은 LLM 응답을 기다리는 동안 커넥션을 잡지 않으므로
+# 동시 스트림 수가 아니라 동시에 진행 중인 짧은 트랜잭션 수에 맞춰 잡으면 된다)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+
 engine = create_engine(
     DATABASE_URL,
     echo=True,
     pool_pre_ping=True,
-    pool_size = 10,
-    max_overflow = 20,
-    pool_timeout = 30,
-    pool_recycle = 1800,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_recycle=DB_POOL_RECYCLE,
+)
+
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    pool_pre_ping=True,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_recycle=DB_POOL_RECYCLE,
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# commit 후에도 ORM 속성을 다시 조회하지 않도록 expire_on_commit=False
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 Base = declarative_base()
 
 def get_db_session():
@@ -35,3 +66,9 @@ def get_db_session():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db_session():
+
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,6 +1,6 @@
 import os
 
-import redis
+import redis.asyncio as aioredis
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -9,18 +9,38 @@ REDIS_HOST = os.getenv("REDIS_HOST")
 REDIS_PORT = int(os.getenv("REDIS_PORT"))
 REDIS_DB = int(os.getenv("REDIS_DB"))
 REDIS_PASSWORD = os.getenv("REDIS_PASSWORD")
+# 커넥션 풀 (다 쓰면 예외 대신 REDIS_POOL_TIMEOUT 초까지 대기)
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "100"))
+REDIS_POOL_TIMEOUT = float(os.getenv("REDIS_POOL_TIMEOUT", "5"))
+# 명령 응답 대기 시간 - 재생 버퍼의 XREAD BLOCK(하트비트 주기)보다 길어야 함
+REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", "30"))
+REDIS_SOCKET_CONNECT_TIMEOUT = float(os.getenv("REDIS_SOCKET_CONNECT_TIMEOUT", "5"))
 
-# Redis 인스턴스 생성 (Singleton)
-_redis_instance = None
+# 비동기 Redis 인스턴스 (Singleton) - 세션 / 토큰 블랙리스트 / 스트리밍이 한 커넥션 풀을 공유
+_async_redis_instance = None
 
-def get_redis() -> redis.Redis:
-    global _redis_instance
-    if _redis_instance is None:
-        _redis_instance = redis.Redis(
-            host=REDIS_HOST,
-            port=REDIS_PORT,
-            db=REDIS_DB,
-            password=REDIS_PASSWORD,
-            decode_responses=True
+def get_async_redis() -> aioredis.Redis:
+    global _async_redis_instance
+    if _async_redis_instance is None:
+        _async_redis_instance = aioredis.Redis(
+            connection_pool=aioredis.BlockingConnectionPool(
+                host=REDIS_HOST,
+                port=REDIS_PORT,
+                db=REDIS_DB,
+                password=REDIS_PASSWORD,
+                decode_responses=True,
+                max_connections=REDIS_MAX_CONNECTIONS,
+                timeout=REDIS_POOL_TIMEOUT,
+                socket_timeout=REDIS_SOCKET_TIMEOUT,
+                socket_connect_timeout=REDIS_SOCKET_CONNECT_TIMEOUT,
+            )
         )
-    return _redis_instance
+    return _async_redis_instance
+
+
+async def close_async_redis() -> None:
+    """종료 시 커넥션 풀 정리"""
+    global _async_redis_instance
+    if _async_redis_instance is not None:
+        await _async_redis_instance.aclose()
+        _async_redis_instance = None
@@ -44,6 +44,20 @@ class Settings(BaseSettings):
     META_CLIENT_SECRET: str = ""
     META_REDIRECT_URI: str = ""
 
+    # OAuth provider HTTP client (one pooled client per provider host)
+    OAUTH_HTTP2: bool = True  # Needs the h2 package; falls back to HTTP/1.1 without it
+    OAUTH_HTTP_TIMEOUT_SECONDS: float = 10.0
+    OAUTH_HTTP_CONNECT_TIMEOUT_SECONDS: float = 3.0
+    OAUTH_HTTP_MAX_CONNECTIONS: int = 50  # Per provider host
+    OAUTH_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 10  # Per provider host
+    OAUTH_HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 15.0
+    OAUTH_HTTP_MAX_RETRIES: int = 2  # Token exchange is only retried when the request was never sent
+
+    # Mock OAuth provider (local runs / benchmarks; ignored in production)
+    OAUTH_MOCK_ENABLED: bool = False
+    OAUTH_MOCK_BASE_URL: str = "http://localhost:8765"  # python -m app.auth.infrastructure.oauth.mock_idp
+    OAUTH_MOCK_REDIRECT_URI: str = "http://localhost:33333/api/v1/auth/mock/callback"
+
     # Security
     CSRF_SECRET_KEY: str
     COOKIE_SECURE: bool = False  # Set True in production (HTTPS)
@@ -54,6 +68,12 @@ class Settings(BaseSettings):
     JWT_ENCRYPTION_KEY: str = ""  # Key for AES encryption of user-specific keys
     JWT_EXPIRY_HOURS: int = 12  # Token validity period in hours
     JWT_HTTPONLY: bool = True  # HttpOnly flag for JWT cookie
+    JWT_REVOCATION_CACHE_ENABLED: bool = True  # Answer blacklist checks from an in-process copy
+
+    # Account profile cache (read-through by account id, invalidated on save)
+    ACCOUNT_CACHE_ENABLED: bool = True
+    ACCOUNT_CACHE_LOCAL_TTL_SECONDS: float = 5.0  # Per-worker tier; bounds cross-worker staleness
+    ACCOUNT_CACHE_REDIS_TTL_SECONDS: int = 60
 
     # Environment
     ENVIRONMENT: str = "local"  # local, staging, production
@@ -64,6 +84,45 @@ class Settings(BaseSettings):
     # Frontend URL for redirects after OAuth
     FRONTEND_URL: str
 
+    # LLM backend
+    LLM_BACKEND: str = "openai"  # openai | fake (로컬 대역, 부하 테스트용)
+    LLM_MODEL: str = "gpt-4.1"
+    LLM_FAKE_TOKENS_PER_SECOND: float = 50.0
+    LLM_FAKE_TTFT_MS: float = 300.0
+    LLM_FAKE_FAILURE_RATE: float = 0.0
+    LLM_FAKE_RESPONSE_TOKENS: int = 200
+    LLM_FAKE_SEED: int | None = None
+
+    # Conversation prompt
+    PROMPT_CONTEXT_MAX_TOKENS: int = 3000  # 시스템 지침 + 이력 + 새 메시지의 입력 토큰 상한
+    CONVERSATION_SUMMARY_EVERY_TURNS: int = 10  # 요약 이후 이 턴 수만큼 쌓이면 요약 갱신
+    CONVERSATION_SUMMARY_KEEP_RECENT: int = 6  # 요약하지 않고 원문으로 남길 최근 메시지 수
+    CONVERSATION_SUMMARY_MAX_FOLDS: int = 3  # 갱신 한 번에 접는 최대 조각 수 (LLM 호출 수, 남은 구간은 다음 턴에)
+
+    # 복호화된 메시지 평문 캐시 (워커 프로세스 단위)
+    DECRYPTED_MESSAGE_CACHE_MAX_ENTRIES: int = 10000
+    DECRYPTED_MESSAGE_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    DECRYPTED_MESSAGE_CACHE_TTL_SECONDS: int = 600
+
+    # 요금제별 사용량 쿼터 (한도는 QuotaPolicy.PLAN_LIMITS)
+    USAGE_QUOTA_ENABLED: bool = True
+
+    # 응답 스트림 재생 버퍼 (방 단위)
+    STREAM_REPLAY_BACKEND: str = "redis"  # redis | memory (단일 워커 전용)
+    STREAM_REPLAY_MAX_EVENTS: int = 2000
+    STREAM_REPLAY_TTL_SECONDS: int = 600
+    STREAM_REPLAY_HEARTBEAT_SECONDS: float = 15.0
+    STREAM_GENERATION_CLAIM_SECONDS: int = 60  # 방 선점 만료 (워커가 죽어도 이 시간 뒤 풀림, 진행 중에는 주기적으로 연장)
+    # 종료 시 진행 중인 응답 생성을 기다리는 최대 시간
+    GENERATION_SHUTDOWN_GRACE_SECONDS: float = 20.0
+
+    # 동시 응답 생성 제한 (계정별 한도는 QuotaPolicy.PLAN_LIMITS)
+    CONCURRENCY_LIMIT_ENABLED: bool = True
+    WORKER_MAX_ACTIVE_GENERATIONS: int = 200  # 워커 하나가 동시에 진행하는 생성 작업 상한 (0 이면 무제한)
+    CONCURRENCY_LEASE_SECONDS: int = 60  # 워커가 죽어도 이 시간 뒤 자리가 풀림 (진행 중에는 주기적으로 연장)
+    CONCURRENCY_QUEUE_WAIT_SECONDS: float = 2.0  # 자리가 날 때까지 기다리는 최대 시간 (0 이면 바로 거부)
+    CONCURRENCY_RETRY_AFTER_SECONDS: int = 5
+
     # Qdrant Vector DB
     QDRANT_HOST: str = "localhost"
     QDRANT_PORT: int = 6333
@@ -1,28 +1,88 @@
-from fastapi import APIRouter, Depends, Body, HTTPException
+from fastapi import APIRouter, Depends, Body, HTTPException, Query, Request, Response
+import json
+import logging
 import uuid
 
 from app.account.adapter.input.web.account_router import get_current_account_id
-from app.config.database.session import get_db_session
-from sqlalchemy.orm import Session
+from app.config.database.session import get_async_db_session, AsyncSessionLocal
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # 전역 객체는 상태가 없는 것들만 유지
-from app.config.call_gpt import CallGPT
 from app.conversation.adapter.input.web.request.chat_feedback_request import ChatFeedbackRequest
+from app.conversation.application.exception.generation_exception import (
+    GenerationFailedException,
+    GenerationInProgressException,
+)
+from app.conversation.application.exception.quota_exception import ConcurrencyLimitExceededException, QuotaExceededException
+from app.conversation.application.policy.quota_policy import QuotaPolicy
+from app.conversation.application.usecase.chat_stream_replay_usecase import ChatStreamReplayUseCase
 from app.conversation.application.usecase.end_chat_usecase import EndChatUseCase
 from app.conversation.application.usecase.get_chat_room_status_usecase import GetChatRoomStatusUseCase
 from app.conversation.application.usecase.delete_chat_usecase import DeleteChatUseCase
 from app.conversation.application.usecase.get_chat_message_usecase import GetChatMessagesUseCase
 from app.conversation.application.usecase.get_chat_room_usecase import GetChatRoomsUseCase
+from app.conversation.application.usecase.get_usage_usecase import GetUsageUseCase
 from app.conversation.application.usecase.insert_chat_feedback_usecase import ChatFeedbackUsecase
+from app.conversation.application.usecase.refresh_conversation_summary_usecase import RefreshConversationSummaryUseCase
+from app.conversation.application.usecase.stream_chat_usecase import StreamChatUsecase
+from app.conversation.domain.conversation.aggregate import Conversation
+from app.conversation.infrastructure.repository.account_plan_repository_impl import AccountPlanRepositoryImpl
 from app.conversation.infrastructure.repository.chat_feedback_repository_impl import ChatFeedbackRepositoryImpl
+from app.conversation.infrastructure.repository.concurrency_limiter_impl import ConcurrencyLimiterImpl
+from app.conversation.infrastructure.repository.chat_message_repository_impl import ChatMessageRepositoryImpl
 from app.conversation.infrastructure.repository.chat_room_repository_impl import ChatRoomRepositoryImpl
+from app.conversation.infrastructure.repository.conversation_summary_repository_impl import ConversationSummaryRepositoryImpl
+from app.conversation.infrastructure.repository.usage_ledger_repository_impl import UsageLedgerRepositoryImpl
 from app.conversation.infrastructure.repository.usage_meter_impl import UsageMeterImpl
 from app.config.security.message_crypto import AESEncryption
+from app.config.settings import settings
+from app.conversation.infrastructure.cache.decrypted_message_cache import DecryptedMessageCache
+from app.conversation.infrastructure.cache.in_memory_stream_replay_buffer import InMemoryStreamReplayBuffer
+from app.conversation.infrastructure.cache.redis_stream_replay_buffer import RedisStreamReplayBuffer
+from app.conversation.infrastructure.generation.generation_task_manager import GenerationTaskManager
+from app.conversation.infrastructure.llm.llm_backend_factory import LlmBackendFactory
 from app.conversation.adapter.output.stream.stream_adapter import StreamAdapter
 
 crypto_service = AESEncryption()
-llm_chat_port = CallGPT()
-usage_meter = UsageMeterImpl()
+llm_chat_port = LlmBackendFactory.create(settings.LLM_BACKEND)
+account_plan_repo = AccountPlanRepositoryImpl()
+# 요금제별 Redis 토큰 버킷 쿼터 (분당 요청 수 / 일일 토큰 수)
+usage_meter = UsageMeterImpl(account_plan_repo, enabled=settings.USAGE_QUOTA_ENABLED)
+# 계정별(요금제) / 워커 전체 동시 응답 생성 수 제한
+concurrency_limiter = ConcurrencyLimiterImpl(
+    account_plan_repo,
+    enabled=settings.CONCURRENCY_LIMIT_ENABLED,
+    worker_max_active=settings.WORKER_MAX_ACTIVE_GENERATIONS,
+    lease_seconds=settings.CONCURRENCY_LEASE_SECONDS,
+    queue_wait_seconds=settings.CONCURRENCY_QUEUE_WAIT_SECONDS,
+    retry_after_seconds=settings.CONCURRENCY_RETRY_AFTER_SECONDS,
+)
+# 프로세스(워커) 단위로 공유하는 복호화 평문 캐시
+message_cache = DecryptedMessageCache(
+    max_entries=settings.DECRYPTED_MESSAGE_CACHE_MAX_ENTRIES,
+    max_bytes=settings.DECRYPTED_MESSAGE_CACHE_MAX_BYTES,
+    ttl_seconds=settings.DECRYPTED_MESSAGE_CACHE_TTL_SECONDS,
+)
+# 방별 응답 스트림 재생 버퍼 = 생성 작업 → HTTP 구독자 fan-out 채널
+# (재접속 시 Last-Event-ID 이후부터 이어 받기, memory 는 단일 워커 전용)
+_replay_buffer_class = {
+    "redis": RedisStreamReplayBuffer,
+    "memory": InMemoryStreamReplayBuffer,
+}[settings.STREAM_REPLAY_BACKEND]
+replay_buffer = _replay_buffer_class(
+    max_events=settings.STREAM_REPLAY_MAX_EVENTS,
+    ttl_seconds=settings.STREAM_REPLAY_TTL_SECONDS,
+    claim_seconds=settings.STREAM_GENERATION_CLAIM_SECONDS,
+)
+replay_uc = ChatStreamReplayUseCase(
+    replay_buffer,
+    heartbeat_seconds=settings.STREAM_REPLAY_HEARTBEAT_SECONDS,
+    claim_seconds=settings.STREAM_GENERATION_CLAIM_SECONDS,
+)
+# 응답 생성 작업 레지스트리 (앱 종료 시 lifespan 에서 정리)
+generation_task_manager = GenerationTaskManager(replay_uc)
+
+logger = logging.getLogger(__name__)
 
 conversation_router = APIRouter(tags=["conversation"])
 
@@ -30,7 +90,7 @@ conversation_router = APIRouter(tags=["conversation"])
 @conversation_router.get("/rooms")
 async def get_my_rooms(
         account_id: int = Depends(get_current_account_id),
-        db: Session = Depends(get_db_session)  # 1. 세션 주입 필요
+        db: AsyncSession = Depends(get_async_db_session)  # 1. 세션 주입 필요
 ):
     # 2. 레포지토리에 현재 세션을 넣어서 생성
     room_repo = ChatRoomRepositoryImpl(db)
@@ -43,8 +103,12 @@ async def get_my_rooms(
 @conversation_router.get("/rooms/{room_id}/messages")
 async def get_room_messages(
         room_id: str,
+        response: Response,
+        before_id: int | None = Query(default=None, ge=1),
+        limit: int | None = Query(default=None, ge=1, le=200),
+        stream: bool = Query(default=False),
         account_id: int = Depends(get_current_account_id),
-        db: Session = Depends(get_db_session)
+        db: AsyncSession = Depends(get_async_db_session)
 ):
     # 2. 함수 안에서 필요한 리포지토리 생성
     from app.conversation.infrastructure.repository.chat_message_repository_impl import ChatMessageRepositoryImpl
@@ -52,66 +116,215 @@ async def get_room_messages(
     chat_message_repo = ChatMessageRepositoryImpl(db)
 
     # 3. UseCase 실행
-    uc = GetChatMessagesUseCase(chat_message_repo, crypto_service)
-    return await uc.execute(room_id, account_id)
+    uc = GetChatMessagesUseCase(chat_message_repo, crypto_service, message_cache)
+
+    # stream=true: 전체 이력을 NDJSON 으로 복호화하며 흘려보냄
+    if stream:
+        return StreamAdapter.to_ndjson_response(uc.stream(room_id, account_id))
+
+    messages = await uc.execute(room_id, account_id, before_id=before_id, limit=limit)
+
+    # 다음 페이지 커서: 꽉 찬 페이지라면 가장 오래된 메시지 id 를 before_id 로 사용
+    # (before_id 만 준 요청도 기본 페이지 크기로 잘리므로 같은 크기로 판단)
+    page_size = GetChatMessagesUseCase.page_size(before_id, limit)
+    if page_size is not None and len(messages) == page_size:
+        response.headers["X-Next-Before-Id"] = str(messages[0]["message_id"])
+
+    return messages
 
 
 @conversation_router.post("/chat/stream-auto")
 async def stream_chat_auto(
+        request: Request,
         account_id: int = Depends(get_current_account_id),
         message: str = Body(..., embed=True),
         room_id: str | None = Body(default=None, embed=True),
-        db: Session = Depends(get_db_session)
 ):
-    # 레포지토리와 유즈케이스를 함수 내부에서 생성 (세션 주입)
-    from app.conversation.infrastructure.repository.chat_room_repository_impl import ChatRoomRepositoryImpl
-    from app.conversation.infrastructure.repository.chat_message_repository_impl import ChatMessageRepositoryImpl
-    from app.conversation.application.usecase.stream_chat_usecase import StreamChatUsecase
+    plan_limits = QuotaPolicy.limits(await account_plan_repo.get_plan(account_id))
+    if len(message) > plan_limits["max_message_length"]:
+        raise HTTPException(
+            status_code=400,
+            detail=f"메시지는 {plan_limits['max_message_length']}자 이하로 입력해 주세요.",
+        )
 
-    chat_room_repo = ChatRoomRepositoryImpl(db)
-    chat_message_repo = ChatMessageRepositoryImpl(db)
+    # 생성은 응답 스트림이 시작된 뒤 백그라운드에서 진행되므로 쿼터는 여기서 먼저 확인 (429 + Retry-After)
+    try:
+        await usage_meter.check_available(account_id)
+    except QuotaExceededException as e:
+        raise HTTPException(
+            status_code=429,
+            detail="사용량 한도를 초과했습니다. 잠시 후 다시 시도해 주세요.",
+            headers={"Retry-After": str(e.retry_after_seconds)} if e.retry_after_seconds else None,
+        )
+
+    # 요청 스코프 세션(Depends)은 응답 스트림이 끝날 때까지 유지되므로 쓰지 않고,
+    # 방 확인 / 생성만 짧은 세션에서 끝낸 뒤 커넥션을 반납
+    async with AsyncSessionLocal() as db:
+        chat_room_repo = ChatRoomRepositoryImpl(db)
+
+        # 방 생성 로직 (요금제별 활성 방 수 한도 안에서만)
+        if room_id is None:
+            if await chat_room_repo.count_active_by_account_id(account_id) >= plan_limits["max_rooms"]:
+                raise HTTPException(
+                    status_code=403,
+                    detail="요금제의 채팅방 수 한도에 도달했습니다. 기존 상담을 종료한 뒤 다시 시도해 주세요.",
+                )
+            room_id = str(uuid.uuid4())
+            await chat_room_repo.create(
+                room_id=room_id,
+                account_id=account_id,
+                title=message[:20],
+                category="GENERAL",
+                division="DEFAULT",
+                out_api="FALSE"
+            )
+        else:
+            room = await chat_room_repo.find_by_id(room_id)
+            if not room:
+                raise HTTPException(status_code=404, detail="Room not found")
+            # 생성 작업 안에서 확인하면 이미 200 으로 시작된 스트림이 빈 본문으로 끝나므로 여기서 먼저 거절
+            if not Conversation(room=room, messages=[]).is_active():
+                raise HTTPException(status_code=400, detail="채팅방이 활성 상태가 아닙니다.")
+
+    # 동시 생성 자리가 날 때까지 잠시 기다린 뒤에도 없으면 429 (자리는 생성 작업이 끝날 때 반납)
+    try:
+        lease_id = await concurrency_limiter.acquire(account_id)
+    except ConcurrencyLimitExceededException as e:
+        raise HTTPException(
+            status_code=429,
+            detail="동시에 생성 중인 응답이 너무 많습니다. 잠시 후 다시 시도해 주세요.",
+            headers={"Retry-After": str(e.retry_after_seconds)} if e.retry_after_seconds else None,
+        )
+
+    # 생성은 요청과 분리된 백그라운드 작업에서 끝까지 진행 → 응답은 재생 버퍼를 구독
+    try:
+        stream_id = await generation_task_manager.submit(
+            room_id,
+            lambda stream_id: _generate_reply(stream_id, room_id, account_id, message, lease_id),
+        )
+    except GenerationInProgressException:
+        await concurrency_limiter.release(account_id, lease_id)
+        raise HTTPException(status_code=409, detail="이전 응답을 생성하는 중입니다. 잠시 후 다시 시도해 주세요.")
+    except BaseException:
+        await concurrency_limiter.release(account_id, lease_id)
+        raise
+
+    return _to_stream_response(request, room_id, replay_uc.subscribe(room_id), stream_id)
+
+
+@conversation_router.get("/rooms/{room_id}/stream")
+async def resume_chat_stream(
+        room_id: str,
+        request: Request,
+        last_event_id: str | None = Query(default=None),
+        account_id: int = Depends(get_current_account_id),
+):
+    """끊긴 응답 스트림 이어 받기 (Last-Event-ID 헤더 또는 last_event_id 쿼리 이후부터)"""
+    async with AsyncSessionLocal() as db:
+        room = await ChatRoomRepositoryImpl(db).find_by_id(room_id)
+    if not room or room.account_id != account_id:
+        raise HTTPException(status_code=404, detail="Room not found")
 
-    usecase = StreamChatUsecase(
-        chat_room_repo=chat_room_repo,
-        chat_message_repo=chat_message_repo,
-        llm_chat_port=llm_chat_port,
-        usage_meter=usage_meter,
-        crypto_service=crypto_service
-    )
-    # 방 생성 로직
-    if room_id is None:
-        room_id = str(uuid.uuid4())
-        await chat_room_repo.create(
+    last_event_id = request.headers.get("last-event-id") or last_event_id
+    # 응답 스트림이 시작된 뒤에는 상태 코드를 바꿀 수 없으므로 구독 전에 형식 확인
+    if last_event_id and not replay_buffer.is_valid_event_id(last_event_id):
+        raise HTTPException(status_code=400, detail="Last-Event-ID 형식이 올바르지 않습니다.")
+
+    if not await replay_buffer.exists(room_id):
+        raise HTTPException(status_code=404, detail="이어 받을 응답 스트림이 없습니다.")
+
+    return _to_stream_response(request, room_id, replay_uc.subscribe(room_id, last_event_id))
+
+
+def _to_stream_response(request: Request, room_id: str, events, stream_id: str | None = None):
+    headers = {"X-Stream-Id": stream_id} if stream_id else None
+
+    # Accept: text/event-stream 이면 SSE (이벤트 id, heartbeat, 저장된 메시지 id 를 담은 done 이벤트)
+    if "text/event-stream" in request.headers.get("accept", ""):
+        return StreamAdapter.to_sse_response(events, headers=headers)
+
+    async def deltas():
+        async for event in events:
+            if event is None:
+                continue
+            if event[1] == "delta":
+                yield event[2]
+            elif event[1] == "error":
+                # 상태 코드는 이미 200 → 예외로 본문을 중단해 클라이언트가 정상 종료로 오인하지 않게 함
+                detail = json.loads(event[2]).get("detail")
+                raise GenerationFailedException(room_id, detail)
+
+    # 버퍼에 기록될 때 이미 묶인 조각이므로 다시 모으지 않음
+    return StreamAdapter.to_streaming_response(deltas(), coalesce=False, headers=headers)
+
+
+async def _generate_reply(
+        stream_id: str,
+        room_id: str,
+        account_id: int,
+        message: str,
+        lease_id: str,
+) -> None:
+    """클라이언트 연결과 무관하게 응답 생성 → 재생 버퍼 기록 → 저장까지 수행"""
+    async with concurrency_limiter.hold(account_id, lease_id), AsyncSessionLocal() as session:
+        usecase = StreamChatUsecase(
+            chat_room_repo=ChatRoomRepositoryImpl(session),
+            chat_message_repo=ChatMessageRepositoryImpl(session),
+            llm_chat_port=llm_chat_port,
+            usage_meter=usage_meter,
+            crypto_service=crypto_service,
+            summary_repo=ConversationSummaryRepositoryImpl(session),
+            message_cache=message_cache,
+            usage_ledger_repo=UsageLedgerRepositoryImpl(session),
+        )
+        generator = usecase.execute(
             room_id=room_id,
             account_id=account_id,
-            title=message[:20],
-            category="GENERAL",
-            division="DEFAULT",
-            out_api="FALSE"
+            message=message,
+            contents_type="TEXT",
+        )
+        await replay_uc.publish(
+            room_id,
+            stream_id,
+            StreamAdapter.coalesce(generator),
+            done_payload=lambda: usecase.saved_message_ids,
         )
-    else:
-        room = await chat_room_repo.find_by_id(room_id)
-        if not room:
-            raise HTTPException(status_code=404, detail="Room not found")
 
-    generator = usecase.execute(
-        room_id=room_id,
-        account_id=account_id,
-        message=message,
-        contents_type="TEXT",
-    )
-    return StreamAdapter.to_streaming_response(generator)
+    # 요약 갱신은 응답 기록이 끝난 뒤 별도 세션 / 작업에서 수행 (방 점유와 스트림 종료를 지연시키지 않음)
+    if usecase.pending_summary_refresh is not None:
+        generation_task_manager.spawn(_refresh_summary(usecase, account_id))
+
+
+async def _refresh_summary(usecase, account_id: int) -> None:
+    if usecase.pending_summary_refresh is None:
+        return
+
+    room_id, previous, messages = usecase.pending_summary_refresh
+    try:
+        async with AsyncSessionLocal() as session:
+            uc = RefreshConversationSummaryUseCase(
+                summary_repo=ConversationSummaryRepositoryImpl(session),
+                llm_chat_port=llm_chat_port,
+                crypto_service=crypto_service,
+                message_cache=message_cache,
+                usage_meter=usage_meter,
+                usage_ledger_repo=UsageLedgerRepositoryImpl(session),
+            )
+            await uc.execute(room_id, account_id, previous, messages)
+    except Exception:
+        # 요약 실패는 대화에 영향을 주지 않음 → 다음 주기에 다시 시도
+        logger.exception("대화 요약 갱신 실패 room_id=%s", room_id)
 
 
 @conversation_router.delete("/rooms/{room_id}")
 async def delete_chat_room(
         room_id: str,
         account_id: int = Depends(get_current_account_id),
-        db: Session = Depends(get_db_session)
+        db: AsyncSession = Depends(get_async_db_session)
 ):
     chat_room_repo = ChatRoomRepositoryImpl(db)
 
-    usecase = DeleteChatUseCase(chat_room_repo)
+    usecase = DeleteChatUseCase(chat_room_repo, message_cache)
 
     # 3. 실행
     success = await usecase.execute(room_id=room_id, account_id=account_id)
@@ -126,7 +339,7 @@ async def delete_chat_room(
 async def end_chat(
     room_id: str,
     account_id: int = Depends(get_current_account_id),
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
 ):
     room_repo = ChatRoomRepositoryImpl(db)
     uc = EndChatUseCase(room_repo)
@@ -138,7 +351,7 @@ async def end_chat(
 async def get_room_status(
     room_id: str,
     account_id: int = Depends(get_current_account_id),
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
 ):
     repo = ChatRoomRepositoryImpl(db)
     uc = GetChatRoomStatusUseCase(repo)
@@ -146,12 +359,23 @@ async def get_room_status(
     return {"room_id": room_id, "status": status}
 
 
+# 최근 일자별 토큰 사용량 (usage_ledger 집계)
+@conversation_router.get("/usage")
+async def get_my_usage(
+    days: int = Query(default=30, ge=1, le=90),
+    account_id: int = Depends(get_current_account_id),
+    db: AsyncSession = Depends(get_async_db_session),
+):
+    uc = GetUsageUseCase(UsageLedgerRepositoryImpl(db))
+    return await uc.execute(account_id, days)
+
+
 # 피드백 생성 (POST)
 @conversation_router.post("/feedback")
 async def add_feedback(
         feedback_req: ChatFeedbackRequest,
         account_id: int = Depends(get_current_account_id),
-        db: Session = Depends(get_db_session)
+        db: AsyncSession = Depends(get_async_db_session)
 ):
     chat_feedback_repo = ChatFeedbackRepositoryImpl(db)
     use_case = ChatFeedbackUsecase(chat_feedback_repo)
@@ -169,7 +393,7 @@ async def add_feedback(
 async def update_feedback(
         feedback_req: ChatFeedbackRequest,
         account_id: int = Depends(get_current_account_id),
-        db: Session = Depends(get_db_session)
+        db: AsyncSession = Depends(get_async_db_session)
 ):
     chat_feedback_repo = ChatFeedbackRepositoryImpl(db)
     use_case = ChatFeedbackUsecase(chat_feedback_repo)
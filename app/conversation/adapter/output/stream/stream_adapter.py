@@ -1,8 +1,145 @@
+import asyncio
+import json
+import time
+from typing import AsyncIterator
+
+from fastapi.encoders import jsonable_encoder
 from fastapi.responses import StreamingResponse
 
 
 class StreamAdapter:
 
+    # 작은 delta 를 모아서 보내는 기준: 64바이트 이상 또는 첫 조각 후 30ms 경과
+    COALESCE_MAX_BYTES = 64
+    COALESCE_MAX_DELAY_SECONDS = 0.03
+
+    @staticmethod
+    def to_streaming_response(generator, background=None, coalesce: bool = True, headers: dict | None = None):
+        """문자열 조각을 text/plain 으로 흘려보냄
+
+        coalesce: 작은 조각을 모아서 전송 (이미 묶인 조각이면 False)
+        background: 응답 본문 전송이 끝난 뒤 실행할 작업 (starlette BackgroundTask)
+        """
+        source = StreamAdapter.coalesce(generator) if coalesce else generator
+
+        async def encode():
+            async for item in source:
+                yield item.encode("utf-8")
+
+        return StreamingResponse(encode(), media_type="text/plain", headers=headers, background=background)
+
+    @staticmethod
+    def to_sse_response(events, headers: dict | None = None, background=None):
+        """(event_id, event, data) 를 흘려보내는 async iterator 를 Server-Sent Events 로 변환
+
+        - event 가 delta 이면 기본(message) 이벤트, 그 외(start / done / error)는 이름 있는 이벤트
+        - None 은 연결 유지용 주석(: ping) 으로 전송
+        """
+
+        async def encode():
+            async for item in events:
+                if item is None:
+                    yield b": ping\n\n"
+                    continue
+                event_id, event, data = item
+                yield StreamAdapter._sse_event(data, event_id=event_id, event=None if event == "delta" else event)
+
+        return StreamingResponse(
+            encode(),
+            media_type="text/event-stream",
+            headers={
+                "Cache-Control": "no-cache",
+                "X-Accel-Buffering": "no",  # nginx 응답 버퍼링 해제
+                **(headers or {}),
+            },
+            background=background,
+        )
+
+    @staticmethod
+    def to_ndjson_response(generator):
+        """dict 를 흘려보내는 async generator 를 NDJSON(줄 단위 JSON) 응답으로 변환"""
+
+        async def encode():
+            async for item in generator:
+                line = json.dumps(jsonable_encoder(item), ensure_ascii=False)
+                yield f"{line}\n".encode("utf-8")
+
+        return StreamingResponse(encode(), media_type="application/x-ndjson")
+
     @staticmethod
-    def to_streaming_response(generator):
-        return StreamingResponse(generator, media_type="text/plain")
+    def _sse_event(data: str, event_id, event: str | None = None) -> bytes:
+        lines = [f"id: {event_id}"]
+        if event:
+            lines.append(f"event: {event}")
+        # data 안의 줄바꿈은 data: 줄을 나눠서 표현
+        lines.extend(f"data: {line}" for line in data.split("\n"))
+        return ("\n".join(lines) + "\n\n").encode("utf-8")
+
+    @staticmethod
+    async def coalesce(
+        generator: AsyncIterator[str],
+        max_bytes: int | None = None,
+        max_delay: float | None = None,
+    ) -> AsyncIterator[str]:
+        """작은 문자열 조각을 max_bytes / max_delay 기준으로 묶어서 흘려보냄
+
+        다음 조각을 기다리는 작업(anext)은 시간 초과로 취소하지 않고 유지한다.
+        (취소하면 원본 generator 가 중간에 닫힘)
+        """
+        max_bytes = max_bytes or StreamAdapter.COALESCE_MAX_BYTES
+        max_delay = max_delay or StreamAdapter.COALESCE_MAX_DELAY_SECONDS
+
+        iterator = generator.__aiter__()
+        buffer: list[str] = []
+        buffered_bytes = 0
+        deadline = None
+        pending = None
+
+        try:
+            while True:
+                if pending is None:
+                    pending = asyncio.ensure_future(iterator.__anext__())
+
+                timeout = max(deadline - time.monotonic(), 0) if buffer else None
+                done, _ = await asyncio.wait({pending}, timeout=timeout)
+                if not done:
+                    # 시간 초과: 모아 둔 조각 전송
+                    yield "".join(buffer)
+                    buffer, buffered_bytes, deadline = [], 0, None
+                    continue
+
+                task, pending = pending, None
+                try:
+                    chunk = task.result()
+                except StopAsyncIteration:
+                    break
+                except Exception:
+                    # 실패 전까지 모은 조각은 먼저 전달
+                    if buffer:
+                        yield "".join(buffer)
+                    raise
+
+                if not chunk:
+                    continue
+                if not buffer:
+                    deadline = time.monotonic() + max_delay
+                buffer.append(chunk)
+                buffered_bytes += len(chunk.encode("utf-8"))
+
+                if buffered_bytes >= max_bytes or time.monotonic() >= deadline:
+                    yield "".join(buffer)
+                    buffer, buffered_bytes, deadline = [], 0, None
+
+            if buffer:
+                yield "".join(buffer)
+        finally:
+            # 클라이언트 연결 종료 등으로 중단되면 대기 중인 작업과 원본 generator 정리
+            if pending is not None:
+                pending.cancel()
+                try:
+                    await pending
+                except BaseException:
+                    pass
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
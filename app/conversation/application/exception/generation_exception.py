@@ -0,0 +1,18 @@
+from app.conversation.application.exception.application_exception import ApplicationException
+
+
+class GenerationInProgressException(ApplicationException):
+    """같은 방에서 응답 생성이 이미 진행 중"""
+
+    def __init__(self, room_id: str):
+        self.room_id = room_id
+        super().__init__(f"Generation already in progress: {room_id}")
+
+
+class GenerationFailedException(ApplicationException):
+    """응답 생성이 error 이벤트로 끝남 (text/plain 응답 본문을 중단하는 데 사용)"""
+
+    def __init__(self, room_id: str, detail: str | None = None):
+        self.room_id = room_id
+        self.detail = detail
+        super().__init__(f"Generation failed: {room_id} ({detail})")
@@ -0,0 +1,15 @@
+from app.conversation.application.exception.application_exception import ApplicationException
+
+
+class UnsupportedLlmBackendException(ApplicationException):
+    """등록되지 않은 LLM 백엔드 이름"""
+
+    def __init__(self, backend: str):
+        super().__init__(f"Unsupported LLM backend: {backend}")
+
+
+class LlmBackendException(ApplicationException):
+    """LLM 백엔드 호출 실패"""
+
+    def __init__(self, message: str = "LLM backend call failed"):
+        super().__init__(message)
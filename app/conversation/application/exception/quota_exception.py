@@ -4,5 +4,15 @@ from app.conversation.application.exception.application_exception import Applica
 class QuotaExceededException(ApplicationException):
     """유저 사용량 초과"""
 
-    def __init__(self, message: str = "Usage quota exceeded"):
+    def __init__(self, message: str = "Usage quota exceeded", retry_after_seconds: int | None = None):
+        # 한도가 다시 찰 때까지 남은 시간 (HTTP Retry-After)
+        self.retry_after_seconds = retry_after_seconds
+        super().__init__(message)
+
+
+class ConcurrencyLimitExceededException(ApplicationException):
+    """동시 생성 수 초과 (계정 요금제 한도 또는 워커 전체 상한)"""
+
+    def __init__(self, message: str = "Too many concurrent generations", retry_after_seconds: int | None = None):
+        self.retry_after_seconds = retry_after_seconds
         super().__init__(message)
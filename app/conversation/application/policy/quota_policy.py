@@ -0,0 +1,33 @@
+class QuotaPolicy:
+
+    # 요금제(AccountPlan)별 한도: 분당 요청 수 / 일일 토큰 수 (입력 + 출력) / 동시 생성 수
+    # / 동시에 열어 둘 수 있는 활성(ACTIVE) 채팅방 수 / 메시지 한 건의 최대 글자 수
+    PLAN_LIMITS = {
+        "FREE": {
+            "requests_per_minute": 10,
+            "tokens_per_day": 30_000,
+            "concurrent_generations": 1,
+            "max_rooms": 1,
+            "max_message_length": 500,
+        },
+        "PRO": {
+            "requests_per_minute": 30,
+            "tokens_per_day": 300_000,
+            "concurrent_generations": 3,
+            "max_rooms": 10,
+            "max_message_length": 4000,
+        },
+        "TEAM": {
+            "requests_per_minute": 60,
+            "tokens_per_day": 1_000_000,
+            "concurrent_generations": 5,
+            "max_rooms": 50,
+            "max_message_length": 10000,
+        },
+    }
+    DEFAULT_PLAN = "FREE"
+
+    @classmethod
+    def limits(cls, plan: str | None) -> dict:
+        """알 수 없는 요금제는 FREE 한도 적용"""
+        return cls.PLAN_LIMITS.get((plan or "").upper(), cls.PLAN_LIMITS[cls.DEFAULT_PLAN])
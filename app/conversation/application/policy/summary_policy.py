@@ -0,0 +1,19 @@
+class SummaryPolicy:
+
+    # 한 턴 = 사용자 메시지 + 상담사 메시지
+    MESSAGES_PER_TURN = 2
+
+    @classmethod
+    def messages_to_fold(cls, messages: list, refresh_every_turns: int, keep_recent: int) -> list:
+        """요약에 새로 접어 넣을 메시지 목록을 반환 (갱신 시점이 아니면 빈 리스트)
+
+        요약 이후 쌓인 메시지 중 최근 keep_recent 개는 원문으로 남기고,
+        그보다 오래된 메시지가 refresh_every_turns 턴 이상 쌓였을 때만 요약을 갱신한다.
+        """
+        if refresh_every_turns <= 0:
+            return []
+
+        foldable = len(messages) - max(keep_recent, 0)
+        if foldable < refresh_every_turns * cls.MESSAGES_PER_TURN:
+            return []
+        return list(messages[:foldable])
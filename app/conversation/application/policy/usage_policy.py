@@ -1,6 +1,61 @@
+from app.conversation.application.port.out.llm_chat_port import TokenUsage
+
+try:
+    import tiktoken
+except ImportError:  # tokenizer 미설치 환경에서는 근사치로 계산
+    tiktoken = None
+
+
 class UsagePolicy:
 
+    # gpt-4.1 / gpt-4o 계열이 사용하는 BPE 인코딩
+    ENCODING_NAME = "o200k_base"
+    # chat 형식에서 메시지마다 붙는 역할/구분자 토큰
+    MESSAGE_OVERHEAD_TOKENS = 4
+
+    _encoding = None
+    _encoding_unavailable = False
+
+    @classmethod
+    def _get_encoding(cls):
+        if cls._encoding is None and not cls._encoding_unavailable:
+            try:
+                cls._encoding = tiktoken.get_encoding(cls.ENCODING_NAME)
+            except Exception:
+                # 미설치 또는 오프라인(인코딩 파일 다운로드 실패) → 이후 호출은 근사치 사용
+                cls._encoding_unavailable = True
+        return cls._encoding
+
+    @classmethod
+    def calculate_token(cls, text: str) -> int:
+        if not text:
+            return 0
+
+        encoding = cls._get_encoding()
+        if encoding is not None:
+            return len(encoding.encode(text, disallowed_special=()))
+        return cls.estimate_token(text)
+
+    @classmethod
+    def calculate_message_token(cls, content: str) -> int:
+        """역할 메시지 하나(content + 역할/구분자)가 차지하는 입력 토큰 수"""
+        return cls.calculate_token(content) + cls.MESSAGE_OVERHEAD_TOKENS
+
+    @classmethod
+    def fill_estimated_usage(cls, usage: TokenUsage, messages: list[dict], completion: str) -> TokenUsage:
+        """제공자가 usage 를 보고하지 않은 경우(대역, 스트림 중단 등) tokenizer 로 계산해 채움"""
+        if not usage.reported:
+            usage.prompt_tokens = sum(cls.calculate_message_token(m["content"]) for m in messages)
+            usage.completion_tokens = cls.calculate_token(completion)
+            usage.estimated = True
+        return usage
+
     @staticmethod
-    def calculate_token(text: str) -> int:
-        # 단순 예시 (실제로는 tokenizer 연동)
-        return len(text) // 4
+    def estimate_token(text: str) -> int:
+        """tokenizer 없이 쓰는 보수적 근사치.
+
+        영문/숫자(ASCII)는 약 4글자당 1토큰, 한글 등 비ASCII 문자는 글자당 1토큰으로 계산한다.
+        len(text) // 4 는 한국어 토큰 수를 3~4배 과소평가한다.
+        """
+        ascii_count = sum(1 for ch in text if ch.isascii())
+        return (ascii_count + 3) // 4 + (len(text) - ascii_count)
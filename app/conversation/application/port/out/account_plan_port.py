@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+
+
+class AccountPlanPort(ABC):
+
+    @abstractmethod
+    async def get_plan(self, account_id: int) -> str:
+        """현재 유효한 요금제 이름 (FREE / PRO / TEAM, 만료되었거나 계정이 없으면 FREE)"""
+        pass
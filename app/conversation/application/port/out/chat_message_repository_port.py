@@ -11,6 +11,27 @@ class ChatMessageRepositoryPort(ABC):
     async def find_by_room_id(self, room_id: str):
         pass
 
+    @abstractmethod
+    async def find_by_room_id_after(self, room_id: str, after_id: int | None):
+        """after_id 보다 큰 id 의 메시지만 id 오름차순으로 반환 (after_id 가 None 이면 전체)"""
+        pass
+
     @abstractmethod
     async def find_by_room_id_with_feedback(self, room_id: str, account_id: int):
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def find_page_by_room_id_with_feedback(
+        self,
+        room_id: str,
+        account_id: int,
+        before_id: int | None,
+        limit: int,
+    ):
+        """before_id 보다 작은 id 중 최근 limit 개를 id 오름차순으로 반환 (keyset pagination)"""
+        pass
+
+    @abstractmethod
+    def stream_by_room_id_with_feedback(self, room_id: str, account_id: int):
+        """전체 메시지를 한 번에 적재하지 않고 행 단위로 흘려보내는 async iterator"""
+        pass
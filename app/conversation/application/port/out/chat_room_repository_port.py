@@ -28,6 +28,10 @@ class ChatRoomRepositoryPort(ABC):
     async def find_by_account_id(self, account_id: int):
         pass
 
+    @abstractmethod
+    async def count_active_by_account_id(self, account_id: int) -> int:
+        pass
+
     @abstractmethod
     async def delete_by_room_id(self, room_id: int):
         pass
@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from contextlib import AbstractAsyncContextManager
+
+
+class ConcurrencyLimiterPort(ABC):
+
+    @abstractmethod
+    async def acquire(self, account_id: int) -> str:
+        """동시 생성 자리 하나를 잡고 lease_id 반환 (자리가 없으면 ConcurrencyLimitExceededException)"""
+        pass
+
+    @abstractmethod
+    def hold(self, account_id: int, lease_id: str) -> AbstractAsyncContextManager[None]:
+        """생성이 진행되는 동안 lease 를 연장하고, 끝나면(취소 포함) 반납"""
+        pass
+
+    @abstractmethod
+    async def release(self, account_id: int, lease_id: str) -> None:
+        pass
@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+
+from app.conversation.domain.chat_message.value_object import EncryptedContent
+from app.conversation.domain.conversation.summary import ConversationSummary
+
+
+class ConversationSummaryRepositoryPort(ABC):
+    @abstractmethod
+    async def find_latest(self, room_id: str) -> ConversationSummary | None:
+        """방의 가장 최근 요약을 반환 (없으면 None)"""
+        pass
+
+    @abstractmethod
+    async def save(
+        self,
+        room_id: str,
+        covered_message_id: int,
+        content: EncryptedContent,
+        model: str | None = None,
+    ) -> ConversationSummary:
+        """covered_message_id 까지를 포함하는 새 요약을 저장"""
+        pass
@@ -1,18 +1,40 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import AsyncIterator
 
 
+@dataclass
+class TokenUsage:
+    """LLM 호출 한 번의 토큰 사용량 (스트림이 끝난 뒤 채워짐)"""
+
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    # 제공자 프롬프트 캐시에 적중한 입력 토큰 (prompt_tokens 에 포함)
+    cached_prompt_tokens: int = 0
+    # 제공자가 usage 를 주지 않아 tokenizer 로 계산한 값
+    estimated: bool = False
+    # 제공자가 usage 를 채웠는지 여부
+    reported: bool = False
+    model: str | None = None
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+
 class LlmChatPort(ABC):
 
     @abstractmethod
     async def stream_chat(
         self,
         messages: list[dict],
+        usage: TokenUsage | None = None,
     ) -> AsyncIterator[str]:
         """
         messages:
         [
           {"role": "system|user|assistant", "content": "..."}
         ]
+        usage: 주어지면 스트림이 끝난 뒤 제공자가 보고한 토큰 사용량을 채움 (reported=True)
         """
         pass
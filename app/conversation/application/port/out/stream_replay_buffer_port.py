@@ -0,0 +1,58 @@
+from abc import ABC, abstractmethod
+
+
+class StreamReplayBufferPort(ABC):
+    """
+    방별로 진행 중(또는 직전)인 응답 스트림의 이벤트를 보관하는 재생 버퍼
+    이벤트: (event_id, event, data) - event_id 는 버퍼 안에서 증가하는 문자열
+    """
+
+    # 스트림을 끝내는 이벤트 (구독 종료 기준)
+    TERMINAL_EVENTS = ("done", "error")
+
+    @abstractmethod
+    async def claim(self, room_id: str, owner: str) -> bool:
+        """방의 응답 생성 자리를 원자적으로 선점 (이미 다른 owner 가 잡고 있으면 False)
+
+        선점은 claim_seconds 뒤 만료되므로 생성이 진행되는 동안 renew_claim 으로 연장해야 한다.
+        """
+        pass
+
+    @abstractmethod
+    async def renew_claim(self, room_id: str, owner: str) -> bool:
+        """owner 의 선점을 연장 (이미 만료되어 다른 owner 에게 넘어갔으면 False)"""
+        pass
+
+    @abstractmethod
+    async def release_claim(self, room_id: str, owner: str) -> None:
+        """owner 의 선점만 해제 (다른 owner 의 선점은 건드리지 않음)"""
+        pass
+
+    @abstractmethod
+    async def start(self, room_id: str, stream_id: str) -> str:
+        """방의 이전 스트림을 비우고 새 스트림의 start 이벤트를 기록, event_id 반환"""
+        pass
+
+    @abstractmethod
+    async def append(self, room_id: str, event: str, data: str) -> str:
+        """이벤트를 기록하고 event_id 반환"""
+        pass
+
+    @abstractmethod
+    async def read(
+        self,
+        room_id: str,
+        after_id: str | None = None,
+        block_ms: int | None = None,
+    ) -> list[tuple[str, str, str]]:
+        """after_id 이후의 이벤트 목록 (없으면 block_ms 동안 대기 후 빈 리스트)"""
+        pass
+
+    @abstractmethod
+    async def exists(self, room_id: str) -> bool:
+        pass
+
+    @abstractmethod
+    def is_valid_event_id(self, event_id: str) -> bool:
+        """클라이언트가 보낸 Last-Event-ID 가 이 버퍼의 event_id 형식인지 (구독 전에 확인)"""
+        pass
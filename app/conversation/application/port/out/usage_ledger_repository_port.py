@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from datetime import date
+
+from app.conversation.application.port.out.llm_chat_port import TokenUsage
+
+
+class UsageLedgerRepositoryPort(ABC):
+
+    @abstractmethod
+    async def append(
+        self,
+        account_id: int,
+        usage: TokenUsage,
+        room_id: str | None = None,
+        message_id: int | None = None,
+    ) -> None:
+        """사용량 한 건 추가 (커밋은 호출 측 트랜잭션에서)"""
+        pass
+
+    @abstractmethod
+    async def sum_daily(self, account_id: int, start: date, end: date) -> list[dict]:
+        """start ~ end(포함) 일자별 합계
+        [{"usage_date": date, "requests": int, "prompt_tokens": int, "completion_tokens": int}]
+        """
+        pass
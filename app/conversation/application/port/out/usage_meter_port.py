@@ -16,6 +16,7 @@ class UsageMeterPort(ABC):
         self,
         account_id: int,
         input_tokens: int,
-        token_count: int,
+        output_tokens: int,
     ) -> None:
+        """LLM 호출 한 번의 입력 / 출력 토큰을 일일 토큰 쿼터에서 차감"""
         pass
@@ -0,0 +1,130 @@
+import asyncio
+import json
+import logging
+import uuid
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable
+
+from app.conversation.application.exception.generation_exception import GenerationInProgressException
+from app.conversation.application.port.out.stream_replay_buffer_port import StreamReplayBufferPort
+
+logger = logging.getLogger(__name__)
+
+
+class ChatStreamReplayUseCase:
+    """
+    응답 스트림을 재생 버퍼에 기록(publish)하고, 클라이언트는 버퍼를 구독(subscribe)한다.
+    생성은 클라이언트 연결과 무관하게 끝까지 진행되고,
+    재접속한 클라이언트는 마지막으로 받은 event_id(Last-Event-ID) 이후부터 이어 받는다.
+    스트림을 열기 전에 버퍼에서 방을 선점하므로, 다른 워커가 기록 중인 스트림을 비우지 않는다.
+    """
+
+    def __init__(
+        self,
+        replay_buffer: StreamReplayBufferPort,
+        heartbeat_seconds: float = 15.0,
+        claim_seconds: int = 60,
+    ):
+        self.replay_buffer = replay_buffer
+        self.heartbeat_seconds = heartbeat_seconds
+        self.claim_seconds = claim_seconds
+
+    async def start(self, room_id: str) -> str:
+        """방을 선점하고 새 스트림을 열어 stream_id 반환 (다른 생성이 선점 중이면 GenerationInProgressException)
+
+        선점은 hold 로 감싼 생성이 끝날 때 해제된다.
+        """
+        stream_id = str(uuid.uuid4())
+        if not await self.replay_buffer.claim(room_id, stream_id):
+            raise GenerationInProgressException(room_id)
+
+        try:
+            await self.replay_buffer.start(room_id, stream_id)
+        except BaseException:
+            await self._release_quietly(room_id, stream_id)
+            raise
+        return stream_id
+
+    @asynccontextmanager
+    async def hold(self, room_id: str, stream_id: str) -> AsyncIterator[None]:
+        """생성이 진행되는 동안 방 선점을 주기적으로 연장하고, 끝나면 해제"""
+        renewer = asyncio.create_task(
+            self._renew_periodically(room_id, stream_id), name=f"chat-stream-claim:{room_id}"
+        )
+        try:
+            yield
+        finally:
+            renewer.cancel()
+            await self._release_quietly(room_id, stream_id)
+
+    async def _renew_periodically(self, room_id: str, stream_id: str) -> None:
+        interval = self.claim_seconds / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                renewed = await self.replay_buffer.renew_claim(room_id, stream_id)
+            except Exception:
+                logger.warning("방 선점 연장 실패 room_id=%s", room_id, exc_info=True)
+                continue
+            if not renewed:
+                logger.warning("방 선점이 이미 만료됨 room_id=%s stream_id=%s", room_id, stream_id)
+                return
+
+    async def _release_quietly(self, room_id: str, stream_id: str) -> None:
+        try:
+            await self.replay_buffer.release_claim(room_id, stream_id)
+        except Exception:
+            # 해제하지 못한 선점은 claim_seconds 뒤 만료
+            logger.warning("방 선점 해제 실패 room_id=%s stream_id=%s", room_id, stream_id, exc_info=True)
+
+    async def publish(
+        self,
+        room_id: str,
+        stream_id: str,
+        chunks: AsyncIterator[str],
+        done_payload: Callable[[], dict | None] | None = None,
+    ) -> bool:
+        """응답 조각을 delta 이벤트로 기록하고 마지막에 done / error 이벤트를 남김"""
+        try:
+            async for chunk in chunks:
+                await self.replay_buffer.append(room_id, "delta", chunk)
+        except Exception as e:
+            logger.exception("응답 생성 실패 room_id=%s stream_id=%s", room_id, stream_id)
+            await self.fail(room_id, stream_id, getattr(e, "detail", None) or "응답 생성 중 오류가 발생했습니다.")
+            return False
+
+        payload = {"stream_id": stream_id, **((done_payload() if done_payload else None) or {})}
+        await self.replay_buffer.append(room_id, "done", json.dumps(payload, ensure_ascii=False))
+        return True
+
+    async def fail(self, room_id: str, stream_id: str, detail: str) -> None:
+        """스트림을 error 이벤트로 종료 (구독자는 이 이벤트를 받고 끝남)"""
+        await self.replay_buffer.append(
+            room_id, "error", json.dumps({"stream_id": stream_id, "detail": detail}, ensure_ascii=False)
+        )
+
+    async def subscribe(
+        self,
+        room_id: str,
+        last_event_id: str | None = None,
+    ) -> AsyncIterator[tuple[str, str, str] | None]:
+        """
+        last_event_id 이후의 이벤트를 (event_id, event, data) 로 흘려보냄
+        heartbeat_seconds 동안 새 이벤트가 없으면 None (연결 유지용)
+        done / error 이벤트 또는 버퍼 만료 시 종료
+        """
+        cursor = last_event_id
+        block_ms = int(self.heartbeat_seconds * 1000)
+        while True:
+            events = await self.replay_buffer.read(room_id, after_id=cursor, block_ms=block_ms)
+            if not events:
+                if not await self.replay_buffer.exists(room_id):
+                    return
+                yield None
+                continue
+
+            for event in events:
+                cursor = event[0]
+                yield event
+                if event[1] in StreamReplayBufferPort.TERMINAL_EVENTS:
+                    return
@@ -1,6 +1,7 @@
 class DeleteChatUseCase:
-    def __init__(self, chat_room_repo):
+    def __init__(self, chat_room_repo, message_cache=None):
         self.chat_room_repo = chat_room_repo
+        self.message_cache = message_cache
 
     async def execute(self, room_id: str, account_id: int) -> bool:
         room = await self.chat_room_repo.find_by_id(room_id)
@@ -11,4 +12,10 @@ class DeleteChatUseCase:
         if room.account_id != account_id:
             return False
 
-        return await self.chat_room_repo.delete_by_room_id(room_id)
\ No newline at end of file
+        deleted = await self.chat_room_repo.delete_by_room_id(room_id)
+
+        # 삭제된 방의 복호화 평문이 캐시에 남지 않도록 무효화
+        if deleted and self.message_cache is not None:
+            self.message_cache.invalidate_room(room_id)
+
+        return deleted
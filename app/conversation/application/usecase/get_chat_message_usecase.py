@@ -1,58 +1,84 @@
-from app.conversation.infrastructure.orm.chat_message_feedback_orm import ChatFeedbackOrm
-from app.conversation.infrastructure.repository.chat_message_repository_impl import ChatMessageRepositoryImpl
+from typing import AsyncIterator
+
+from app.conversation.application.port.out.chat_message_repository_port import ChatMessageRepositoryPort
 from app.config.security.message_crypto import AESEncryption
+from app.conversation.domain.conversation.aggregate import Conversation
 
 class GetChatMessagesUseCase:
-    def __init__(self, chat_message_repo: ChatMessageRepositoryImpl, crypto_service: AESEncryption):
+    # before_id 만 주어졌을 때의 페이지 크기
+    DEFAULT_PAGE_SIZE = 50
+
+    def __init__(
+        self,
+        chat_message_repo: ChatMessageRepositoryPort,
+        crypto_service: AESEncryption,
+        message_cache=None,
+    ):
         self.chat_message_repo = chat_message_repo
         self.crypto_service = crypto_service
+        self.message_cache = message_cache
 
-    async def execute(self, room_id: str, account_id: int):
+    async def execute(
+        self,
+        room_id: str,
+        account_id: int,
+        before_id: int | None = None,
+        limit: int | None = None,
+    ):
         """
         채팅방의 메시지를 조회하고 복호화하여 반환합니다.
+        limit 이 주어지면 before_id 이전의 최근 limit 개만 반환합니다 (keyset pagination).
+        before_id 만 주어지면 DEFAULT_PAGE_SIZE 개씩 반환합니다.
         """
-        # 1. DB에서 해당 방의 모든 메시지 조회
-        messages = await self.chat_message_repo.find_by_room_id(room_id)
-        decrypted = []
+        # 1. 메시지 + 내 피드백을 outer join 한 번으로 조회 (메시지 수와 무관하게 쿼리 1회)
+        page_size = self.page_size(before_id, limit)
+        if page_size is None:
+            rows = await self.chat_message_repo.find_by_room_id_with_feedback(room_id, account_id)
+        else:
+            rows = await self.chat_message_repo.find_page_by_room_id_with_feedback(
+                room_id, account_id, before_id=before_id, limit=page_size
+            )
+
+        return [self._to_response(m, satisfaction) for m, satisfaction in rows]
+
+    @classmethod
+    def page_size(cls, before_id: int | None, limit: int | None) -> int | None:
+        """실제로 적용되는 페이지 크기 (None 이면 전체 조회)"""
+        if limit is None and before_id is None:
+            return None
+        return limit or cls.DEFAULT_PAGE_SIZE
+
+    async def stream(self, room_id: str, account_id: int) -> AsyncIterator[dict]:
+        """
+        메시지를 DB 에서 읽어오는 대로 한 건씩 복호화하여 흘려보냅니다.
+        """
+        async for m, satisfaction in self.chat_message_repo.stream_by_room_id_with_feedback(room_id, account_id):
+            yield self._to_response(m, satisfaction)
+
+    def _to_response(self, m, satisfaction) -> dict:
+        user_feedback_value = satisfaction.value if satisfaction else None
+
+        # ORM 객체(m)에서 직접 컬럼에 접근 (getattr를 활용해 안전하게 추출)
+        # m.content_enc, m.iv, m.message_id 등의 필드명을 가정합니다.
+        content_enc = getattr(m, 'content_enc', None)
 
-        for m in messages:
+        # 2. 메시지 복호화 로직 (캐시에 평문이 있으면 재사용)
+        if not content_enc:
             content_text = ""
+        else:
+            try:
+                content_text = Conversation.decrypt_message(m, self.crypto_service, self.message_cache)
+            except Exception as e:
+                content_text = "[복호화 오류]"
 
-            fb = self.chat_message_repo.db.query(ChatFeedbackOrm).filter(
-                ChatFeedbackOrm.message_id == getattr(m, 'id', None),
-                ChatFeedbackOrm.account_id == account_id
-            ).first()
-            user_feedback_value = fb.satisfaction.value if fb else None
-
-            # ORM 객체(m)에서 직접 컬럼에 접근 (getattr를 활용해 안전하게 추출)
-            # m.content_enc, m.iv, m.message_id 등의 필드명을 가정합니다.
-            content_enc = getattr(m, 'content_enc', None)
-            iv = getattr(m, 'iv', None)
-
-            # 2. 메시지 복호화 로직
-            if not content_enc:
-                content_text = ""
-            else:
-                try:
-                    target_iv = iv if (iv and len(iv) == 16) else None
-                    content_text = self.crypto_service.decrypt(
-                        ciphertext=content_enc,
-                        iv=target_iv
-                    )
-                except Exception as e:
-                    msg_id = getattr(m, 'message_id', getattr(m, 'id', 'unknown'))
-                    content_text = "[복호화 오류]"
-
-            # 3. 반환 데이터 조립
-            decrypted.append({
-                "message_id": getattr(m, 'message_id', getattr(m, 'id', None)),
-                "room_id": m.room_id,
-                "account_id": m.account_id,
-                "role": m.role.value if hasattr(m.role, 'value') else str(m.role),
-                "content": content_text,
-                "contents_type": getattr(m, 'contents_type', getattr(m, 'content_type', 'TEXT')),
-                "created_at": m.created_at,
-                "user_feedback": user_feedback_value
-            })
-
-        return decrypted
\ No newline at end of file
+        # 3. 반환 데이터 조립
+        return {
+            "message_id": getattr(m, 'message_id', getattr(m, 'id', None)),
+            "room_id": m.room_id,
+            "account_id": m.account_id,
+            "role": m.role.value if hasattr(m.role, 'value') else str(m.role),
+            "content": content_text,
+            "contents_type": getattr(m, 'contents_type', getattr(m, 'content_type', 'TEXT')),
+            "created_at": m.created_at,
+            "user_feedback": user_feedback_value
+        }
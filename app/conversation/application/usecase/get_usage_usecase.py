@@ -0,0 +1,22 @@
+from datetime import date, timedelta
+
+from app.conversation.application.port.out.usage_ledger_repository_port import UsageLedgerRepositoryPort
+
+
+class GetUsageUseCase:
+
+    def __init__(self, usage_ledger_repo: UsageLedgerRepositoryPort):
+        self.usage_ledger_repo = usage_ledger_repo
+
+    async def execute(self, account_id: int, days: int):
+        # 오늘 포함 최근 days 일의 일자별 토큰 사용량
+        end = date.today()
+        start = end - timedelta(days=days - 1)
+        daily = await self.usage_ledger_repo.sum_daily(account_id, start, end)
+        return {
+            "start": start,
+            "end": end,
+            "prompt_tokens": sum(d["prompt_tokens"] for d in daily),
+            "completion_tokens": sum(d["completion_tokens"] for d in daily),
+            "daily": daily,
+        }
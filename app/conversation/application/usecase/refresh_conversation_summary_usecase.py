@@ -0,0 +1,155 @@
+import logging
+
+from app.config.settings import settings
+from app.conversation.application.policy.summary_policy import SummaryPolicy
+from app.conversation.application.policy.usage_policy import UsagePolicy
+from app.conversation.application.port.out.conversation_summary_repository_port import (
+    ConversationSummaryRepositoryPort,
+)
+from app.conversation.application.port.out.llm_chat_port import TokenUsage
+from app.conversation.domain.chat_message.value_object import EncryptedContent
+from app.conversation.domain.conversation.aggregate import Conversation
+from app.conversation.domain.conversation.summary import ConversationSummary
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_INSTRUCTION = (
+    "당신은 연애·관계 상담 대화를 요약하는 도우미입니다. "
+    "상담을 이어가는 데 필요한 사실, 인물 관계, 감정의 흐름, 사용자의 고민을 빠짐없이 유지하면서 "
+    "이전 요약과 이어진 대화를 하나의 요약으로 한국어 10문장 이내로 정리하세요. 요약문만 출력하세요."
+)
+
+
+class RefreshConversationSummaryUseCase:
+    """
+    요약 이후 쌓인 오래된 턴을 기존 요약에 접어 넣어 새 요약을 저장한다.
+    매 턴이 아니라 SummaryPolicy 가 정한 주기마다만 LLM 을 호출한다.
+    """
+
+    def __init__(
+            self,
+            summary_repo: ConversationSummaryRepositoryPort,
+            llm_chat_port,
+            crypto_service,
+            message_cache=None,
+            usage_meter=None,
+            usage_ledger_repo=None,
+    ):
+        self.summary_repo = summary_repo
+        self.llm_chat_port = llm_chat_port
+        self.crypto_service = crypto_service
+        self.message_cache = message_cache
+        self.usage_meter = usage_meter
+        self.usage_ledger_repo = usage_ledger_repo
+
+    async def execute(
+            self,
+            room_id: str,
+            account_id: int,
+            previous: ConversationSummary | None,
+            messages: list,
+    ) -> ConversationSummary | None:
+        """
+        account_id: 요약 LLM 호출의 토큰 사용량을 기록 / 차감할 계정 (방 주인)
+        messages: 이전 요약 이후의 메시지 (id 오름차순)
+        갱신 시점이 아니거나 새로 저장한 요약이 없으면 None 을 반환합니다.
+        """
+        to_fold = SummaryPolicy.messages_to_fold(
+            messages,
+            refresh_every_turns=settings.CONVERSATION_SUMMARY_EVERY_TURNS,
+            keep_recent=settings.CONVERSATION_SUMMARY_KEEP_RECENT,
+        )
+        if not to_fold:
+            return None
+
+        # 예산을 넘는 구간은 오래된 쪽부터 예산에 맞는 조각으로 나눠 차례로 접는다
+        # (최신 쪽만 남기면 잘려 나간 턴이 요약에도 프롬프트 꼬리에도 들어가지 않음)
+        # 한 번에 최대 MAX_FOLDS 조각만 접고, 남은 구간은 다음 턴의 갱신에서 이어서 접는다
+        summary = previous
+        remaining = sorted(to_fold, key=lambda m: m.id)
+        for _ in range(max(settings.CONVERSATION_SUMMARY_MAX_FOLDS, 1)):
+            if not remaining:
+                break
+            folded = await self._fold(room_id, account_id, summary, remaining)
+            if folded is None:
+                break
+            summary, remaining = folded
+        return summary if summary is not previous else None
+
+    async def _fold(
+            self,
+            room_id: str,
+            account_id: int,
+            previous: ConversationSummary | None,
+            remaining: list,
+    ) -> tuple[ConversationSummary, list] | None:
+        """남은 구간 중 오래된 쪽부터 예산에 맞는 만큼을 요약에 접어 넣고 (새 요약, 남은 메시지) 를 반환"""
+        fold_conversation = Conversation(room=None, messages=remaining, summary=previous)
+        previous_text = fold_conversation.get_summary_text(self.crypto_service)
+        context_prefix = f"[이전 요약]\n{previous_text or '(없음)'}\n\n[이어진 대화]\n"
+        dialogue_budget = max(
+            settings.PROMPT_CONTEXT_MAX_TOKENS
+            - UsagePolicy.calculate_message_token(SUMMARY_INSTRUCTION)
+            - UsagePolicy.calculate_message_token(context_prefix),
+            0,
+        )
+        dialogue, folded = fold_conversation.get_oldest_prompt_context(
+            self.crypto_service,
+            max_tokens=dialogue_budget,
+            token_counter=UsagePolicy.calculate_token,
+            message_cache=self.message_cache,
+        )
+
+        # folded 는 remaining 의 앞쪽 연속 구간 → 그 마지막 id 까지만 요약된 것으로 표시
+        covered_message_id = folded[-1].id
+
+        prompt_messages = [
+            {"role": "system", "content": SUMMARY_INSTRUCTION},
+            {"role": "user", "content": context_prefix + dialogue},
+        ]
+
+        summary_chunks: list[str] = []
+        usage = TokenUsage()
+        async for chunk in self.llm_chat_port.stream_chat(prompt_messages, usage=usage):
+            summary_chunks.append(chunk)
+        summary_text = "".join(summary_chunks).strip()
+        UsagePolicy.fill_estimated_usage(usage, prompt_messages, summary_text)
+
+        # 사용 원장은 요약 행과 같은 트랜잭션으로 기록 (요약은 특정 응답 메시지에 속하지 않음)
+        if self.usage_ledger_repo is not None:
+            await self.usage_ledger_repo.append(
+                account_id=account_id,
+                usage=usage,
+                room_id=room_id,
+                message_id=None,
+            )
+
+        if not summary_text:
+            logger.warning("빈 요약 응답으로 갱신을 건너뜁니다. room_id=%s", room_id)
+            # 빈 응답도 토큰은 쓴 것이므로 원장만 확정
+            if self.usage_ledger_repo is not None:
+                await self.usage_ledger_repo.db.commit()
+            await self._record_usage(account_id, usage)
+            return None
+
+        encrypted, iv = self.crypto_service.encrypt(summary_text)
+        # 조각마다 저장 → 중간에 실패해도 이미 접은 구간은 유지되고 나머지는 다음 주기에 다시 접음
+        summary = await self.summary_repo.save(
+            room_id=room_id,
+            covered_message_id=covered_message_id,
+            content=EncryptedContent(
+                content_enc=encrypted,
+                iv=iv,
+                enc_version=self.crypto_service.get_version(),
+            ),
+        )
+        await self._record_usage(account_id, usage)
+        return summary, remaining[len(folded):]
+
+    async def _record_usage(self, account_id: int, usage: TokenUsage) -> None:
+        if self.usage_meter is not None:
+            await self.usage_meter.record_usage(
+                account_id,
+                input_tokens=usage.prompt_tokens,
+                output_tokens=usage.completion_tokens,
+            )
@@ -1,6 +1,19 @@
+import logging
 from typing import AsyncIterator
 from fastapi import HTTPException
 
+from app.config.settings import settings
+from app.conversation.application.policy.usage_policy import UsagePolicy
+from app.conversation.application.port.out.llm_chat_port import TokenUsage
+
+logger = logging.getLogger(__name__)
+
+# 시스템 지침: 상담사의 성격과 제약 사항 정의
+SYSTEM_INSTRUCTION = (
+    "당신은 연애, 커플, 이혼 등 관계에서 발생하는 감정과 대화 문제를 함께 나누는 따뜻한 대화 동반자입니다. "
+    "사용자를 진단하거나 분석하려 하지 마세요. 사용자가 스스로 생각을 정리할 수 있도록 경청하고 공감하며 대화를 이어가세요."
+)
+
 
 class StreamChatUsecase:
     def __init__(
@@ -10,12 +23,22 @@ class StreamChatUsecase:
             llm_chat_port,
             usage_meter,
             crypto_service,
+            summary_repo=None,
+            message_cache=None,
+            usage_ledger_repo=None,
     ):
         self.chat_room_repo = chat_room_repo
         self.chat_message_repo = chat_message_repo
         self.llm_chat_port = llm_chat_port
         self.usage_meter = usage_meter
         self.crypto_service = crypto_service
+        self.summary_repo = summary_repo
+        self.message_cache = message_cache
+        self.usage_ledger_repo = usage_ledger_repo
+        # 응답 완료 후 요약 갱신에 넘길 (room_id, 이전 요약, 요약 이후 메시지)
+        self.pending_summary_refresh = None
+        # 응답 완료 후 저장된 메시지 id (SSE done 이벤트 등)
+        self.saved_message_ids = None
 
     async def execute(
             self,
@@ -23,16 +46,19 @@ class StreamChatUsecase:
             account_id: int,
             message: str,
             contents_type: str,
-    ) -> AsyncIterator[bytes]:
-
-        await self.usage_meter.check_available(account_id)
+    ) -> AsyncIterator[str]:
+        # 쿼터 확인(usage_meter.check_available)은 응답 스트림을 열기 전에 호출 측에서 수행
 
         # 1. 데이터 로드 및 애그리거트 생성
+        # 요약이 있으면 요약에 포함된 메시지는 로드하지 않고 이후 꼬리만 가져옴
         room_orm = await self.chat_room_repo.find_by_id(room_id)
-        msg_orms = await self.chat_message_repo.find_by_room_id(room_id)
+        summary = await self.summary_repo.find_latest(room_id) if self.summary_repo else None
+        msg_orms = await self.chat_message_repo.find_by_room_id_after(
+            room_id, summary.covered_message_id if summary else None
+        )
 
         from app.conversation.domain.conversation.aggregate import Conversation
-        conversation = Conversation(room=room_orm, messages=msg_orms)
+        conversation = Conversation(room=room_orm, messages=msg_orms, summary=summary)
 
         if not conversation.is_active():
             raise HTTPException(status_code=400, detail="채팅방이 활성 상태가 아닙니다.")
@@ -49,35 +75,53 @@ class StreamChatUsecase:
             enc_version=self.crypto_service.get_version(),
             contents_type=contents_type,
         )
+        # 유저 메시지를 먼저 확정 → LLM 스트리밍 동안 트랜잭션 / DB 커넥션을 잡지 않음
+        await self.chat_message_repo.db.commit()
 
         # 3. 프롬프트 구성 (말씀하신 페르소나 적용)
-        # 시스템 지침: 상담사의 성격과 제약 사항 정의
-        system_instruction = (
-            "당신은 연애, 커플, 이혼 등 관계에서 발생하는 감정과 대화 문제를 함께 나누는 따뜻한 대화 동반자입니다. "
-            "사용자를 진단하거나 분석하려 하지 마세요. 사용자가 스스로 생각을 정리할 수 있도록 경청하고 공감하며 대화를 이어가세요.\n\n"
-        )
+        # 고정 system 지침을 맨 앞에 두어 매 턴 동일한 접두부 → 제공자 측 프롬프트 캐싱 적용
+        prompt_messages = [{"role": "system", "content": SYSTEM_INSTRUCTION}]
 
-        # 히스토리 컨텍스트: 애그리거트에서 복호화된 대화 이력을 가져옴
-        history_context = conversation.get_prompt_context(self.crypto_service)
+        # 요약 컨텍스트: 오래된 대화는 누적 요약으로 대체 (요약 갱신 전까지 접두부 유지)
+        summary_text = conversation.get_summary_text(self.crypto_service)
+        if summary_text:
+            prompt_messages.append({"role": "system", "content": f"[이전 대화 요약]\n{summary_text}"})
 
-        # 최종 프롬프트 조립
-        full_prompt = (
-            f"{system_instruction}"
-            f"{history_context}"
-            f"사용자: {message}\n"
-            f"상담사: "
+        # 히스토리 컨텍스트: 토큰 예산 안에서 최신 대화부터 복호화된 이력을 가져옴
+        history_budget = max(
+            settings.PROMPT_CONTEXT_MAX_TOKENS
+            - sum(UsagePolicy.calculate_message_token(m["content"]) for m in prompt_messages)
+            - UsagePolicy.calculate_message_token(message),
+            0,
         )
+        prompt_messages.extend(conversation.get_prompt_messages(
+            self.crypto_service,
+            max_tokens=history_budget,
+            token_counter=UsagePolicy.calculate_message_token,
+            message_cache=self.message_cache,
+        ))
+        prompt_messages.append({"role": "user", "content": message})
 
         # 4. AI 응답 스트리밍
-        assistant_full_message = ""
-        async for chunk in self.llm_chat_port.call_gpt(full_prompt):
-            assistant_full_message += chunk
-            yield chunk.encode("utf-8")
+        # 조각은 리스트에 모았다가 끝에서 한 번만 이어 붙임 (응답 길이에 선형)
+        assistant_chunks: list[str] = []
+        usage = TokenUsage()
+        try:
+            async for chunk in self.llm_chat_port.stream_chat(prompt_messages, usage=usage):
+                assistant_chunks.append(chunk)
+                yield chunk
+        except BaseException:
+            # 중간에 끊겨도 제공자 호출 비용은 발생 → 받은 부분까지 원장 / 쿼터에 기록한 뒤 그대로 전파
+            await self._record_failed_usage(room_id, account_id, usage, prompt_messages, "".join(assistant_chunks))
+            raise
+        assistant_full_message = "".join(assistant_chunks)
+        # 제공자가 보고한 토큰 수 사용, 없으면 tokenizer 로 계산
+        UsagePolicy.fill_estimated_usage(usage, prompt_messages, assistant_full_message)
 
-        # 5. AI 메시지 저장 (부모: 유저 메시지 ID)
+        # 5. AI 메시지 저장 (부모: 유저 메시지 ID) - 커넥션은 저장 / 커밋하는 짧은 트랜잭션 동안만 사용
         assistant_encrypted, assistant_iv = self.crypto_service.encrypt(assistant_full_message)
 
-        await self.chat_message_repo.save_message(
+        saved_assistant = await self.chat_message_repo.save_message(
             room_id=room_id,
             account_id=account_id,
             role="ASSISTANT",
@@ -88,6 +132,67 @@ class StreamChatUsecase:
             contents_type=contents_type,
         )
 
+        # 사용 원장은 응답 메시지와 같은 트랜잭션으로 기록
+        if self.usage_ledger_repo is not None:
+            await self.usage_ledger_repo.append(
+                account_id=account_id,
+                usage=usage,
+                room_id=room_id,
+                message_id=saved_assistant.id,
+            )
+
         # 6. 세션 확정 및 기록
-        self.chat_message_repo.db.commit()
-        await self.usage_meter.record_usage(account_id, len(message), len(assistant_full_message))
+        await self.chat_message_repo.db.commit()
+
+        # 방금 저장한 평문을 캐시에 넣어 다음 턴에서 다시 복호화하지 않도록 함
+        if self.message_cache is not None:
+            self.message_cache.put(saved_user.id, saved_user.enc_version, room_id, message)
+            self.message_cache.put(saved_assistant.id, saved_assistant.enc_version, room_id, assistant_full_message)
+        await self.usage_meter.record_usage(
+            account_id,
+            input_tokens=usage.prompt_tokens,
+            output_tokens=usage.completion_tokens,
+        )
+
+        self.saved_message_ids = {
+            "room_id": room_id,
+            "user_message_id": saved_user.id,
+            "assistant_message_id": saved_assistant.id,
+        }
+
+        # 7. 요약 갱신 대상 기록 (실제 갱신 여부/시점은 RefreshConversationSummaryUseCase 가 판단)
+        self.pending_summary_refresh = (room_id, summary, [*msg_orms, saved_user, saved_assistant])
+
+    async def _record_failed_usage(
+            self,
+            room_id: str,
+            account_id: int,
+            usage: TokenUsage,
+            prompt_messages: list[dict],
+            partial_message: str,
+    ) -> None:
+        """실패한 스트림의 사용량 기록 (응답 메시지가 없으므로 원장 message_id 는 비움)
+
+        기록에 실패해도 원래 오류를 가리지 않도록 로그만 남긴다.
+        """
+        UsagePolicy.fill_estimated_usage(usage, prompt_messages, partial_message)
+        if self.usage_ledger_repo is not None:
+            try:
+                await self.usage_ledger_repo.append(
+                    account_id=account_id,
+                    usage=usage,
+                    room_id=room_id,
+                    message_id=None,
+                )
+                await self.chat_message_repo.db.commit()
+            except Exception:
+                logger.warning("실패한 응답의 사용 원장 기록 실패 room_id=%s", room_id, exc_info=True)
+                await self.chat_message_repo.db.rollback()
+        try:
+            await self.usage_meter.record_usage(
+                account_id,
+                input_tokens=usage.prompt_tokens,
+                output_tokens=usage.completion_tokens,
+            )
+        except Exception:
+            logger.warning("실패한 응답의 사용량 기록 실패 account_id=%s", account_id, exc_info=True)
@@ -1,12 +1,14 @@
 class Conversation:
-    def __init__(self, room, messages):
+    def __init__(self, room, messages, summary=None):
         self.room = room
+        # summary 가 있으면 messages 는 요약 이후의 메시지(꼬리)만 담는다
         self.messages = messages
+        self.summary = summary
 
     def get_last_id(self) -> int | None:
         """현재 방의 마지막 메시지 ID 추출 (다음 메시지의 부모)"""
         if not self.messages:
-            return None
+            return self.summary.covered_message_id if self.summary else None
         # ORM 객체의 id 필드 기준
         return max([m.id for m in self.messages])
 
@@ -14,20 +16,134 @@ class Conversation:
         # ChatRoomOrm의 status 필드 확인
         return getattr(self.room, "status", "ACTIVE") == "ACTIVE"
 
-    def get_prompt_context(self, crypto_service) -> str:
-        """기존 메시지들을 복호화하여 프롬프트 텍스트로 변환"""
-        context = ""
-        # ID 순서대로 정렬하여 대화 흐름 보장
-        sorted_msgs = sorted(self.messages, key=lambda x: x.id)
+    def get_summary_text(self, crypto_service) -> str:
+        """저장된 누적 요약을 복호화 (없거나 복호화 실패 시 빈 문자열)"""
+        if self.summary is None:
+            return ""
+        content = self.summary.content
+        try:
+            return crypto_service.decrypt(
+                ciphertext=content.content_enc,
+                iv=content.iv if (content.iv and len(content.iv) == 16) else None
+            )
+        except Exception:
+            return ""
+
+    def get_prompt_context(
+            self,
+            crypto_service,
+            max_tokens: int | None = None,
+            token_counter=None,
+            message_cache=None,
+    ) -> str:
+        """기존 메시지들을 복호화하여 프롬프트 텍스트로 변환
+
+        max_tokens 가 주어지면 최신 메시지부터 거슬러 올라가며 예산을 넘기 직전에 멈추고,
+        선택된 메시지만 시간 순서대로 이어 붙인다. (오래된 메시지는 복호화하지 않음)
+        message_cache 가 주어지면 이미 복호화한 메시지는 캐시의 평문을 재사용한다.
+        """
+        def render(role: str, text: str) -> tuple[str, str]:
+            role_label = "상담사" if role == "assistant" else "사용자"
+            line = f"{role_label}: {text}\n"
+            return line, line
+
+        selected = self._select_recent(crypto_service, max_tokens, token_counter, message_cache, render)
+        return "".join(selected)
+
+    def get_prompt_messages(
+            self,
+            crypto_service,
+            max_tokens: int | None = None,
+            token_counter=None,
+            message_cache=None,
+    ) -> list[dict]:
+        """기존 메시지들을 복호화하여 LLM 역할별 메시지 배열로 변환
+
+        get_prompt_context 와 같은 예산 규칙을 따르며,
+        [{"role": "user|assistant", "content": "..."}] 를 시간 순서대로 반환한다.
+        """
+        def render(role: str, text: str) -> tuple[dict, str]:
+            return {"role": role, "content": text}, text
+
+        return self._select_recent(crypto_service, max_tokens, token_counter, message_cache, render)
+
+    def get_oldest_prompt_context(
+            self,
+            crypto_service,
+            max_tokens: int,
+            token_counter=None,
+            message_cache=None,
+    ) -> tuple[str, list]:
+        """오래된 메시지부터 예산 안에 들어가는 만큼 복호화하여 (프롬프트 텍스트, 포함된 메시지) 를 반환
+
+        요약 접기용: 포함된 메시지는 항상 오래된 쪽부터 끊김 없는 구간이며,
+        한 건이 예산보다 크더라도 최소 한 건은 포함해 접기가 멈추지 않도록 한다.
+        복호화에 실패한 메시지는 텍스트 없이 포함된 것으로 본다 (다시 시도해도 읽을 수 없음).
+        """
+        lines = []
+        included = []
+        used_tokens = 0
+        count_tokens = token_counter or len
+        for m in sorted(self.messages, key=lambda x: x.id):
+            try:
+                decrypted_txt = self.decrypt_message(m, crypto_service, message_cache)
+            except Exception:
+                included.append(m)
+                continue
+
+            role_label = "상담사" if str(m.role).upper() == "ASSISTANT" else "사용자"
+            line = f"{role_label}: {decrypted_txt}\n"
+            line_tokens = count_tokens(line)
+            if lines and used_tokens + line_tokens > max_tokens:
+                break
+            used_tokens += line_tokens
+            lines.append(line)
+            included.append(m)
+
+        return "".join(lines), included
+
+    def _select_recent(self, crypto_service, max_tokens, token_counter, message_cache, render) -> list:
+        selected = []
+        used_tokens = 0
+        # 카운터가 없으면 글자 수를 그대로 사용 (토큰 수보다 크게 잡히므로 예산을 넘지 않음)
+        count_tokens = token_counter or len
+        # 최신 메시지부터 역순으로 탐색
+        sorted_msgs = sorted(self.messages, key=lambda x: x.id, reverse=True)
         for m in sorted_msgs:
             try:
-                # 필드명은 content_enc와 iv로 매칭
-                decrypted_txt = crypto_service.decrypt(
-                    ciphertext=m.content_enc,
-                    iv=m.iv if (m.iv and len(m.iv) == 16) else None
-                )
-                role_label = "상담사" if str(m.role).upper() == "ASSISTANT" else "사용자"
-                context += f"{role_label}: {decrypted_txt}\n"
+                decrypted_txt = self.decrypt_message(m, crypto_service, message_cache)
             except Exception:
                 continue
-        return context
\ No newline at end of file
+
+            role = "assistant" if str(m.role).upper() == "ASSISTANT" else "user"
+            item, counted_text = render(role, decrypted_txt)
+
+            if max_tokens is not None:
+                item_tokens = count_tokens(counted_text)
+                if used_tokens + item_tokens > max_tokens:
+                    break
+                used_tokens += item_tokens
+
+            selected.append(item)
+
+        # 다시 시간 순서(오래된 → 최신)로
+        selected.reverse()
+        return selected
+
+    @staticmethod
+    def decrypt_message(m, crypto_service, message_cache=None) -> str:
+        """메시지 한 건 복호화 (캐시 적중 시 AES 복호화 생략)"""
+        enc_version = getattr(m, "enc_version", None)
+        if message_cache is not None:
+            cached = message_cache.get(m.id, enc_version)
+            if cached is not None:
+                return cached
+
+        # 필드명은 content_enc와 iv로 매칭
+        decrypted_txt = crypto_service.decrypt(
+            ciphertext=m.content_enc,
+            iv=m.iv if (m.iv and len(m.iv) == 16) else None
+        )
+        if message_cache is not None:
+            message_cache.put(m.id, enc_version, m.room_id, decrypted_txt)
+        return decrypted_txt
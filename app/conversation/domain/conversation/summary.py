@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+from app.conversation.domain.chat_message.value_object import EncryptedContent
+
+
+@dataclass(frozen=True)
+class ConversationSummary:
+    """
+    방의 오래된 대화를 압축한 누적 요약
+    covered_message_id 이하의 메시지는 요약에 포함되어 있으므로 프롬프트에 다시 싣지 않는다.
+    """
+    room_id: str
+    covered_message_id: int
+    content: EncryptedContent
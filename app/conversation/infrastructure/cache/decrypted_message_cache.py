@@ -0,0 +1,100 @@
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+
+class DecryptedMessageCache:
+    """
+    복호화된 메시지 평문의 프로세스 내 LRU 캐시
+    - 키: (message_id, enc_version) → 키 버전이 바뀐 메시지는 다른 항목으로 취급
+    - 항목 수 / 메모리(바이트) 상한을 넘으면 가장 오래 쓰이지 않은 항목부터 제거
+    - ttl_seconds 가 지난 항목은 조회 시 만료 처리
+    """
+
+    def __init__(self, max_entries: int = 10000, max_bytes: int = 64 * 1024 * 1024, ttl_seconds: float = 600):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+
+        # key → (room_id, plaintext, size, expires_at)
+        self._entries: OrderedDict[tuple[int, int | None], tuple[str, str, int, float]] = OrderedDict()
+        # room_id → 해당 방의 키 집합 (방 삭제 시 무효화용)
+        self._room_index: dict[str, set[tuple[int, int | None]]] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, message_id: int, enc_version: int | None) -> str | None:
+        key = (message_id, enc_version)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            if entry[3] < time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, message_id: int, enc_version: int | None, room_id: str, plaintext: str) -> None:
+        key = (message_id, enc_version)
+        size = sys.getsizeof(plaintext)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (room_id, plaintext, size, time.monotonic() + self.ttl_seconds)
+            self._room_index.setdefault(room_id, set()).add(key)
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+
+    def invalidate_room(self, room_id: str) -> None:
+        with self._lock:
+            for key in self._room_index.pop(room_id, set()):
+                entry = self._entries.pop(key, None)
+                if entry is not None:
+                    self._bytes -= entry[2]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._room_index.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def _remove(self, key: tuple[int, int | None]) -> None:
+        # lock 을 잡은 상태에서만 호출
+        room_id, _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+        room_keys = self._room_index.get(room_id)
+        if room_keys is not None:
+            room_keys.discard(key)
+            if not room_keys:
+                del self._room_index[room_id]
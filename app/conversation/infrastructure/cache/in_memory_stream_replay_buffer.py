@@ -0,0 +1,141 @@
+import asyncio
+import itertools
+import json
+import time
+from collections import deque
+
+from app.conversation.application.port.out.stream_replay_buffer_port import StreamReplayBufferPort
+
+
+class _RoomStream:
+    __slots__ = ("events", "expires_at", "changed")
+
+    def __init__(self, max_events: int):
+        # (event_id, event, data) - event_id 는 프로세스 전체에서 증가하는 정수
+        self.events: deque[tuple[int, str, str]] = deque(maxlen=max_events)
+        self.expires_at = 0.0
+        self.changed = asyncio.Condition()
+
+
+class InMemoryStreamReplayBuffer(StreamReplayBufferPort):
+    """
+    워커 프로세스 메모리 기반 재생 버퍼 (단일 워커 / 로컬 개발용)
+    - 같은 워커의 구독자는 Redis 왕복 없이 Condition 으로 바로 깨어남
+    - 다른 워커로 재접속하면 이어 받을 수 없으므로 다중 워커 배포는 RedisStreamReplayBuffer 사용
+    """
+
+    READ_COUNT = 500
+
+    def __init__(self, max_events: int = 2000, ttl_seconds: int = 600, claim_seconds: int = 60):
+        self.max_events = max_events
+        self.ttl_seconds = ttl_seconds
+        self.claim_seconds = claim_seconds
+        self._streams: dict[str, _RoomStream] = {}
+        self._ids = itertools.count(1)
+        # room_id → (owner, 만료 시각)
+        self._claims: dict[str, tuple[str, float]] = {}
+
+    def _get(self, room_id: str) -> _RoomStream | None:
+        stream = self._streams.get(room_id)
+        if stream is not None and stream.expires_at <= time.monotonic():
+            del self._streams[room_id]
+            return None
+        return stream
+
+    def _evict_expired(self) -> None:
+        now = time.monotonic()
+        for room_id in [r for r, s in self._streams.items() if s.expires_at <= now]:
+            del self._streams[room_id]
+
+    async def _append(self, stream: _RoomStream, event: str, data: str) -> str:
+        event_id = next(self._ids)
+        stream.events.append((event_id, event, data))
+        stream.expires_at = time.monotonic() + self.ttl_seconds
+        async with stream.changed:
+            stream.changed.notify_all()
+        return str(event_id)
+
+    def _claim_owner(self, room_id: str) -> str | None:
+        claim = self._claims.get(room_id)
+        if claim is None or claim[1] <= time.monotonic():
+            return None
+        return claim[0]
+
+    async def claim(self, room_id: str, owner: str) -> bool:
+        if self._claim_owner(room_id) is not None:
+            return False
+        self._claims[room_id] = (owner, time.monotonic() + self.claim_seconds)
+        return True
+
+    async def renew_claim(self, room_id: str, owner: str) -> bool:
+        if self._claim_owner(room_id) != owner:
+            return False
+        self._claims[room_id] = (owner, time.monotonic() + self.claim_seconds)
+        return True
+
+    async def release_claim(self, room_id: str, owner: str) -> None:
+        claim = self._claims.get(room_id)
+        if claim is not None and claim[0] == owner:
+            del self._claims[room_id]
+
+    async def start(self, room_id: str, stream_id: str) -> str:
+        self._evict_expired()
+        previous = self._streams.get(room_id)
+        stream = self._streams[room_id] = _RoomStream(self.max_events)
+        event_id = await self._append(stream, "start", json.dumps({"stream_id": stream_id}))
+        if previous is not None:
+            # 이전 스트림을 기다리던 구독자는 새 스트림에서 다시 읽음
+            async with previous.changed:
+                previous.changed.notify_all()
+        return event_id
+
+    async def append(self, room_id: str, event: str, data: str) -> str:
+        stream = self._get(room_id)
+        if stream is None:
+            stream = self._streams[room_id] = _RoomStream(self.max_events)
+        return await self._append(stream, event, data)
+
+    async def read(
+        self,
+        room_id: str,
+        after_id: str | None = None,
+        block_ms: int | None = None,
+    ) -> list[tuple[str, str, str]]:
+        after = int(after_id) if after_id else 0
+
+        events = self._read_after(room_id, after)
+        stream = self._get(room_id)
+        if events or not block_ms or stream is None:
+            return events
+
+        try:
+            async with stream.changed:
+                # 락을 잡는 사이 기록된 이벤트가 있으면 기다리지 않음
+                events = self._read_after(room_id, after)
+                if events:
+                    return events
+                await asyncio.wait_for(stream.changed.wait(), timeout=block_ms / 1000)
+        except asyncio.TimeoutError:
+            return []
+        return self._read_after(room_id, after)
+
+    def _read_after(self, room_id: str, after: int) -> list[tuple[str, str, str]]:
+        stream = self._get(room_id)
+        if stream is None:
+            return []
+
+        # 최신 이벤트부터 거슬러 올라가며 after 이후만 수집
+        newer = []
+        for event in reversed(stream.events):
+            if event[0] <= after:
+                break
+            newer.append(event)
+        newer.reverse()
+        return [(str(event_id), event, data) for event_id, event, data in newer[:self.READ_COUNT]]
+
+    async def exists(self, room_id: str) -> bool:
+        return self._get(room_id) is not None
+
+    def is_valid_event_id(self, event_id: str) -> bool:
+        # int() 는 공백 / 부호 / 전각 숫자도 받아들이므로 ASCII 숫자만 허용
+        return event_id.isascii() and event_id.isdigit()
@@ -0,0 +1,148 @@
+import asyncio
+import json
+import re
+
+import redis.asyncio as aioredis
+
+from app.config.redis_config import get_async_redis
+from app.conversation.application.port.out.stream_replay_buffer_port import StreamReplayBufferPort
+
+# Redis Stream 엔트리 id: <밀리초>-<순번> (각각 부호 없는 64비트 정수)
+_EVENT_ID_PATTERN = re.compile(r"([0-9]{1,20})-([0-9]{1,20})")
+_MAX_ID_PART = 2 ** 64 - 1
+
+# 선점한 owner 일 때만 연장 / 해제 (만료 뒤 다른 워커가 잡은 선점은 건드리지 않음)
+# KEYS: 선점 키 / ARGV: owner, (연장 시) 선점 길이(ms) / 반환: 1 처리, 0 owner 아님
+_RENEW_CLAIM_LUA = """
+if redis.call('GET', KEYS[1]) ~= ARGV[1] then
+  return 0
+end
+redis.call('PEXPIRE', KEYS[1], ARGV[2])
+return 1
+"""
+
+_RELEASE_CLAIM_LUA = """
+if redis.call('GET', KEYS[1]) ~= ARGV[1] then
+  return 0
+end
+redis.call('DEL', KEYS[1])
+return 1
+"""
+
+
+class RedisStreamReplayBuffer(StreamReplayBufferPort):
+    """
+    Redis Stream 기반 재생 버퍼 (키: chat_stream:{room_id})
+    - event_id 는 Redis Stream 엔트리 id (시간 순 증가) → SSE id / Last-Event-ID 로 그대로 사용
+    - MAXLEN ~ max_events 로 길이 제한, 마지막 기록 후 ttl_seconds 뒤 만료
+    - 이 워커가 기록 중인 스트림의 구독자는 XREAD BLOCK 대신 프로세스 내 이벤트로 깨어남
+      (구독자마다 Redis 커넥션을 붙잡으면 동시 스트림 수가 커넥션 풀 크기에 묶임)
+    - 방 선점(키: chat_stream_lock:{room_id}) 은 SET NX PX 로 워커 전체에서 한 번만 성공
+      → 다른 워커가 기록 중인 스트림을 start 로 지우지 않음
+    """
+
+    KEY_PREFIX = "chat_stream:"
+    CLAIM_KEY_PREFIX = "chat_stream_lock:"
+
+    def __init__(
+        self,
+        redis_client: aioredis.Redis | None = None,
+        max_events: int = 2000,
+        ttl_seconds: int = 600,
+        claim_seconds: int = 60,
+    ):
+        self._redis = redis_client or get_async_redis()
+        self.max_events = max_events
+        self.ttl_seconds = ttl_seconds
+        self.claim_ms = claim_seconds * 1000
+        self._renew_claim_script = self._redis.register_script(_RENEW_CLAIM_LUA)
+        self._release_claim_script = self._redis.register_script(_RELEASE_CLAIM_LUA)
+        # room_id → 다음 기록 때 set 되는 이벤트 (이 워커가 기록 중인 스트림만)
+        self._local_appends: dict[str, asyncio.Event] = {}
+
+    def _make_key(self, room_id: str) -> str:
+        return f"{self.KEY_PREFIX}{room_id}"
+
+    def _make_claim_key(self, room_id: str) -> str:
+        return f"{self.CLAIM_KEY_PREFIX}{room_id}"
+
+    async def claim(self, room_id: str, owner: str) -> bool:
+        return bool(await self._redis.set(self._make_claim_key(room_id), owner, nx=True, px=self.claim_ms))
+
+    async def renew_claim(self, room_id: str, owner: str) -> bool:
+        return bool(await self._renew_claim_script(keys=[self._make_claim_key(room_id)], args=[owner, self.claim_ms]))
+
+    async def release_claim(self, room_id: str, owner: str) -> None:
+        await self._release_claim_script(keys=[self._make_claim_key(room_id)], args=[owner])
+
+    async def start(self, room_id: str, stream_id: str) -> str:
+        key = self._make_key(room_id)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            pipe.xadd(key, {"event": "start", "data": json.dumps({"stream_id": stream_id})})
+            pipe.expire(key, self.ttl_seconds)
+            _, event_id, _ = await pipe.execute()
+        self._notify_local(room_id, ended=False)
+        return event_id
+
+    async def append(self, room_id: str, event: str, data: str) -> str:
+        key = self._make_key(room_id)
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.xadd(key, {"event": event, "data": data}, maxlen=self.max_events, approximate=True)
+            pipe.expire(key, self.ttl_seconds)
+            event_id, _ = await pipe.execute()
+        if room_id in self._local_appends:
+            self._notify_local(room_id, ended=event in self.TERMINAL_EVENTS)
+        return event_id
+
+    def _notify_local(self, room_id: str, ended: bool) -> None:
+        previous = self._local_appends.pop(room_id, None)
+        if not ended:
+            self._local_appends[room_id] = asyncio.Event()
+        if previous is not None:
+            previous.set()
+
+    async def read(
+        self,
+        room_id: str,
+        after_id: str | None = None,
+        block_ms: int | None = None,
+    ) -> list[tuple[str, str, str]]:
+        # 읽기 전에 이벤트를 잡아 두어야 읽은 직후의 기록도 놓치지 않음
+        appended = self._local_appends.get(room_id)
+        if appended is None or not block_ms:
+            return await self._xread(room_id, after_id, block_ms)
+
+        events = await self._xread(room_id, after_id)
+        if events:
+            return events
+        try:
+            await asyncio.wait_for(appended.wait(), timeout=block_ms / 1000)
+        except asyncio.TimeoutError:
+            return []
+        return await self._xread(room_id, after_id)
+
+    async def _xread(
+        self,
+        room_id: str,
+        after_id: str | None,
+        block_ms: int | None = None,
+    ) -> list[tuple[str, str, str]]:
+        result = await self._redis.xread(
+            {self._make_key(room_id): after_id or "0"},
+            block=block_ms,
+            count=500,
+        )
+        if not result:
+            return []
+
+        _, entries = result[0]
+        return [(event_id, fields["event"], fields["data"]) for event_id, fields in entries]
+
+    async def exists(self, room_id: str) -> bool:
+        return await self._redis.exists(self._make_key(room_id)) > 0
+
+    def is_valid_event_id(self, event_id: str) -> bool:
+        # 형식이 틀린 id 를 XREAD 에 넘기면 ResponseError → 이미 시작된 응답 스트림이 깨짐
+        match = _EVENT_ID_PATTERN.fullmatch(event_id)
+        return match is not None and all(int(part) <= _MAX_ID_PART for part in match.groups())
@@ -0,0 +1,92 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+from app.conversation.application.exception.generation_exception import GenerationInProgressException
+from app.conversation.application.usecase.chat_stream_replay_usecase import ChatStreamReplayUseCase
+
+logger = logging.getLogger(__name__)
+
+
+class GenerationTaskManager:
+    """
+    방별 응답 생성 작업(asyncio.Task) 레지스트리 (워커 프로세스 단위)
+    - 생성 / 암호화 / 저장은 HTTP 요청과 분리된 작업에서 진행하고, 결과는 재생 버퍼(fan-out 채널)에만 기록
+    - HTTP 핸들러는 버퍼를 구독만 하므로 느린 클라이언트가 DB 세션 / 커넥션을 붙잡지 않음
+    - 같은 방에서 생성이 진행 중이면 새 생성을 거부 (응답 기록이 끝나면 바로 해제)
+      워커 안에서는 _tasks 로, 워커 사이에서는 재생 버퍼의 방 선점(ChatStreamReplayUseCase.start)으로 막음
+    - 요약 갱신처럼 응답 뒤에 이어지는 작업은 spawn 으로 방 점유 없이 실행
+    - 종료 시 진행 중인 작업을 grace 동안 기다린 뒤 남은 작업은 취소
+    """
+
+    def __init__(self, replay_uc: ChatStreamReplayUseCase):
+        self.replay_uc = replay_uc
+        # room_id → 작업 (버퍼 준비 중인 방은 None 으로 선점)
+        self._tasks: dict[str, asyncio.Task | None] = {}
+        # 방을 점유하지 않는 후속 작업 (완료 전에 GC 되지 않도록 참조 유지)
+        self._background: set[asyncio.Task] = set()
+
+    async def submit(self, room_id: str, job: Callable[[str], Awaitable[None]]) -> str:
+        """
+        방의 새 스트림을 열고 job(stream_id) 를 백그라운드 작업으로 실행, stream_id 반환
+        job 은 ChatStreamReplayUseCase.publish 로 delta / done 을 기록해야 한다.
+        """
+        if room_id in self._tasks:
+            raise GenerationInProgressException(room_id)
+
+        # await 전에 선점해야 같은 워커에 동시에 들어온 요청이 버퍼 선점 왕복까지 가지 않음
+        self._tasks[room_id] = None
+        try:
+            stream_id = await self.replay_uc.start(room_id)
+        except BaseException:
+            del self._tasks[room_id]
+            raise
+
+        self._tasks[room_id] = asyncio.create_task(
+            self._run(room_id, stream_id, job), name=f"chat-generation:{room_id}"
+        )
+        return stream_id
+
+    def spawn(self, coro: Awaitable[None]) -> asyncio.Task:
+        """방을 점유하지 않는 후속 작업 실행 (종료 시 함께 정리)"""
+        task = asyncio.ensure_future(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+        return task
+
+    async def _run(self, room_id: str, stream_id: str, job: Callable[[str], Awaitable[None]]) -> None:
+        try:
+            # 버퍼의 방 선점(워커 공통)은 생성 동안 연장하고 종료 이벤트를 남긴 뒤 해제
+            async with self.replay_uc.hold(room_id, stream_id):
+                try:
+                    await job(stream_id)
+                except asyncio.CancelledError:
+                    # 구독자가 버퍼 만료까지 기다리지 않도록 종료 이벤트를 남김
+                    await self._fail_quietly(room_id, stream_id, "서버 종료로 응답 생성이 중단되었습니다.")
+                    raise
+                except Exception:
+                    logger.exception("응답 생성 작업 실패 room_id=%s stream_id=%s", room_id, stream_id)
+                    await self._fail_quietly(room_id, stream_id, "응답 생성 중 오류가 발생했습니다.")
+        finally:
+            # done / error 를 받은 클라이언트가 바로 다음 메시지를 보낼 수 있도록 즉시 해제
+            self._tasks.pop(room_id, None)
+
+    async def _fail_quietly(self, room_id: str, stream_id: str, detail: str) -> None:
+        try:
+            await self.replay_uc.fail(room_id, stream_id, detail)
+        except Exception:
+            logger.warning("스트림 종료 이벤트 기록 실패 room_id=%s stream_id=%s", room_id, stream_id)
+
+    async def shutdown(self, grace_seconds: float) -> None:
+        """진행 중인 생성 작업을 grace_seconds 동안 기다리고, 끝나지 않은 작업은 취소"""
+        tasks = [task for task in self._tasks.values() if task is not None] + list(self._background)
+        if not tasks:
+            return
+
+        logger.info("진행 중인 응답 생성 / 후속 작업 %d건 종료 대기", len(tasks))
+        _, pending = await asyncio.wait(tasks, timeout=grace_seconds)
+        for task in pending:
+            task.cancel()
+        if pending:
+            logger.warning("작업 %d건을 종료 대기 시간 초과로 취소", len(pending))
+            await asyncio.gather(*pending, return_exceptions=True)
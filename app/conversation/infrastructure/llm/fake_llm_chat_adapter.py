@@ -0,0 +1,61 @@
+import asyncio
+import random
+from typing import AsyncIterator
+
+from app.conversation.application.exception.llm_exception import LlmBackendException
+from app.conversation.application.policy.usage_policy import UsagePolicy
+from app.conversation.application.port.out.llm_chat_port import LlmChatPort, TokenUsage
+
+
+class FakeLlmChatAdapter(LlmChatPort):
+    """
+    외부 API 없이 응답을 흘려보내는 로컬 LLM 대역 (부하 테스트 / 오프라인 벤치마크용)
+    - ttft_ms 후 첫 토큰, 이후 tokens_per_second 속도로 고정 문장을 토큰 단위로 전송
+    - failure_rate 확률로 첫 토큰 전에 실패
+    - seed 를 주면 실패 발생 순서까지 재현 가능
+    - 제공자처럼 끝난 뒤 usage 를 채움 (입력은 tokenizer 계산, 출력은 보낸 토큰 수)
+    """
+
+    REPLY = (
+        "말씀해 주셔서 고마워요. 그런 상황이라면 마음이 많이 복잡하셨을 것 같아요. "
+        "지금 가장 크게 느껴지는 감정이 어떤 건지 조금 더 이야기해 주실 수 있을까요? "
+    )
+    MODEL = "fake"
+    # 한국어 기준 토큰 하나 ≈ 글자 2개
+    CHARS_PER_TOKEN = 2
+
+    def __init__(
+        self,
+        tokens_per_second: float = 50.0,
+        ttft_ms: float = 300.0,
+        failure_rate: float = 0.0,
+        response_tokens: int = 200,
+        seed: int | None = None,
+    ):
+        self.tokens_per_second = tokens_per_second
+        self.ttft_ms = ttft_ms
+        self.failure_rate = failure_rate
+        self.response_tokens = response_tokens
+        self._random = random.Random(seed)
+
+    async def stream_chat(self, messages: list[dict], usage: TokenUsage | None = None) -> AsyncIterator[str]:
+        await asyncio.sleep(self.ttft_ms / 1000)
+
+        if self.failure_rate > 0 and self._random.random() < self.failure_rate:
+            raise LlmBackendException("Fake LLM backend injected failure")
+
+        interval = 1 / self.tokens_per_second if self.tokens_per_second > 0 else 0
+        for i in range(self.response_tokens):
+            if i > 0 and interval:
+                await asyncio.sleep(interval)
+            yield self._token(i)
+
+        if usage is not None:
+            usage.prompt_tokens = sum(UsagePolicy.calculate_message_token(m["content"]) for m in messages)
+            usage.completion_tokens = self.response_tokens
+            usage.model = self.MODEL
+            usage.reported = True
+
+    def _token(self, index: int) -> str:
+        start = (index * self.CHARS_PER_TOKEN) % len(self.REPLY)
+        return (self.REPLY * 2)[start:start + self.CHARS_PER_TOKEN]
@@ -0,0 +1,53 @@
+from typing import Callable, Dict
+
+from app.config.settings import settings
+from app.conversation.application.exception.llm_exception import UnsupportedLlmBackendException
+from app.conversation.application.port.out.llm_chat_port import LlmChatPort
+
+
+def _create_openai() -> LlmChatPort:
+    # openai 패키지는 실제로 이 백엔드를 쓸 때만 로드 (MAX_TOKENS 검증도 이 시점)
+    from app.config.call_gpt import CallGPT
+    return CallGPT(model=settings.LLM_MODEL)
+
+
+def _create_fake() -> LlmChatPort:
+    from app.conversation.infrastructure.llm.fake_llm_chat_adapter import FakeLlmChatAdapter
+    return FakeLlmChatAdapter(
+        tokens_per_second=settings.LLM_FAKE_TOKENS_PER_SECOND,
+        ttft_ms=settings.LLM_FAKE_TTFT_MS,
+        failure_rate=settings.LLM_FAKE_FAILURE_RATE,
+        response_tokens=settings.LLM_FAKE_RESPONSE_TOKENS,
+        seed=settings.LLM_FAKE_SEED,
+    )
+
+
+class LlmBackendFactory:
+    """
+    LlmChatPort 구현체를 이름으로 생성 (registry 패턴)
+    LLM_BACKEND 설정으로 OpenAI / 로컬 대역을 전환한다.
+    """
+
+    # 백엔드 레지스트리: 이름 -> 생성 함수
+    _backends: Dict[str, Callable[[], LlmChatPort]] = {
+        "openai": _create_openai,
+        "fake": _create_fake,
+    }
+
+    @classmethod
+    def create(cls, backend_name: str | None = None) -> LlmChatPort:
+        backend_name = (backend_name or settings.LLM_BACKEND).lower()
+        creator = cls._backends.get(backend_name)
+
+        if creator is None:
+            raise UnsupportedLlmBackendException(backend_name)
+
+        return creator()
+
+    @classmethod
+    def register_backend(cls, name: str, creator: Callable[[], LlmChatPort]) -> None:
+        cls._backends[name.lower()] = creator
+
+    @classmethod
+    def get_supported_backends(cls) -> list[str]:
+        return list(cls._backends.keys())
@@ -0,0 +1,31 @@
+from sqlalchemy import BigInteger, Boolean, Column, Date, DateTime, Index, Integer, String
+from datetime import datetime
+from app.config.database.session import Base
+
+
+class UsageLedgerOrm(Base):
+    """LLM 토큰 사용 원장 (추가만 하고 수정 / 삭제하지 않음)"""
+
+    __tablename__ = "usage_ledger"
+
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    account_id = Column(Integer, nullable=False)
+    # 방이 삭제되어도 사용 기록은 남김 (FK 없음)
+    room_id = Column(String(36), nullable=True)
+    message_id = Column(Integer, nullable=True)
+    usage_date = Column(Date, nullable=False)
+    model = Column(String(50), nullable=True)
+    prompt_tokens = Column(Integer, nullable=False, default=0)
+    completion_tokens = Column(Integer, nullable=False, default=0)
+    cached_prompt_tokens = Column(Integer, nullable=False, default=0)
+    # 제공자 보고값이 아닌 tokenizer 추정치
+    estimated = Column(Boolean, nullable=False, default=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        # 계정별 일자 집계: 토큰 컬럼까지 포함한 커버링 인덱스 → 테이블 접근 없이 SUM
+        Index(
+            'idx_usage_ledger_account_date',
+            'account_id', 'usage_date', 'prompt_tokens', 'completion_tokens',
+        ),
+    )
@@ -0,0 +1,46 @@
+import time
+from datetime import datetime
+
+from sqlalchemy import select
+
+import app.config.database.session as database_session
+from app.account.infrastructure.orm.account_model import AccountModel
+from app.conversation.application.policy.quota_policy import QuotaPolicy
+from app.conversation.application.port.out.account_plan_port import AccountPlanPort
+
+
+class AccountPlanRepositoryImpl(AccountPlanPort):
+    """
+    계정의 현재 요금제 조회
+    요청마다 DB 를 조회하지 않도록 워커 로컬 TTL 캐시를 둔다. (요금제 변경은 최대 ttl_seconds 뒤 반영)
+    """
+
+    MAX_ENTRIES = 10_000
+
+    def __init__(self, ttl_seconds: float = 60.0):
+        self.ttl_seconds = ttl_seconds
+        # account_id → (요금제, 만료 시각 monotonic)
+        self._cache: dict[int, tuple[str, float]] = {}
+
+    async def get_plan(self, account_id: int) -> str:
+        now = time.monotonic()
+        cached = self._cache.get(account_id)
+        if cached is not None and cached[1] > now:
+            return cached[0]
+
+        # 스트리밍 요청 세션과 분리된 짧은 세션에서 조회
+        async with database_session.AsyncSessionLocal() as db:
+            row = (await db.execute(
+                select(AccountModel.plan, AccountModel.plan_ends_at).where(AccountModel.id == account_id)
+            )).first()
+
+        plan = QuotaPolicy.DEFAULT_PLAN
+        if row is not None and row.plan and (row.plan_ends_at is None or row.plan_ends_at > datetime.now()):
+            plan = row.plan.upper()
+
+        if len(self._cache) >= self.MAX_ENTRIES:
+            self._cache = {k: v for k, v in self._cache.items() if v[1] > now}
+            if len(self._cache) >= self.MAX_ENTRIES:
+                self._cache.clear()
+        self._cache[account_id] = (plan, now + self.ttl_seconds)
+        return plan
@@ -1,4 +1,5 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from Crypto.Random import get_random_bytes
 
 from app.conversation.infrastructure.orm.chat_message_feedback_orm import ChatFeedbackOrm
@@ -6,7 +7,7 @@ from app.conversation.infrastructure.orm.chat_message_orm import ChatMessageOrm
 
 
 class ChatMessageRepositoryImpl:
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession):
         self.db = session
 
     async def save_message(self, **kwargs):
@@ -18,39 +19,86 @@ class ChatMessageRepositoryImpl:
             # 2. parent_id 유효성 검사
             parent_id = kwargs.get('parent_id')
             if parent_id is not None:
-                exists = self.db.query(ChatMessageOrm).filter(ChatMessageOrm.id == parent_id).first()
+                exists = await self.db.get(ChatMessageOrm, parent_id)
                 if not exists:
                     kwargs['parent_id'] = None
 
             # 3. 객체 생성 및 저장
             msg = ChatMessageOrm(**kwargs)
             self.db.add(msg)
-            self.db.flush()
+            await self.db.flush()
             return msg
 
         except Exception as e:
-            self.db.rollback()
+            await self.db.rollback()
             raise e
 
     async def find_by_room_id(self, room_id: str):
-        return (
-            self.db.query(ChatMessageOrm)
-            .filter(ChatMessageOrm.room_id == room_id)
+        result = await self.db.execute(
+            select(ChatMessageOrm)
+            .where(ChatMessageOrm.room_id == room_id)
             .order_by(ChatMessageOrm.id.asc())
-            .all()
         )
+        return result.scalars().all()
+
+    async def find_by_room_id_after(self, room_id: str, after_id: int | None):
+        # 요약에 이미 포함된 메시지는 건너뛰고 이후 꼬리 부분만 로드
+        query = select(ChatMessageOrm).where(ChatMessageOrm.room_id == room_id)
+        if after_id is not None:
+            query = query.where(ChatMessageOrm.id > after_id)
+
+        result = await self.db.execute(query.order_by(ChatMessageOrm.id.asc()))
+        return result.scalars().all()
 
     async def find_by_room_id_with_feedback(self, room_id: str, account_id: int):
-        from app.conversation.infrastructure.orm.chat_message_feedback_orm import ChatFeedbackOrm
+        result = await self.db.execute(
+            self._with_feedback_query(room_id, account_id)
+            .order_by(ChatMessageOrm.id.asc())
+        )
+        return result.all()
+
+    async def find_page_by_room_id_with_feedback(
+        self,
+        room_id: str,
+        account_id: int,
+        before_id: int | None = None,
+        limit: int = 50,
+    ):
+        # idx_room_id(room_id) + PK(id) 범위 스캔 → OFFSET 없이 방 크기와 무관한 비용
+        query = self._with_feedback_query(room_id, account_id)
+        if before_id is not None:
+            query = query.where(ChatMessageOrm.id < before_id)
 
+        result = await self.db.execute(
+            query.order_by(ChatMessageOrm.id.desc()).limit(limit)
+        )
+        rows = result.all()
+        rows.reverse()  # 화면 표시 순서(오래된 → 최신)로 되돌림
+        return rows
+
+    async def stream_by_room_id_with_feedback(
+        self,
+        room_id: str,
+        account_id: int,
+        batch_size: int = 100,
+    ):
+        # 서버 사이드 커서로 batch_size 씩 가져오며 한 행씩 흘려보냄
+        result = await self.db.stream(
+            self._with_feedback_query(room_id, account_id)
+            .order_by(ChatMessageOrm.id.asc())
+            .execution_options(yield_per=batch_size)
+        )
+        async for row in result:
+            yield row
+
+    @staticmethod
+    def _with_feedback_query(room_id: str, account_id: int):
         return (
-            self.db.query(ChatMessageOrm, ChatFeedbackOrm.satisfaction)
+            select(ChatMessageOrm, ChatFeedbackOrm.satisfaction)
             .outerjoin(
                 ChatFeedbackOrm,
                 (ChatMessageOrm.id == ChatFeedbackOrm.message_id) &
                 (ChatFeedbackOrm.account_id == account_id)
             )
-            .filter(ChatMessageOrm.room_id == room_id)
-            .order_by(ChatMessageOrm.id.asc())
-            .all()
-        )
\ No newline at end of file
+            .where(ChatMessageOrm.room_id == room_id)
+        )
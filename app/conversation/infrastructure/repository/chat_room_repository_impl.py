@@ -1,12 +1,14 @@
-from app.config.database.session import get_db_session
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from app.conversation.application.port.out.chat_room_repository_port import ChatRoomRepositoryPort
 from app.conversation.infrastructure.orm.chat_room_orm import ChatRoomOrm
-from sqlalchemy.orm import Session
+
 
 class ChatRoomRepositoryImpl(ChatRoomRepositoryPort):
 
-    def __init__(self, session: Session | None = None):
-        self.db: Session = session or get_db_session()
+    def __init__(self, session: AsyncSession):
+        self.db: AsyncSession = session
 
     async def create(self, room_id, account_id, title, category, division, out_api):
         room = ChatRoomOrm(
@@ -19,56 +21,62 @@ class ChatRoomRepositoryImpl(ChatRoomRepositoryPort):
             status="ACTIVE",
         )
         self.db.add(room)
-        self.db.commit()
+        await self.db.commit()
 
     async def find_by_id(self, room_id):
-        return self.db.get(ChatRoomOrm, room_id)
+        return await self.db.get(ChatRoomOrm, room_id)
 
     async def end_room(self, room_id: str) -> bool:
-        room = self.db.get(ChatRoomOrm, room_id)
+        room = await self.db.get(ChatRoomOrm, room_id)
 
         if not room:
             return False
 
         room.status = "ENDED"
         self.db.add(room)
-        self.db.commit()
-        self.db.refresh(room)
+        await self.db.commit()
+        await self.db.refresh(room)
         return True
 
     async def find_by_account_id(self, account_id: int):
-        return (
-            self.db.query(ChatRoomOrm)
-            .filter(ChatRoomOrm.account_id == account_id)
+        result = await self.db.execute(
+            select(ChatRoomOrm)
+            .where(ChatRoomOrm.account_id == account_id)
             .order_by(ChatRoomOrm.created_at.desc())
-            .all()
         )
+        return result.scalars().all()
+
+    async def count_active_by_account_id(self, account_id: int) -> int:
+        result = await self.db.execute(
+            select(func.count())
+            .select_from(ChatRoomOrm)
+            .where(ChatRoomOrm.account_id == account_id, ChatRoomOrm.status == "ACTIVE")
+        )
+        return result.scalar_one()
 
     async def delete_by_room_id(self, room_id: str) -> bool:
         try:
             # 1. 방 조회
-            room = self.db.query(ChatRoomOrm).filter(ChatRoomOrm.room_id == room_id).first()
+            room = await self.db.get(ChatRoomOrm, room_id)
 
             if not room:
                 return False
 
             # 2. 방 삭제 (이때 연관된 메시지들이 CASCADE 설정에 의해 자동 삭제됨)
-            self.db.delete(room)
-            self.db.commit()
+            await self.db.delete(room)
+            await self.db.commit()
             return True
 
         except Exception as e:
-            self.db.rollback()
+            await self.db.rollback()
             raise e
 
     async def find_status_by_room_id(self, room_id: str, account_id: int) -> str | None:
-        room = (
-            self.db.query(ChatRoomOrm.status)
-            .filter(
+        result = await self.db.execute(
+            select(ChatRoomOrm.status)
+            .where(
                 ChatRoomOrm.room_id == room_id,
                 ChatRoomOrm.account_id == account_id,
             )
-            .first()
         )
-        # room은 (status,) 튜플 형태
-        return room[0] if room else None
+        return result.scalar_one_or_none()
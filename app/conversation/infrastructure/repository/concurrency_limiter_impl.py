@@ -0,0 +1,174 @@
+import asyncio
+import logging
+import uuid
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import redis.asyncio as aioredis
+
+from app.config.redis_config import get_async_redis
+from app.conversation.application.exception.quota_exception import ConcurrencyLimitExceededException
+from app.conversation.application.policy.quota_policy import QuotaPolicy
+from app.conversation.application.port.out.account_plan_port import AccountPlanPort
+from app.conversation.application.port.out.concurrency_limiter_port import ConcurrencyLimiterPort
+
+logger = logging.getLogger(__name__)
+
+# 만료된 lease 를 치운 뒤 자리가 남으면 lease 추가 (시각은 Redis 서버 시간)
+# KEYS: 계정 lease ZSET / ARGV: 동시 생성 한도, lease 길이(ms), lease_id / 반환: 1 확보, 0 거부
+_ACQUIRE_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local lease_ms = tonumber(ARGV[2])
+
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now)
+if redis.call('ZCARD', KEYS[1]) >= tonumber(ARGV[1]) then
+  return 0
+end
+redis.call('ZADD', KEYS[1], now + lease_ms, ARGV[3])
+redis.call('PEXPIRE', KEYS[1], lease_ms)
+return 1
+"""
+
+# 아직 남아 있는 lease 만 연장 / 반환: 1 연장, 0 이미 만료되어 사라짐
+_RENEW_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local lease_ms = tonumber(ARGV[1])
+
+if redis.call('ZADD', KEYS[1], 'XX', 'CH', now + lease_ms, ARGV[2]) == 0 then
+  return 0
+end
+redis.call('PEXPIRE', KEYS[1], lease_ms)
+return 1
+"""
+
+
+class ConcurrencyLimiterImpl(ConcurrencyLimiterPort):
+    """
+    동시 응답 생성 제한: 계정별(요금제 한도) Redis ZSET lease 세마포어 + 워커 전체 상한
+    - 자리 = ZSET 멤버(lease_id), 점수 = 만료 시각 → 워커가 죽어도 lease 만료 뒤 자리가 풀림
+    - 생성이 진행되는 동안에는 lease 를 주기적으로 연장
+    - 자리가 없으면 queue_wait_seconds 동안 반납을 기다린 뒤 거부 (같은 워커의 반납은 바로 깨어남)
+    - Redis 장애 시에는 워커 상한만 적용하고 통과시킴
+    """
+
+    KEY_PREFIX = "concurrency:"
+    # 다른 워커의 반납을 다시 확인하는 주기
+    POLL_INTERVAL_SECONDS = 0.2
+
+    def __init__(
+        self,
+        account_plan_port: AccountPlanPort,
+        redis_client: aioredis.Redis | None = None,
+        enabled: bool = True,
+        worker_max_active: int = 0,
+        lease_seconds: int = 60,
+        queue_wait_seconds: float = 0.0,
+        retry_after_seconds: int = 5,
+    ):
+        self.account_plan_port = account_plan_port
+        self._redis = redis_client or get_async_redis()
+        self.enabled = enabled
+        self.worker_max_active = worker_max_active
+        self.lease_ms = lease_seconds * 1000
+        self.queue_wait_seconds = queue_wait_seconds
+        self.retry_after_seconds = retry_after_seconds
+        self._acquire_script = self._redis.register_script(_ACQUIRE_LUA)
+        self._renew_script = self._redis.register_script(_RENEW_LUA)
+        # 이 워커가 잡고 있는 lease (워커 전체 상한 계산 / 중복 반납 방지)
+        self._leases: set[str] = set()
+        self._released = asyncio.Condition()
+
+    def _make_key(self, account_id: int) -> str:
+        return f"{self.KEY_PREFIX}{{{account_id}}}"
+
+    @property
+    def active_count(self) -> int:
+        return len(self._leases)
+
+    async def acquire(self, account_id: int) -> str:
+        if not self.enabled:
+            return ""
+
+        lease_id = uuid.uuid4().hex
+        limit = QuotaPolicy.limits(await self.account_plan_port.get_plan(account_id))["concurrent_generations"]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.queue_wait_seconds
+
+        while not await self._try_acquire(account_id, lease_id, limit):
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise ConcurrencyLimitExceededException(retry_after_seconds=self.retry_after_seconds)
+            await self._wait_for_release(min(remaining, self.POLL_INTERVAL_SECONDS))
+        return lease_id
+
+    async def _try_acquire(self, account_id: int, lease_id: str, limit: int) -> bool:
+        if self.worker_max_active and len(self._leases) >= self.worker_max_active:
+            return False
+
+        # Redis 왕복 동안 같은 워커의 다른 요청이 워커 상한을 넘기지 않도록 먼저 점유
+        self._leases.add(lease_id)
+        try:
+            acquired = await self._acquire_script(
+                keys=[self._make_key(account_id)],
+                args=[limit, self.lease_ms, lease_id],
+            )
+        except Exception:
+            logger.warning("동시 생성 자리 확보 실패 (통과 처리) account_id=%s", account_id, exc_info=True)
+            return True
+        except BaseException:
+            self._leases.discard(lease_id)
+            raise
+
+        if not acquired:
+            self._leases.discard(lease_id)
+        return bool(acquired)
+
+    async def _wait_for_release(self, timeout: float) -> None:
+        async with self._released:
+            try:
+                await asyncio.wait_for(self._released.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    @asynccontextmanager
+    async def hold(self, account_id: int, lease_id: str) -> AsyncIterator[None]:
+        renewer = None
+        if lease_id:
+            renewer = asyncio.create_task(
+                self._renew_periodically(account_id, lease_id), name=f"concurrency-lease:{account_id}"
+            )
+        try:
+            yield
+        finally:
+            if renewer is not None:
+                renewer.cancel()
+            await self.release(account_id, lease_id)
+
+    async def _renew_periodically(self, account_id: int, lease_id: str) -> None:
+        interval = self.lease_ms / 1000 / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                renewed = await self._renew_script(keys=[self._make_key(account_id)], args=[self.lease_ms, lease_id])
+            except Exception:
+                logger.warning("동시 생성 lease 연장 실패 account_id=%s", account_id, exc_info=True)
+                continue
+            if not renewed:
+                logger.warning("동시 생성 lease 가 이미 만료됨 account_id=%s lease_id=%s", account_id, lease_id)
+                return
+
+    async def release(self, account_id: int, lease_id: str) -> None:
+        if lease_id not in self._leases:
+            return
+
+        self._leases.discard(lease_id)
+        try:
+            await self._redis.zrem(self._make_key(account_id), lease_id)
+        except Exception:
+            # 반납하지 못한 자리는 lease 만료 뒤 풀림
+            logger.warning("동시 생성 lease 반납 실패 account_id=%s", account_id, exc_info=True)
+        finally:
+            async with self._released:
+                self._released.notify_all()
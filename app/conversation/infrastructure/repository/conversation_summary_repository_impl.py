@@ -0,0 +1,86 @@
+import base64
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.conversation.application.port.out.conversation_summary_repository_port import (
+    ConversationSummaryRepositoryPort,
+)
+from app.conversation.domain.chat_message.value_object import EncryptedContent
+from app.conversation.domain.conversation.summary import ConversationSummary
+from app.ml.infrastructure.orm.chat_message_analysis_model import (
+    AnalysisStatus,
+    AnalysisType,
+    ChatMessageAnalysisModel,
+)
+
+
+class ConversationSummaryRepositoryImpl(ConversationSummaryRepositoryPort):
+    """
+    대화 요약을 chat_message_analysis 테이블의 SUMMARY 행으로 저장
+    - message_id: 요약에 포함된 마지막 메시지 id
+    - result_json: 암호화된 요약 본문 (base64)
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.db = session
+
+    async def find_latest(self, room_id: str) -> ConversationSummary | None:
+        # idx_room_type_id(room_id, analysis_type, id) 역순 스캔 1건
+        result = await self.db.execute(
+            select(ChatMessageAnalysisModel)
+            .where(
+                ChatMessageAnalysisModel.room_id == room_id,
+                ChatMessageAnalysisModel.analysis_type == AnalysisType.SUMMARY,
+                ChatMessageAnalysisModel.status == AnalysisStatus.SUCCESS,
+            )
+            .order_by(ChatMessageAnalysisModel.id.desc())
+            .limit(1)
+        )
+        row = result.scalars().first()
+        if row is None:
+            return None
+
+        payload = row.result_json or {}
+        return ConversationSummary(
+            room_id=row.room_id,
+            covered_message_id=row.message_id,
+            content=EncryptedContent(
+                content_enc=base64.b64decode(payload["content_enc"]),
+                iv=base64.b64decode(payload["iv"]),
+                enc_version=payload.get("enc_version"),
+            ),
+        )
+
+    async def save(
+        self,
+        room_id: str,
+        covered_message_id: int,
+        content: EncryptedContent,
+        model: str | None = None,
+    ) -> ConversationSummary:
+        row = ChatMessageAnalysisModel(
+            message_id=covered_message_id,
+            room_id=room_id,
+            provider="openai",
+            model=model,
+            analysis_type=AnalysisType.SUMMARY,
+            result_json={
+                "content_enc": base64.b64encode(content.content_enc).decode("ascii"),
+                "iv": base64.b64encode(content.iv).decode("ascii"),
+                "enc_version": content.enc_version,
+            },
+            status=AnalysisStatus.SUCCESS,
+        )
+        try:
+            self.db.add(row)
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise
+
+        return ConversationSummary(
+            room_id=room_id,
+            covered_message_id=covered_message_id,
+            content=content,
+        )
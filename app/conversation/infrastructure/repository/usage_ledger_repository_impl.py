@@ -0,0 +1,60 @@
+from datetime import date
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.conversation.application.port.out.llm_chat_port import TokenUsage
+from app.conversation.application.port.out.usage_ledger_repository_port import UsageLedgerRepositoryPort
+from app.conversation.infrastructure.orm.usage_ledger_orm import UsageLedgerOrm
+
+
+class UsageLedgerRepositoryImpl(UsageLedgerRepositoryPort):
+
+    def __init__(self, session: AsyncSession):
+        self.db = session
+
+    async def append(
+        self,
+        account_id: int,
+        usage: TokenUsage,
+        room_id: str | None = None,
+        message_id: int | None = None,
+    ) -> None:
+        # 응답 메시지와 같은 트랜잭션에서 커밋되도록 add 만 수행
+        self.db.add(UsageLedgerOrm(
+            account_id=account_id,
+            room_id=room_id,
+            message_id=message_id,
+            usage_date=date.today(),
+            model=usage.model,
+            prompt_tokens=usage.prompt_tokens,
+            completion_tokens=usage.completion_tokens,
+            cached_prompt_tokens=usage.cached_prompt_tokens,
+            estimated=usage.estimated,
+        ))
+
+    async def sum_daily(self, account_id: int, start: date, end: date) -> list[dict]:
+        # idx_usage_ledger_account_date 범위 스캔만으로 집계
+        result = await self.db.execute(
+            select(
+                UsageLedgerOrm.usage_date,
+                func.count().label("requests"),
+                func.sum(UsageLedgerOrm.prompt_tokens).label("prompt_tokens"),
+                func.sum(UsageLedgerOrm.completion_tokens).label("completion_tokens"),
+            )
+            .where(
+                UsageLedgerOrm.account_id == account_id,
+                UsageLedgerOrm.usage_date.between(start, end),
+            )
+            .group_by(UsageLedgerOrm.usage_date)
+            .order_by(UsageLedgerOrm.usage_date)
+        )
+        return [
+            {
+                "usage_date": row.usage_date,
+                "requests": row.requests,
+                "prompt_tokens": int(row.prompt_tokens or 0),
+                "completion_tokens": int(row.completion_tokens or 0),
+            }
+            for row in result
+        ]
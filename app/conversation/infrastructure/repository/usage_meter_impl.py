@@ -1,11 +1,134 @@
+import logging
+import math
+import time
+from datetime import date
+
+import redis.asyncio as aioredis
+from redis.exceptions import NoScriptError
+
+from app.config.redis_config import get_async_redis
+from app.conversation.application.exception.quota_exception import QuotaExceededException
+from app.conversation.application.policy.quota_policy import QuotaPolicy
+from app.conversation.application.port.out.account_plan_port import AccountPlanPort
 from app.conversation.application.port.out.usage_meter_port import UsageMeterPort
 
+logger = logging.getLogger(__name__)
+
+# 버킷(hash: tokens, ts)을 현재 시각 기준으로 채운 값 계산 (시각은 Redis 서버 시간 → 워커 간 시계 차이 무관)
+_REFILL_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+
+local function refill(key, capacity, rate)
+  local bucket = redis.call('HMGET', key, 'tokens', 'ts')
+  local tokens = tonumber(bucket[1])
+  if tokens == nil then
+    return capacity
+  end
+  return math.min(capacity, tokens + math.max(now - tonumber(bucket[2]), 0) * rate)
+end
+
+local function save(key, tokens, capacity, rate)
+  redis.call('HSET', key, 'tokens', tostring(tokens), 'ts', now)
+  -- 가득 찰 때까지만 보관 (가득 찬 버킷은 없는 버킷과 같음)
+  redis.call('PEXPIRE', key, math.ceil((capacity - tokens) / rate) + 1000)
+end
+"""
+
+# KEYS: 분당 요청 버킷, 일일 토큰 버킷 / ARGV: 요청 용량, 요청 충전량(ms), 토큰 용량, 토큰 충전량(ms)
+# 반환: {허용 1|0, 재시도까지 ms}
+_CHECK_LUA = _REFILL_LUA + """
+local req_capacity, req_rate = tonumber(ARGV[1]), tonumber(ARGV[2])
+local tok_capacity, tok_rate = tonumber(ARGV[3]), tonumber(ARGV[4])
+
+local requests = refill(KEYS[1], req_capacity, req_rate)
+if requests < 1 then
+  return {0, math.ceil((1 - requests) / req_rate)}
+end
+local tokens = refill(KEYS[2], tok_capacity, tok_rate)
+if tokens < 1 then
+  return {0, math.ceil((1 - tokens) / tok_rate)}
+end
+
+save(KEYS[1], requests - 1, req_capacity, req_rate)
+return {1, 0}
+"""
+
+# KEYS: 일일 토큰 버킷 / ARGV: 토큰 용량, 토큰 충전량(ms), 사용 토큰 수
+# 응답이 끝난 뒤 차감하므로 음수(초과 사용분)까지 내려갈 수 있다 → 다시 찰 때까지 요청 거부
+# 반환: 다시 1 토큰이 될 때까지 ms (여유가 있으면 0)
+_RECORD_LUA = _REFILL_LUA + """
+local capacity, rate = tonumber(ARGV[1]), tonumber(ARGV[2])
+local tokens = refill(KEYS[1], capacity, rate) - tonumber(ARGV[3])
+save(KEYS[1], tokens, capacity, rate)
+if tokens < 1 then
+  return math.ceil((1 - tokens) / rate)
+end
+return 0
+"""
+
+_MS_PER_MINUTE = 60 * 1000
+_MS_PER_DAY = 24 * 60 * _MS_PER_MINUTE
+
 
 class UsageMeterImpl(UsageMeterPort):
+    """
+    Redis 토큰 버킷 기반 사용량 쿼터 (계정 x 요금제)
+    - 분당 요청 수 / 일일 토큰 수 버킷을 Lua 스크립트로 원자적으로 확인 (1회 왕복)
+    - 사용량 기록은 버킷 차감과 일별 통계를 파이프라인 한 번으로 전송
+    - 한도 초과로 거부된 계정은 재시도 시각까지 워커 로컬에서 바로 거부 (Redis 조회 없음)
+    - Redis 장애 시에는 대화를 막지 않도록 통과시킴
+    """
+
+    KEY_PREFIX = "quota:"
+    STATS_PREFIX = "usage:"
+    STATS_TTL_SECONDS = 2 * 24 * 60 * 60
+    # 로컬 거부 목록 최대 크기
+    MAX_BLOCKED_ENTRIES = 10_000
+
+    def __init__(
+        self,
+        account_plan_port: AccountPlanPort,
+        redis_client: aioredis.Redis | None = None,
+        enabled: bool = True,
+    ):
+        self.account_plan_port = account_plan_port
+        self._redis = redis_client or get_async_redis()
+        self.enabled = enabled
+        self._check_script = self._redis.register_script(_CHECK_LUA)
+        self._record_script = self._redis.register_script(_RECORD_LUA)
+        # account_id → 이 시각(monotonic) 전까지는 Redis 확인 없이 거부
+        self._blocked_until: dict[int, float] = {}
+
+    def _make_keys(self, account_id: int) -> tuple[str, str]:
+        # 해시 태그 {account_id} → Redis Cluster 에서도 두 버킷이 같은 슬롯 (Lua 다중 키)
+        prefix = f"{self.KEY_PREFIX}{{{account_id}}}"
+        return f"{prefix}:rpm", f"{prefix}:tpd"
+
+    @staticmethod
+    def _bucket_args(limits: dict) -> list:
+        requests, tokens = limits["requests_per_minute"], limits["tokens_per_day"]
+        return [requests, requests / _MS_PER_MINUTE, tokens, tokens / _MS_PER_DAY]
 
     async def check_available(self, account_id: int) -> None:
-        # TODO: Redis / quota 체크
-        return None
+        if not self.enabled:
+            return
+
+        self._raise_if_blocked(account_id)
+
+        limits = QuotaPolicy.limits(await self.account_plan_port.get_plan(account_id))
+        try:
+            allowed, retry_after_ms = await self._check_script(
+                keys=list(self._make_keys(account_id)),
+                args=self._bucket_args(limits),
+            )
+        except Exception:
+            logger.warning("사용량 쿼터 확인 실패 (통과 처리) account_id=%s", account_id, exc_info=True)
+            return
+
+        if not allowed:
+            self._block(account_id, retry_after_ms)
+            self._raise_if_blocked(account_id)
 
     async def record_usage(
         self,
@@ -13,6 +136,50 @@ class UsageMeterImpl(UsageMeterPort):
         input_tokens: int,
         output_tokens: int,
     ) -> None:
+        if not self.enabled:
+            return
+
         total = input_tokens + output_tokens
-        # TODO: DB 저장 or 차감
-        return None
+        limits = QuotaPolicy.limits(await self.account_plan_port.get_plan(account_id))
+        _, tokens_key = self._make_keys(account_id)
+        stats_key = f"{self.STATS_PREFIX}{account_id}:{date.today():%Y%m%d}"
+        args = self._bucket_args(limits)
+
+        record_args = [args[2], args[3], total]
+        try:
+            try:
+                # 파이프라인에 Script 객체를 넘기면 매번 SCRIPT EXISTS 왕복이 추가되므로 EVALSHA 를 직접 사용
+                async with self._redis.pipeline(transaction=False) as pipe:
+                    pipe.evalsha(self._record_script.sha, 1, tokens_key, *record_args)
+                    pipe.hincrby(stats_key, "requests", 1)
+                    pipe.hincrby(stats_key, "input_tokens", input_tokens)
+                    pipe.hincrby(stats_key, "output_tokens", output_tokens)
+                    pipe.expire(stats_key, self.STATS_TTL_SECONDS)
+                    retry_after_ms, *_ = await pipe.execute()
+            except NoScriptError:
+                # 스크립트 캐시가 비어 있으면(첫 호출, Redis 재시작) 통계는 이미 반영됐으므로 차감만 다시 실행
+                retry_after_ms = await self._record_script(keys=[tokens_key], args=record_args)
+        except Exception:
+            logger.warning("사용량 기록 실패 account_id=%s tokens=%s", account_id, total, exc_info=True)
+            return
+
+        # 일일 토큰을 다 쓴 계정은 다음 요청부터 로컬에서 거부
+        if retry_after_ms:
+            self._block(account_id, retry_after_ms)
+
+    def _block(self, account_id: int, retry_after_ms: int) -> None:
+        now = time.monotonic()
+        if len(self._blocked_until) >= self.MAX_BLOCKED_ENTRIES:
+            self._blocked_until = {k: v for k, v in self._blocked_until.items() if v > now}
+        self._blocked_until[account_id] = now + retry_after_ms / 1000
+
+    def _raise_if_blocked(self, account_id: int) -> None:
+        blocked_until = self._blocked_until.get(account_id)
+        if blocked_until is None:
+            return
+
+        remaining = blocked_until - time.monotonic()
+        if remaining <= 0:
+            del self._blocked_until[account_id]
+            return
+        raise QuotaExceededException(retry_after_seconds=max(math.ceil(remaining), 1))
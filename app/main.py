@@ -6,7 +6,11 @@ from dotenv import load_dotenv
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.conversation.adapter.input.web.conversation_router import conversation_router
+from app.conversation.adapter.input.web.conversation_router import (
+    conversation_router,
+    generation_task_manager,
+    message_cache,
+)
 
 # Load environment variables first
 load_dotenv()
@@ -18,7 +22,13 @@ from app.ml.adapter.input.web.ml_router import ml_router
 from app.account.infrastructure.orm.account_model import AccountModel  # noqa: F401
 from app.conversation.infrastructure.orm.chat_room_orm import ChatRoomOrm
 from app.conversation.infrastructure.orm.chat_message_orm import ChatMessageOrm
-from app.config.database.session import Base, engine
+from app.conversation.infrastructure.orm.usage_ledger_orm import UsageLedgerOrm  # noqa: F401
+from app.ml.infrastructure.orm.chat_message_analysis_model import ChatMessageAnalysisModel  # noqa: F401
+from app.config.database.session import Base, engine, async_engine
+from app.config.redis_config import close_async_redis
+from app.auth.adapter.input.web.dependencies import account_cache, token_blacklist
+from app.auth.infrastructure.cache.cached_token_blacklist import CachedTokenBlacklist
+from app.auth.infrastructure.oauth.http_client import oauth_http_client
 from app.config.settings import settings
 
 
@@ -26,13 +36,22 @@ from app.config.settings import settings
 async def lifespan(app: FastAPI):
     """Application lifespan handler.
 
-    Startup: Initialize database tables.
-    Shutdown: Cleanup resources if needed.
+    Startup: Initialize database tables, start syncing the JWT revocation cache.
+    Shutdown: Drain in-flight chat generations, then cleanup resources
+    (OAuth HTTP connections, DB and Redis pools).
     """
     # Startup
     Base.metadata.create_all(bind=engine)
+    if isinstance(token_blacklist, CachedTokenBlacklist):
+        await token_blacklist.start()
     yield
-    # Shutdown (cleanup if needed)
+    # Shutdown
+    await generation_task_manager.shutdown(settings.GENERATION_SHUTDOWN_GRACE_SECONDS)
+    if isinstance(token_blacklist, CachedTokenBlacklist):
+        await token_blacklist.stop()
+    await oauth_http_client.aclose()
+    await async_engine.dispose()
+    await close_async_redis()
 
 
 app = FastAPI(
@@ -49,6 +68,7 @@ app.add_middleware(
     allow_credentials=True,  # Required for cookies
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Before-Id", "X-Stream-Id"],  # 페이지네이션 커서, 응답 스트림 id
 )
 
 # Include API routers
@@ -63,6 +83,15 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/health/caches")
+async def cache_stats():
+    """Hit ratio and size of this worker's in-process caches (counters since worker start)."""
+    return {
+        "decrypted_message_cache": message_cache.stats(),
+        "account_cache": account_cache.stats(),
+    }
+
+
 if __name__ == "__main__":
     import uvicorn
 
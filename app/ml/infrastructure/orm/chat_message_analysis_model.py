@@ -7,6 +7,8 @@ from sqlalchemy import (
     DateTime,
     String,
     BigInteger,
+    Integer,
+    Index,
     Enum as SAEnum,
 )
 from sqlalchemy.dialects.mysql import JSON
@@ -29,9 +31,19 @@ class AnalysisStatus(str, PyEnum):
 class ChatMessageAnalysisModel(Base):
     __tablename__ = "chat_message_analysis"
 
-    id = Column(BigInteger, primary_key=True, autoincrement=True)
-    message_id = Column(BigInteger, ForeignKey("chat_message.id"), nullable=False)
-    room_id = Column(String(36), ForeignKey("chat_room.id"), nullable=False)
+    # SQLite 는 INTEGER PRIMARY KEY 만 자동 증가 (로컬 벤치마크 / 테스트용 DB 호환)
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    # chat_msg.id / chat_room.room_id 와 타입을 맞춰야 FK 생성 가능
+    message_id = Column(
+        Integer,
+        ForeignKey("chat_msg.id", ondelete="CASCADE"),
+        nullable=False
+    )
+    room_id = Column(
+        String(36),
+        ForeignKey("chat_room.room_id", ondelete="CASCADE"),
+        nullable=False
+    )
 
     provider = Column(String(30))
     model = Column(String(50))
@@ -57,3 +69,9 @@ class ChatMessageAnalysisModel(Base):
         server_default=func.now(),
         nullable=False,
     )
+
+    # --- 인덱스 설정 ---
+    __table_args__ = (
+        # 방별 최신 분석 결과(예: 대화 요약) 조회
+        Index('idx_room_type_id', 'room_id', 'analysis_type', 'id'),
+    )
@@ -0,0 +1,172 @@
+"""AccountUseCase.get_or_create_account 동시 가입 검증 + 왕복 수 측정.
+
+OAuth 콜백이 호출하는 get_or_create_account 를 실제 AccountUseCase / 작업 단위(UoW) /
+AccountRepositoryImpl 로 실행한다. 호출마다 요청처럼 세션을 하나씩 연다.
+
+1. 왕복 수: 첫 로그인(신규 이메일)과 재로그인(기존 이메일) 한 번에 DB 로 보내는 문장 수
+2. 동시 가입: --emails 개의 이메일로 --concurrency 개의 호출을 한꺼번에 보내고
+   - 이메일마다 행이 정확히 하나인지
+   - 같은 이메일의 호출이 모두 같은 account id 를 받았는지
+   - 예외(중복 키 등)가 없었는지
+   를 확인한다. 하나라도 어긋나면 종료 코드 1.
+
+사용 예:
+    python benchmarks/account_signup_benchmark.py
+    python benchmarks/account_signup_benchmark.py --concurrency 200 --emails 5 --rounds 5
+    python benchmarks/account_signup_benchmark.py \\
+        --database-url "mysql+aiomysql://<MYSQL_USER>:<MYSQL_PASSWORD>@localhost:3306/<MYSQL_DATABASE>"
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from collections import defaultdict
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# session.py / redis_config 가 import 시점에 요구하는 값 (이미 설정된 값은 유지)
+BENCH_ENV = {
+    "MYSQL_HOST": "localhost",
+    "MYSQL_PORT": "3306",
+    "MYSQL_USER": "bench",
+    "MYSQL_PASSWORD": "bench",
+    "MYSQL_DATABASE": "bench",
+    "REDIS_HOST": "localhost",
+    "REDIS_PORT": "6379",
+    "REDIS_DB": "0",
+}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=None, help="기본: 임시 SQLite 파일")
+    parser.add_argument("--concurrency", type=int, default=100, help="라운드마다 동시에 보내는 호출 수")
+    parser.add_argument("--emails", type=int, default=3, help="라운드마다 사용하는 서로 다른 신규 이메일 수")
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--pool-size", type=int, default=10)
+    parser.add_argument("--max-overflow", type=int, default=20)
+    return parser.parse_args()
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return round(ordered[index] * 1000, 2)
+
+
+async def main() -> int:
+    args = parse_args()
+    for key, value in BENCH_ENV.items():
+        os.environ.setdefault(key, value)
+    sys.path.insert(0, str(ROOT))
+
+    from sqlalchemy import event, func, select
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+    from app.account.application.usecase.account_usecase import AccountUseCase
+    from app.account.infrastructure.orm.account_model import AccountModel
+    from app.account.infrastructure.repository.account_repository_impl import AccountRepositoryImpl
+    from app.account.infrastructure.repository.account_unit_of_work_impl import AccountUnitOfWorkImpl
+    from app.config.database.session import Base
+
+    tmp_dir = None
+    database_url = args.database_url
+    if database_url is None:
+        tmp_dir = tempfile.TemporaryDirectory(prefix="signup-bench-")
+        database_url = f"sqlite+aiosqlite:///{tmp_dir.name}/bench.db"
+
+    connect_args = {"timeout": 60} if database_url.startswith("sqlite") else {}
+    engine = create_async_engine(
+        database_url, pool_size=args.pool_size, max_overflow=args.max_overflow, connect_args=connect_args
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(bind=engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
+    # DB 로 보낸 문장 수 (COMMIT / ROLLBACK 포함)
+    statements = 0
+
+    def count(*_):
+        nonlocal statements
+        statements += 1
+
+    for name in ("before_cursor_execute", "commit", "rollback"):
+        event.listen(engine.sync_engine, name, count)
+
+    async def login(email: str) -> int:
+        async with session_maker() as db:
+            usecase = AccountUseCase(AccountRepositoryImpl(db), AccountUnitOfWorkImpl(db))
+            account = await usecase.get_or_create_account(email=email, nickname=email.split("@")[0])
+            return account.id
+
+    failures = 0
+    try:
+        run_id = uuid.uuid4().hex[:8]
+
+        # 1. 왕복 수 (순차 실행이라 다른 호출의 문장이 섞이지 않음)
+        email = f"first-{run_id}@bench.local"
+        statements = 0
+        await login(email)
+        first_login = statements
+        statements = 0
+        await login(email)
+        returning_login = statements
+        print(f"statements per call  first login={first_login}  returning login={returning_login}")
+
+        # 2. 동시 가입
+        latencies: list[float] = []
+        errors: dict[str, int] = defaultdict(int)
+        for round_no in range(args.rounds):
+            emails = [f"burst-{run_id}-{round_no}-{i}@bench.local" for i in range(args.emails)]
+            ids: dict[str, set[int]] = defaultdict(set)
+
+            async def one(i: int) -> None:
+                email = emails[i % len(emails)]
+                started = time.perf_counter()
+                try:
+                    ids[email].add(await login(email))
+                except Exception as exc:
+                    errors[type(exc).__name__] += 1
+                latencies.append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            await asyncio.gather(*(one(i) for i in range(args.concurrency)))
+            elapsed = time.perf_counter() - started
+
+            async with session_maker() as db:
+                rows = dict((await db.execute(
+                    select(AccountModel.email, func.count()).where(AccountModel.email.in_(emails))
+                    .group_by(AccountModel.email)
+                )).all())
+
+            bad = [e for e in emails if rows.get(e) != 1 or len(ids[e]) != 1]
+            failures += len(bad)
+            print(
+                f"round {round_no + 1}: {args.concurrency} calls / {len(emails)} emails in {elapsed * 1000:.0f}ms  "
+                f"rows per email={[rows.get(e, 0) for e in emails]}  "
+                f"ids per email={[len(ids[e]) for e in emails]}  {'OK' if not bad else 'MISMATCH'}"
+            )
+
+        failures += sum(errors.values())
+        print(
+            f"latency p50/p95/p99={percentile(latencies, 50)}/{percentile(latencies, 95)}/"
+            f"{percentile(latencies, 99)}ms  mean={statistics.mean(latencies) * 1000:.2f}ms  "
+            f"errors={dict(errors) or 0}"
+        )
+    finally:
+        await engine.dispose()
+        if tmp_dir is not None:
+            tmp_dir.cleanup()
+
+    print("PASS" if failures == 0 else f"FAIL ({failures})")
+    return 0 if failures == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
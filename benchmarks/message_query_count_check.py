@@ -0,0 +1,162 @@
+"""GetChatMessagesUseCase 쿼리 수 회귀 검사 (메시지 수와 무관하게 일정해야 함).
+
+메시지 10개 / 400개 방을 만들고 (상담사 메시지 절반에 내 피드백, 일부에 다른 계정 피드백)
+GET /rooms/{room_id}/messages 가 쓰는 세 경로에서 DB 로 보낸 문장 수를 센다.
+
+- 전체 조회: execute(room_id, account_id)
+- 페이지 조회: execute(room_id, account_id, limit=50)
+- NDJSON 스트림: stream(room_id, account_id)
+
+방 크기별 문장 수가 다르거나(메시지당 피드백 조회 등 N+1) 피드백이 잘못 붙으면 종료 코드 1.
+
+사용 예:
+    python benchmarks/message_query_count_check.py
+    python benchmarks/message_query_count_check.py --sizes 10,400,2000
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import uuid
+
+from stream_chat_benchmark import BENCH_ENV, ROOT
+
+ACCOUNT_ID = 1
+OTHER_ACCOUNT_ID = 2
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10,400", help="쉼표로 구분한 방별 메시지 수")
+    parser.add_argument("--database-url", default=None, help="비동기 SQLAlchemy URL (기본: 임시 SQLite 파일)")
+    return parser.parse_args()
+
+
+async def main() -> int:
+    args = parse_args()
+    for key, value in BENCH_ENV.items():
+        os.environ.setdefault(key, value)
+    os.environ["LLM_BACKEND"] = "fake"
+    sys.path.insert(0, str(ROOT))
+
+    from sqlalchemy import event
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+    from app.config.database.session import Base
+    from app.config.security.message_crypto import AESEncryption
+    from app.conversation.application.usecase.get_chat_message_usecase import GetChatMessagesUseCase
+    from app.conversation.domain.chat_feedback.enums import Satisfaction
+    from app.conversation.infrastructure.orm.chat_message_feedback_orm import ChatFeedbackOrm
+    from app.conversation.infrastructure.orm.chat_message_orm import ChatMessageOrm
+    from app.conversation.infrastructure.orm.chat_room_orm import ChatRoomOrm
+    from app.conversation.infrastructure.repository.chat_message_repository_impl import ChatMessageRepositoryImpl
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    tmp_dir = None
+    database_url = args.database_url
+    if database_url is None:
+        tmp_dir = tempfile.TemporaryDirectory(prefix="query-count-")
+        database_url = f"sqlite+aiosqlite:///{tmp_dir.name}/check.db"
+
+    engine = create_async_engine(database_url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(bind=engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
+    statements = 0
+
+    def count(*_):
+        nonlocal statements
+        statements += 1
+
+    crypto = AESEncryption()
+
+    async def seed(size: int) -> tuple[str, int]:
+        """방 하나를 만들고 (room_id, 내 피드백 수) 를 반환"""
+        room_id = str(uuid.uuid4())
+        async with session_maker() as db:
+            db.add(ChatRoomOrm(
+                room_id=room_id, account_id=ACCOUNT_ID, title="check",
+                category="GENERAL", division="DEFAULT", out_api="FALSE", status="ACTIVE",
+            ))
+            await db.flush()
+            messages = []
+            for i in range(size):
+                content_enc, iv = crypto.encrypt(f"메시지 {i}")
+                messages.append(ChatMessageOrm(
+                    room_id=room_id, account_id=ACCOUNT_ID, role="USER" if i % 2 == 0 else "ASSISTANT",
+                    content_enc=content_enc, iv=iv, enc_version=crypto.get_version(), contents_type="TEXT",
+                ))
+            db.add_all(messages)
+            await db.flush()
+
+            mine = 0
+            for i, m in enumerate(messages):
+                if i % 4 == 1:
+                    db.add(ChatFeedbackOrm(account_id=ACCOUNT_ID, message_id=m.id, satisfaction=Satisfaction.LIKE))
+                    mine += 1
+                elif i % 4 == 3 and i % 8 == 7:
+                    # 다른 계정의 피드백은 붙으면 안 됨
+                    db.add(ChatFeedbackOrm(
+                        account_id=OTHER_ACCOUNT_ID, message_id=m.id, satisfaction=Satisfaction.DISLIKE,
+                    ))
+            await db.commit()
+        return room_id, mine
+
+    async def measure(room_id: str) -> dict:
+        nonlocal statements
+        counts = {}
+        results = {}
+        async with session_maker() as db:
+            uc = GetChatMessagesUseCase(ChatMessageRepositoryImpl(db), crypto)
+
+            statements = 0
+            results["full"] = await uc.execute(room_id, ACCOUNT_ID)
+            counts["full"] = statements
+
+            statements = 0
+            results["page"] = await uc.execute(room_id, ACCOUNT_ID, limit=50)
+            counts["page"] = statements
+
+            statements = 0
+            results["stream"] = [row async for row in uc.stream(room_id, ACCOUNT_ID)]
+            counts["stream"] = statements
+        return {"counts": counts, "results": results}
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count)
+    failures = []
+    per_size = {}
+    try:
+        for size in sizes:
+            room_id, mine = await seed(size)
+            measured = await measure(room_id)
+            per_size[size] = measured["counts"]
+
+            full, stream = measured["results"]["full"], measured["results"]["stream"]
+            liked = sum(1 for m in full if m["user_feedback"] == Satisfaction.LIKE.value)
+            disliked = sum(1 for m in full if m["user_feedback"] == Satisfaction.DISLIKE.value)
+            if len(full) != size or len(stream) != size or len(measured["results"]["page"]) != min(size, 50):
+                failures.append(f"size={size}: 반환된 메시지 수가 다름")
+            if liked != mine or disliked:
+                failures.append(f"size={size}: 내 피드백 {mine}건 중 {liked}건, 다른 계정 피드백 {disliked}건이 붙음")
+            print(f"messages={size:>6}  statements {measured['counts']}")
+    finally:
+        await engine.dispose()
+        if tmp_dir is not None:
+            tmp_dir.cleanup()
+
+    baseline = per_size[sizes[0]]
+    for size, counts in per_size.items():
+        if counts != baseline:
+            failures.append(f"size={size}: 문장 수 {counts} != {baseline} (size={sizes[0]})")
+
+    for failure in failures:
+        print(f"  {failure}")
+    print("PASS" if not failures else f"FAIL ({len(failures)})")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,288 @@
+"""/auth/{provider} → /auth/{provider}/callback 로그인 경로 종단 간 벤치마크.
+
+실제 FastAPI 앱(OAuth 시작 → 콜백: 토큰 교환 / userinfo / 계정 조회·생성 / JWT 발급)을 그대로 거치되,
+외부 의존성만 프로세스 내 대역으로 바꾼다.
+
+- OAuth: MockOAuthProvider 를 OAuthProviderFactory.register_provider("mock", ...) 로 등록하고,
+  모의 IdP(mock_idp.create_mock_idp_app)를 공용 OAuth HTTP 클라이언트에 ASGI transport 로 연결
+  (--idp-latency-ms / --idp-jitter-ms / --idp-failure-rate)
+- DB: SQLite(aiosqlite) 파일 또는 --database-url 로 지정한 MySQL
+- Redis: fakeredis
+
+가상 사용자 한 명의 로그인:
+1. GET /api/v1/auth/mock                → 302 (IdP 인가 URL) + oauth_state 쿠키
+2. GET <IdP>/authorize?login_hint=...   → 302 (redirect_uri?code&state)   - 브라우저 구간
+3. GET /api/v1/auth/mock/callback       → 302 (FRONTEND_URL) + access_token 쿠키
+4. GET /api/v1/auth/status              → 발급된 JWT 로 해당 이메일 계정이 보이는지 확인 (지연 시간에는 미포함)
+
+사용 예:
+    python benchmarks/oauth_login_benchmark.py --concurrency 1,10,50,100
+    python benchmarks/oauth_login_benchmark.py --concurrency 50 --users 20   # 재로그인 + 같은 계정 동시 로그인 섞기
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import urlencode, urlsplit
+
+from stream_chat_benchmark import BENCH_ENV, ROOT, RESULTS_DIR, git_commit, percentile, setup_app
+
+IDP_BASE_URL = "http://mock-idp.bench"
+
+
+@dataclass
+class LoginSample:
+    start: float = 0.0
+    authorize: float = 0.0
+    callback: float = 0.0
+    total: float = 0.0
+    error: str | None = None
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", default="1,10,50,100",
+                        help="쉼표로 구분한 동시 로그인 수 목록")
+    parser.add_argument("--requests", type=int, default=None,
+                        help="단계별 총 로그인 수 (기본: max(동시 수 x 2, 20))")
+    parser.add_argument("--users", type=int, default=0,
+                        help="돌려 쓸 이메일 수 (기본 0: 매 로그인이 신규 가입)")
+    parser.add_argument("--database-url", default=None,
+                        help="비동기 SQLAlchemy URL (기본: 임시 SQLite 파일)")
+    parser.add_argument("--idp-latency-ms", type=float, default=100.0,
+                        help="모의 IdP 응답마다 더하는 지연 (authorize / token / userinfo)")
+    parser.add_argument("--idp-jitter-ms", type=float, default=20.0)
+    parser.add_argument("--idp-failure-rate", type=float, default=0.0,
+                        help="token / userinfo 를 503 으로 응답할 확률 (userinfo 는 재시도됨)")
+    parser.add_argument("--pool-size", type=int, default=10)
+    parser.add_argument("--max-overflow", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default=None, help="결과 JSON 경로 (기본: benchmarks/results/)")
+    return parser.parse_args()
+
+
+def prepare_env() -> None:
+    """앱 모듈을 import 하기 전에 호출해야 한다 (settings 는 import 시점에 고정됨)."""
+    for key, value in BENCH_ENV.items():
+        os.environ.setdefault(key, value)
+    os.environ["OAUTH_MOCK_BASE_URL"] = IDP_BASE_URL
+    # 대화 라우터가 import 시점에 LLM 백엔드를 만들므로 OpenAI 설정 없이 뜨도록
+    os.environ["LLM_BACKEND"] = "fake"
+    sys.path.insert(0, str(ROOT))
+
+
+def setup_mock_idp(args: argparse.Namespace):
+    """모의 IdP 를 등록하고, IdP 로 가는 브라우저 구간용 transport 를 반환"""
+    import httpx
+
+    from app.auth.infrastructure.oauth.factory import OAuthProviderFactory
+    from app.auth.infrastructure.oauth.http_client import oauth_http_client
+    from app.auth.infrastructure.oauth.mock import MockOAuthProvider
+    from app.auth.infrastructure.oauth.mock_idp import create_mock_idp_app
+
+    OAuthProviderFactory.register_provider("mock", MockOAuthProvider)
+    idp = create_mock_idp_app(
+        latency_ms=args.idp_latency_ms,
+        jitter_ms=args.idp_jitter_ms,
+        failure_rate=args.idp_failure_rate,
+        seed=args.seed,
+    )
+    oauth_http_client.register_transport(IDP_BASE_URL, httpx.ASGITransport(app=idp))
+    return httpx.ASGITransport(app=idp)
+
+
+def path_of(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.path}?{parts.query}" if parts.query else parts.path
+
+
+async def login(app_transport, idp_transport, email: str) -> LoginSample:
+    import httpx
+
+    sample = LoginSample()
+    # 가상 사용자마다 클라이언트(쿠키 저장소)를 따로 둔다
+    async with httpx.AsyncClient(transport=app_transport, base_url="http://bench") as server, \
+            httpx.AsyncClient(transport=idp_transport, base_url=IDP_BASE_URL) as browser:
+        try:
+            started = time.perf_counter()
+            r = await server.get("/api/v1/auth/mock")
+            sample.start = time.perf_counter() - started
+            if r.status_code != 302:
+                raise RuntimeError(f"start HTTP {r.status_code}")
+
+            t = time.perf_counter()
+            r = await browser.get(f"{path_of(r.headers['location'])}&{urlencode({'login_hint': email})}")
+            sample.authorize = time.perf_counter() - t
+            if r.status_code != 302:
+                raise RuntimeError(f"authorize HTTP {r.status_code}")
+
+            t = time.perf_counter()
+            r = await server.get(path_of(r.headers["location"]))
+            sample.callback = time.perf_counter() - t
+            sample.total = time.perf_counter() - started
+            if r.status_code != 302 or "access_token" not in r.cookies:
+                raise RuntimeError(f"callback HTTP {r.status_code}: {r.text[:100]}")
+
+            r = await server.get("/api/v1/auth/status")
+            user = r.json().get("user") or {}
+            if user.get("email") != email:
+                raise RuntimeError(f"status mismatch: {user.get('email')!r} != {email!r}")
+        except Exception as e:
+            sample.error = f"{type(e).__name__}: {e}"
+    return sample
+
+
+def summarize(concurrency: int, samples: list[LoginSample], wall_time: float) -> dict:
+    ok = [s for s in samples if s.error is None]
+
+    def ms(values: list[float]) -> dict:
+        return {
+            f"p{p}": round(v * 1000, 3) if (v := percentile(values, p)) is not None else None
+            for p in (50, 95, 99)
+        }
+
+    return {
+        "concurrency": concurrency,
+        "requests": len(samples),
+        "succeeded": len(ok),
+        "failed": len(samples) - len(ok),
+        "errors": sorted({s.error for s in samples if s.error})[:5],
+        "wall_time_s": round(wall_time, 3),
+        "logins_per_second": round(len(ok) / wall_time, 3) if wall_time else None,
+        "start_ms": ms([s.start for s in ok]),
+        "authorize_ms": ms([s.authorize for s in ok]),
+        "callback_ms": ms([s.callback for s in ok]),
+        "total_latency_ms": ms([s.total for s in ok]),
+    }
+
+
+async def run_level(app_transport, idp_transport, concurrency: int, total_requests: int, users: int,
+                    run_id: str) -> dict:
+    queue: asyncio.Queue[int] = asyncio.Queue()
+    for i in range(total_requests):
+        queue.put_nowait(i)
+
+    samples: list[LoginSample] = []
+
+    async def worker():
+        while True:
+            try:
+                i = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            # --users 0 이면 매번 새 이메일, 아니면 users 개를 돌려 씀 (단계 간에도 공유 → 재로그인)
+            email = f"bench-{run_id}-{i % users if users else f'{concurrency}-{i}'}@example.com"
+            samples.append(await login(app_transport, idp_transport, email))
+
+    from app.auth.adapter.input.web.dependencies import account_cache
+
+    cache_before = account_cache.stats()
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    result = summarize(concurrency, samples, time.perf_counter() - started)
+    result["account_cache"] = account_cache_delta(cache_before, account_cache.stats())
+    return result
+
+
+def account_cache_delta(before: dict, after: dict) -> dict:
+    """단계 동안의 계정 캐시 적중 / 실패 / 무효화 수 (카운터는 워커 시작부터 누적, 최대 적중 나이는 누적 값 그대로)"""
+    delta = {
+        key: after[key] - before[key]
+        for key in ("local_hits", "redis_hits", "misses", "invalidations", "redis_errors")
+    }
+    hits = delta["local_hits"] + delta["redis_hits"]
+    lookups = hits + delta["misses"]
+    return {
+        **delta,
+        "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+        "local_entries": after["local_entries"],
+        "max_hit_age_seconds": after["max_hit_age_seconds"],
+    }
+
+
+def print_level(result: dict) -> None:
+    print(
+        f"c={result['concurrency']:>4}  ok={result['succeeded']:>5}/{result['requests']:<5} "
+        f"logins/s={result['logins_per_second']!s:>8}  "
+        f"callback p50/p95/p99={result['callback_ms']['p50']}/{result['callback_ms']['p95']}/"
+        f"{result['callback_ms']['p99']}ms  "
+        f"total p50/p95/p99={result['total_latency_ms']['p50']}/{result['total_latency_ms']['p95']}/"
+        f"{result['total_latency_ms']['p99']}ms  "
+        f"account cache hit={result['account_cache']['hit_rate'] if 'account_cache' in result else None}"
+    )
+    for error in result["errors"]:
+        print(f"      {error}")
+
+
+async def main() -> None:
+    args = parse_args()
+    prepare_env()
+
+    import httpx
+
+    levels = [int(c) for c in args.concurrency.split(",") if c.strip()]
+    tmp_dir = None
+    database_url = args.database_url
+    if database_url is None:
+        tmp_dir = tempfile.TemporaryDirectory(prefix="login-bench-")
+        database_url = f"sqlite+aiosqlite:///{tmp_dir.name}/bench.db"
+
+    app, engine, _ = await setup_app(database_url, args.pool_size, args.max_overflow)
+    idp_transport = setup_mock_idp(args)
+    app_transport = httpx.ASGITransport(app=app)
+
+    from app.auth.infrastructure.oauth.http_client import oauth_http_client
+
+    run_id = uuid.uuid4().hex[:8]
+    results = []
+    try:
+        for concurrency in levels:
+            total_requests = args.requests or max(concurrency * 2, 20)
+            result = await run_level(app_transport, idp_transport, concurrency, total_requests, args.users, run_id)
+            print_level(result)
+            results.append(result)
+    finally:
+        await oauth_http_client.aclose()
+        await engine.dispose()
+        if tmp_dir is not None:
+            tmp_dir.cleanup()
+
+    commit = git_commit()
+    report = {
+        "benchmark": "oauth_login",
+        "commit": commit,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "database": database_url.split("://")[0],
+        "config": {
+            "users": args.users,
+            "idp_latency_ms": args.idp_latency_ms,
+            "idp_jitter_ms": args.idp_jitter_ms,
+            "idp_failure_rate": args.idp_failure_rate,
+            "seed": args.seed,
+            "pool_size": args.pool_size,
+            "max_overflow": args.max_overflow,
+        },
+        "results": results,
+    }
+
+    output = Path(args.output) if args.output else (
+        RESULTS_DIR / f"oauth_login-{commit or 'local'}-{datetime.now():%Y%m%d-%H%M%S}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=2))
+    print(f"\n결과 저장: {output}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
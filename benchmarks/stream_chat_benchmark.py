@@ -0,0 +1,449 @@
+"""/conversation/chat/stream-auto 종단 간 스트리밍 벤치마크.
+
+실제 FastAPI 앱(인증 → 라우터 → StreamChatUsecase → 암호화/DB 저장)을 그대로 거치되,
+외부 의존성만 프로세스 내 대역으로 바꿔 오프라인에서 재현 가능하게 측정한다.
+
+- DB: SQLite(aiosqlite) 파일 또는 --database-url 로 지정한 MySQL
+- Redis: fakeredis (JWT 블랙리스트 / 세션 조회)
+- LLM: LLM_BACKEND=fake (FakeLlmChatAdapter, TTFT / tokens/sec / 실패율 조절)
+
+httpx.ASGITransport 는 응답 본문을 모두 모은 뒤 돌려주므로 TTFB 를 잴 수 없다.
+그래서 ASGI 앱을 직접 호출하고 http.response.body 메시지가 도착한 시각을 기록한다.
+
+사용 예:
+    python benchmarks/stream_chat_benchmark.py --concurrency 1,10,50,100,500
+    python benchmarks/stream_chat_benchmark.py --concurrency 50 --compare benchmarks/results/before.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+# Settings / AESEncryption / redis_config 가 import 시점에 요구하는 값 (이미 설정된 값은 유지)
+BENCH_ENV = {
+    "MYSQL_HOST": "localhost",
+    "MYSQL_PORT": "3306",
+    "MYSQL_USER": "bench",
+    "MYSQL_PASSWORD": "bench",
+    "MYSQL_DATABASE": "bench",
+    "REDIS_HOST": "localhost",
+    "REDIS_PORT": "6379",
+    "REDIS_DB": "0",
+    "CORS_ALLOWED_FRONTEND_URL": "http://localhost:3000",
+    "FRONTEND_URL": "http://localhost:3000",
+    "CSRF_SECRET_KEY": "bench-csrf-secret",
+    "JWT_SECRET_KEY": "bench-jwt-secret-key-0123456789abcdef",
+    "JWT_ENCRYPTION_KEY": "bench-jwt-encryption-key-0123456789",
+    "AES_KEY": "YmVuY2gtYWVzLWtleS0wMTIzNDU2Nzg5YWJjZGVmMDE=",  # 32 bytes
+    "AES_IV": "YmVuY2gtYWVzLWl2LTAxMg==",  # 16 bytes
+}
+
+
+@dataclass
+class Sample:
+    status: int = 0
+    ttfb: float | None = None
+    total: float = 0.0
+    chunk_gaps: list[float] = field(default_factory=list)
+    bytes: int = 0
+    error: str | None = None
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", default="1,10,50,100,500",
+                        help="쉼표로 구분한 동시 스트림 수 목록")
+    parser.add_argument("--requests", type=int, default=None,
+                        help="단계별 총 요청 수 (기본: max(동시 수 x 2, 20))")
+    parser.add_argument("--database-url", default=None,
+                        help="비동기 SQLAlchemy URL (기본: 임시 SQLite 파일)")
+    parser.add_argument("--history", type=int, default=20,
+                        help="방마다 미리 넣어 둘 이전 메시지 수")
+    parser.add_argument("--ttft-ms", type=float, default=300.0)
+    parser.add_argument("--tokens-per-second", type=float, default=50.0)
+    parser.add_argument("--response-tokens", type=int, default=200)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--quota", action="store_true",
+                        help="요금제 쿼터 / 동시 생성 제한 적용 (기본: 끔 - 벤치마크 계정 하나가 FREE 한도에 바로 걸림)")
+    parser.add_argument("--pool-size", type=int, default=10,
+                        help="DB 커넥션 풀 크기 (기본: 운영 기본값 DB_POOL_SIZE)")
+    parser.add_argument("--max-overflow", type=int, default=20,
+                        help="DB 커넥션 풀 초과 허용 수 (기본: 운영 기본값 DB_MAX_OVERFLOW)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default=None, help="결과 JSON 경로 (기본: benchmarks/results/)")
+    parser.add_argument("--compare", default=None, help="비교할 이전 결과 JSON")
+    return parser.parse_args()
+
+
+def prepare_env(args: argparse.Namespace) -> None:
+    """앱 모듈을 import 하기 전에 호출해야 한다 (settings 는 import 시점에 고정됨)."""
+    for key, value in BENCH_ENV.items():
+        os.environ.setdefault(key, value)
+
+    os.environ["LLM_BACKEND"] = "fake"
+    os.environ["LLM_FAKE_TTFT_MS"] = str(args.ttft_ms)
+    os.environ["LLM_FAKE_TOKENS_PER_SECOND"] = str(args.tokens_per_second)
+    os.environ["LLM_FAKE_RESPONSE_TOKENS"] = str(args.response_tokens)
+    os.environ["LLM_FAKE_FAILURE_RATE"] = str(args.failure_rate)
+    os.environ["LLM_FAKE_SEED"] = str(args.seed)
+    os.environ["USAGE_QUOTA_ENABLED"] = "true" if args.quota else "false"
+    os.environ["CONCURRENCY_LIMIT_ENABLED"] = "true" if args.quota else "false"
+    sys.path.insert(0, str(ROOT))
+
+
+async def setup_app(database_url: str, pool_size: int = 10, max_overflow: int = 20):
+    """DB / Redis 를 대역으로 바꾼 FastAPI 앱을 반환"""
+    import fakeredis
+    import redis.asyncio
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+    import app.config.redis_config as redis_config
+
+    # 라우터 import 시점에 재생 버퍼 / 쿼터가 Redis 를 잡으므로 먼저 교체 (인증도 같은 풀 사용)
+    # 운영과 같은 크기의 대기형 커넥션 풀
+    redis_config._async_redis_instance = fakeredis.FakeAsyncRedis(
+        decode_responses=True,
+        connection_pool_class=redis.asyncio.BlockingConnectionPool,
+        max_connections=redis_config.REDIS_MAX_CONNECTIONS,
+        timeout=redis_config.REDIS_POOL_TIMEOUT,
+    )
+
+    from app.config.database import session as db_session
+    from app.conversation.adapter.input.web import conversation_router
+    from app.main import app
+
+    connect_args = {"timeout": 60} if database_url.startswith("sqlite") else {}
+    engine = create_async_engine(
+        database_url, pool_size=pool_size, max_overflow=max_overflow, pool_timeout=30, connect_args=connect_args
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(db_session.Base.metadata.create_all)
+
+    session_maker = async_sessionmaker(
+        bind=engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+    )
+    db_session.AsyncSessionLocal = session_maker
+    conversation_router.AsyncSessionLocal = session_maker
+
+    async def get_bench_db_session():
+        async with session_maker() as db:
+            yield db
+
+    app.dependency_overrides[db_session.get_async_db_session] = get_bench_db_session
+    return app, engine, session_maker
+
+
+async def seed_rooms(session_maker, count: int, history: int, account_id: int) -> list[str]:
+    """벤치마크용 방과 이전 대화를 미리 생성"""
+    import uuid
+
+    from app.config.security.message_crypto import AESEncryption
+    from app.conversation.infrastructure.orm.chat_message_orm import ChatMessageOrm
+    from app.conversation.infrastructure.orm.chat_room_orm import ChatRoomOrm
+
+    crypto = AESEncryption()
+    room_ids = [str(uuid.uuid4()) for _ in range(count)]
+    async with session_maker() as db:
+        for room_id in room_ids:
+            db.add(ChatRoomOrm(
+                room_id=room_id, account_id=account_id, title="bench",
+                category="GENERAL", division="DEFAULT", out_api="FALSE", status="ACTIVE",
+            ))
+        await db.flush()
+        for room_id in room_ids:
+            for i in range(history):
+                role = "USER" if i % 2 == 0 else "ASSISTANT"
+                content_enc, iv = crypto.encrypt(f"이전 대화 {i}번째 메시지입니다. 요즘 연인과 자주 다퉈서 고민이에요.")
+                db.add(ChatMessageOrm(
+                    room_id=room_id, account_id=account_id, role=role,
+                    content_enc=content_enc, iv=iv, enc_version=crypto.get_version(),
+                    contents_type="TEXT",
+                ))
+        await db.commit()
+    return room_ids
+
+
+def issue_access_token(account_id: int) -> str:
+    from app.auth.infrastructure.jwt.jwt_token_service import JWTTokenService
+    return JWTTokenService().create_token(account_id, "google").access_token
+
+
+async def stream_request(app, path: str, payload: dict, cookie: str) -> Sample:
+    """ASGI 앱을 직접 호출하여 본문 조각의 도착 시각을 기록"""
+    body = json.dumps(payload).encode("utf-8")
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.3"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [
+            (b"host", b"bench"),
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            (b"cookie", cookie.encode()),
+        ],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+
+    sample = Sample()
+    request_sent = False
+    response_done = asyncio.Event()
+    last_chunk_at = None
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await response_done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal last_chunk_at
+        now = time.perf_counter()
+        if message["type"] == "http.response.start":
+            sample.status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunk = message.get("body", b"")
+            if chunk:
+                if sample.ttfb is None:
+                    sample.ttfb = now - started
+                else:
+                    sample.chunk_gaps.append(now - last_chunk_at)
+                last_chunk_at = now
+                sample.bytes += len(chunk)
+            if not message.get("more_body", False):
+                response_done.set()
+
+    started = time.perf_counter()
+    try:
+        await app(scope, receive, send)
+    except Exception as e:  # 스트리밍 도중 실패 (예: LLM 실패 주입)
+        sample.error = f"{type(e).__name__}: {e}"
+    finally:
+        response_done.set()
+    sample.total = time.perf_counter() - started
+    if sample.status != 200 and sample.error is None:
+        sample.error = f"HTTP {sample.status}"
+    return sample
+
+
+def percentile(values: list[float], p: float) -> float | None:
+    """nearest-rank 백분위수"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(p / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+def summarize(concurrency: int, samples: list[Sample], wall_time: float) -> dict:
+    ok = [s for s in samples if s.error is None]
+    ttfb = [s.ttfb for s in ok if s.ttfb is not None]
+    totals = [s.total for s in ok]
+    gaps = [g for s in ok for g in s.chunk_gaps]
+
+    def ms(values: list[float]) -> dict:
+        return {
+            f"p{p}": round(v * 1000, 3) if (v := percentile(values, p)) is not None else None
+            for p in (50, 95, 99)
+        }
+
+    return {
+        "concurrency": concurrency,
+        "requests": len(samples),
+        "succeeded": len(ok),
+        "failed": len(samples) - len(ok),
+        "errors": sorted({s.error for s in samples if s.error})[:5],
+        "wall_time_s": round(wall_time, 3),
+        "requests_per_second": round(len(ok) / wall_time, 3) if wall_time else None,
+        "ttfb_ms": ms(ttfb),
+        "inter_chunk_ms": ms(gaps),
+        "total_latency_ms": ms(totals),
+        "chunks_per_response": round(sum(len(s.chunk_gaps) + 1 for s in ok) / len(ok), 1) if ok else 0,
+        "bytes_per_response": round(sum(s.bytes for s in ok) / len(ok), 1) if ok else 0,
+    }
+
+
+async def run_level(app, engine, session_maker, concurrency: int, total_requests: int, history: int, cookie: str,
+                    account_id: int) -> dict:
+    # 동시 스트림마다 자기 방을 갖고, 같은 방에서 턴을 이어간다
+    room_ids = await seed_rooms(session_maker, concurrency, history, account_id)
+    queue: asyncio.Queue[int] = asyncio.Queue()
+    for i in range(total_requests):
+        queue.put_nowait(i)
+
+    samples: list[Sample] = []
+
+    async def worker(room_id: str):
+        while True:
+            try:
+                i = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            payload = {"message": f"벤치마크 메시지 {i}: 요즘 대화가 자꾸 엇갈려요.", "room_id": room_id}
+            samples.append(await stream_request(app, "/conversation/chat/stream-auto", payload, cookie))
+
+    # 동시 스트림 수와 실제로 잡힌 DB 커넥션 수를 비교하기 위해 풀 사용량을 주기적으로 기록
+    max_connections = 0
+    sampling = True
+
+    async def sample_pool():
+        nonlocal max_connections
+        while sampling:
+            max_connections = max(max_connections, engine.pool.checkedout())
+            await asyncio.sleep(0.005)
+
+    from app.conversation.adapter.input.web.conversation_router import message_cache
+
+    cache_before = message_cache.stats()
+    sampler = asyncio.create_task(sample_pool())
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(room_id) for room_id in room_ids))
+    wall_time = time.perf_counter() - started
+    sampling = False
+    await sampler
+
+    result = summarize(concurrency, samples, wall_time)
+    result["max_db_connections"] = max_connections
+    result["message_cache"] = cache_delta(cache_before, message_cache.stats())
+    return result
+
+
+def cache_delta(before: dict, after: dict) -> dict:
+    """단계 동안의 복호화 평문 캐시 적중 / 실패 / 제거 수 (카운터는 워커 시작부터 누적)"""
+    hits = after["hits"] - before["hits"]
+    misses = after["misses"] - before["misses"]
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+        "evictions": after["evictions"] - before["evictions"],
+        "entries": after["entries"],
+        "bytes": after["bytes"],
+    }
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except Exception:
+        return None
+
+
+def print_level(result: dict) -> None:
+    print(
+        f"c={result['concurrency']:>4}  ok={result['succeeded']:>5}/{result['requests']:<5} "
+        f"rps={result['requests_per_second']!s:>8}  "
+        f"ttfb p50/p95/p99={result['ttfb_ms']['p50']}/{result['ttfb_ms']['p95']}/{result['ttfb_ms']['p99']}ms  "
+        f"chunk p50/p99={result['inter_chunk_ms']['p50']}/{result['inter_chunk_ms']['p99']}ms  "
+        f"total p50/p95/p99={result['total_latency_ms']['p50']}/{result['total_latency_ms']['p95']}/"
+        f"{result['total_latency_ms']['p99']}ms  db conn max={result.get('max_db_connections')}  "
+        f"msg cache hit={result['message_cache']['hit_rate'] if 'message_cache' in result else None}"
+    )
+
+
+def print_comparison(current: list[dict], baseline_path: str) -> None:
+    baseline = {r["concurrency"]: r for r in json.loads(Path(baseline_path).read_text())["results"]}
+    print(f"\n비교 기준: {baseline_path}")
+    for result in current:
+        before = baseline.get(result["concurrency"])
+        if before is None:
+            continue
+        parts = []
+        for label, key, sub in (
+            ("ttfb p95", "ttfb_ms", "p95"),
+            ("total p95", "total_latency_ms", "p95"),
+            ("rps", "requests_per_second", None),
+        ):
+            old = before[key][sub] if sub else before[key]
+            new = result[key][sub] if sub else result[key]
+            if old and new is not None:
+                parts.append(f"{label} {old} → {new} ({(new - old) / old * 100:+.1f}%)")
+        print(f"c={result['concurrency']:>4}  " + "  ".join(parts))
+
+
+async def main() -> None:
+    args = parse_args()
+    prepare_env(args)
+
+    levels = [int(c) for c in args.concurrency.split(",") if c.strip()]
+    tmp_dir = None
+    database_url = args.database_url
+    if database_url is None:
+        tmp_dir = tempfile.TemporaryDirectory(prefix="stream-bench-")
+        database_url = f"sqlite+aiosqlite:///{tmp_dir.name}/bench.db"
+
+    app, engine, session_maker = await setup_app(database_url, args.pool_size, args.max_overflow)
+    account_id = 1
+    cookie = f"access_token={issue_access_token(account_id)}"
+
+    results = []
+    try:
+        for concurrency in levels:
+            total_requests = args.requests or max(concurrency * 2, 20)
+            result = await run_level(
+                app, engine, session_maker, concurrency, total_requests, args.history, cookie, account_id
+            )
+            print_level(result)
+            results.append(result)
+    finally:
+        await engine.dispose()
+        if tmp_dir is not None:
+            tmp_dir.cleanup()
+
+    commit = git_commit()
+    report = {
+        "benchmark": "stream_chat_auto",
+        "commit": commit,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "database": database_url.split("://")[0],
+        "config": {
+            "history": args.history,
+            "ttft_ms": args.ttft_ms,
+            "tokens_per_second": args.tokens_per_second,
+            "response_tokens": args.response_tokens,
+            "failure_rate": args.failure_rate,
+            "seed": args.seed,
+            "pool_size": args.pool_size,
+            "max_overflow": args.max_overflow,
+            "quota": args.quota,
+        },
+        "results": results,
+    }
+
+    output = Path(args.output) if args.output else (
+        RESULTS_DIR / f"stream_chat-{commit or 'local'}-{datetime.now():%Y%m%d-%H%M%S}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=2))
+    print(f"\n결과 저장: {output}")
+
+    if args.compare:
+        print_comparison(results, args.compare)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,188 @@
+"""스트리밍 응답 조립 / 프롬프트 이력 구성의 조각당 비용 마이크로 벤치마크.
+
+DB / LLM / 암호화 없이 실제 코드 경로만 측정한다.
+
+- response: StreamChatUsecase.execute 가 N 개의 delta 를 흘려보내고 응답 전문을 조립하는 비용 (조각당 µs)
+- history:  Conversation.get_prompt_context / get_prompt_messages 가 M 개의 메시지를 이어 붙이는 비용 (메시지당 µs)
+- naive:    비교용 문자열 += 누적 (다른 참조가 있어 CPython 의 제자리 확장 최적화가 적용되지 않는 경우)
+
+조각당 / 메시지당 비용이 크기와 무관하게 평평하면 선형이다.
+
+사용 예:
+    python benchmarks/string_building_benchmark.py
+    python benchmarks/string_building_benchmark.py --response-sizes 1000,8000 --history-sizes 500,2000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+from stream_chat_benchmark import BENCH_ENV, RESULTS_DIR, ROOT, git_commit
+
+CHUNK = "마음이 "  # OpenAI delta 하나 ≈ 토큰 하나
+
+
+class IdentityCrypto:
+    """암호화 비용을 빼고 문자열 처리만 측정하기 위한 대역"""
+
+    def encrypt(self, plaintext: str):
+        return plaintext.encode("utf-8"), b"\0" * 16
+
+    def decrypt(self, ciphertext: bytes, iv: bytes = None) -> str:
+        return ciphertext.decode("utf-8")
+
+    def get_version(self) -> int:
+        return 1
+
+
+class InstantLlm:
+    def __init__(self, chunks: int):
+        self.chunks = chunks
+
+    async def stream_chat(self, messages, usage=None):
+        for _ in range(self.chunks):
+            yield CHUNK
+
+
+class InMemoryRoomRepo:
+    async def find_by_id(self, room_id):
+        return SimpleNamespace(room_id=room_id, status="ACTIVE")
+
+
+class InMemoryMessageRepo:
+    def __init__(self):
+        self.db = SimpleNamespace(commit=self._commit)
+        self._next_id = 1
+
+    async def _commit(self):
+        pass
+
+    async def find_by_room_id_after(self, room_id, after_id):
+        return []
+
+    async def save_message(self, **kwargs):
+        msg = SimpleNamespace(id=self._next_id, **kwargs)
+        self._next_id += 1
+        return msg
+
+
+class NoopUsageMeter:
+    async def check_available(self, account_id):
+        pass
+
+    async def record_usage(self, account_id, input_tokens, output_tokens):
+        pass
+
+
+async def measure_response(chunks: int, repeat: int) -> float:
+    from app.conversation.application.usecase.stream_chat_usecase import StreamChatUsecase
+
+    best = float("inf")
+    for _ in range(repeat):
+        usecase = StreamChatUsecase(
+            chat_room_repo=InMemoryRoomRepo(),
+            chat_message_repo=InMemoryMessageRepo(),
+            llm_chat_port=InstantLlm(chunks),
+            usage_meter=NoopUsageMeter(),
+            crypto_service=IdentityCrypto(),
+        )
+        started = time.perf_counter()
+        async for _ in usecase.execute("bench-room", 1, "안녕하세요", "TEXT"):
+            pass
+        best = min(best, time.perf_counter() - started)
+    return best / chunks * 1e6
+
+
+def measure_history(messages: int, repeat: int, as_messages: bool) -> float:
+    from app.conversation.domain.conversation.aggregate import Conversation
+
+    crypto = IdentityCrypto()
+    rows = [
+        SimpleNamespace(
+            id=i + 1,
+            room_id="bench-room",
+            role="USER" if i % 2 == 0 else "ASSISTANT",
+            content_enc=f"{i}번째 메시지입니다. 요즘 연인과 자주 다퉈서 고민이에요.".encode("utf-8"),
+            iv=b"\0" * 16,
+            enc_version=1,
+        )
+        for i in range(messages)
+    ]
+    conversation = Conversation(room=None, messages=rows)
+    build = conversation.get_prompt_messages if as_messages else conversation.get_prompt_context
+
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        build(crypto)
+        best = min(best, time.perf_counter() - started)
+    return best / messages * 1e6
+
+
+def measure_naive(chunks: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        text = ""
+        for _ in range(chunks):
+            snapshot = text  # 참조가 둘 이상이면 매번 전체 복사
+            text = snapshot + CHUNK
+        best = min(best, time.perf_counter() - started)
+    return best / chunks * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--response-sizes", default="1000,2000,4000,8000")
+    parser.add_argument("--history-sizes", default="250,500,1000,2000")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    for key, value in BENCH_ENV.items():
+        os.environ.setdefault(key, value)
+    sys.path.insert(0, str(ROOT))
+
+    response_sizes = [int(n) for n in args.response_sizes.split(",")]
+    history_sizes = [int(n) for n in args.history_sizes.split(",")]
+
+    results = {"response_us_per_chunk": {}, "naive_concat_us_per_chunk": {},
+               "history_context_us_per_message": {}, "history_messages_us_per_message": {}}
+
+    for n in response_sizes:
+        results["response_us_per_chunk"][n] = round(asyncio.run(measure_response(n, args.repeat)), 3)
+        results["naive_concat_us_per_chunk"][n] = round(measure_naive(n, args.repeat), 3)
+    for m in history_sizes:
+        results["history_context_us_per_message"][m] = round(measure_history(m, args.repeat, False), 3)
+        results["history_messages_us_per_message"][m] = round(measure_history(m, args.repeat, True), 3)
+
+    for name, series in results.items():
+        values = list(series.values())
+        growth = values[-1] / values[0] if values[0] else float("nan")
+        row = "  ".join(f"{size}={cost}" for size, cost in series.items())
+        print(f"{name:<34} {row}   (최대/최소 크기 비용 비율 {growth:.2f}x)")
+
+    commit = git_commit()
+    report = {
+        "benchmark": "string_building",
+        "commit": commit,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "repeat": args.repeat,
+        "results": results,
+    }
+    output = Path(args.output) if args.output else (
+        RESULTS_DIR / f"string_building-{commit or 'local'}-{datetime.now():%Y%m%d-%H%M%S}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=2))
+    print(f"\n결과 저장: {output}")
+
+
+if __name__ == "__main__":
+    main()
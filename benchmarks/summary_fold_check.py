@@ -0,0 +1,167 @@
+"""RefreshConversationSummaryUseCase 요약 접기 누락 검사.
+
+긴 한국어 상담 메시지가 쌓인 방에서 요약을 처음 만들 때, 요약된 것으로 표시되는 메시지
+(covered_message_id 이하)가 모두 실제 요약 입력에 들어갔는지 확인한다.
+요약 입력 예산(PROMPT_CONTEXT_MAX_TOKENS)을 넘는 구간은 여러 조각으로 나눠 접고,
+갱신 한 번에 최대 CONVERSATION_SUMMARY_MAX_FOLDS 조각만 접어 나머지는 이후 턴의 갱신이 이어서 접는다.
+여기서는 새 메시지 없이 갱신만 반복해 밀린 구간이 모두 접힐 때까지 확인한다.
+요약 LLM 호출마다 사용 원장(usage_ledger)에 방 주인 계정으로 한 행씩 기록되는지도 확인한다.
+
+- DB: 임시 SQLite 파일 (chat_room / chat_msg / chat_message_analysis)
+- LLM: FakeLlmChatAdapter (받은 프롬프트를 기록)
+
+메시지마다 고유 표식 [m<번호>] 을 넣고, LLM 이 받은 프롬프트에 빠진 표식이 있거나
+원장 행 수가 LLM 호출 수와 다르거나, 갱신 한 번의 LLM 호출이 상한을 넘으면 종료 코드 1.
+
+사용 예:
+    python benchmarks/summary_fold_check.py
+    python benchmarks/summary_fold_check.py --messages 400 --message-chars 800
+"""
+
+import argparse
+import asyncio
+import os
+import re
+import sys
+import tempfile
+import uuid
+
+from stream_chat_benchmark import BENCH_ENV, ROOT
+
+MARKER = re.compile(r"\[m(\d+)\]")
+ACCOUNT_ID = 1
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=200, help="첫 요약 전에 쌓아 둘 메시지 수")
+    parser.add_argument("--message-chars", type=int, default=400, help="메시지 한 건의 대략적인 글자 수")
+    return parser.parse_args()
+
+
+async def main() -> int:
+    args = parse_args()
+    for key, value in BENCH_ENV.items():
+        os.environ.setdefault(key, value)
+    os.environ["LLM_BACKEND"] = "fake"
+    sys.path.insert(0, str(ROOT))
+
+    from sqlalchemy import func, select
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+    from app.config.database.session import Base
+    from app.config.security.message_crypto import AESEncryption
+    from app.config.settings import settings
+    from app.conversation.application.policy.summary_policy import SummaryPolicy
+    from app.conversation.application.usecase.refresh_conversation_summary_usecase import (
+        RefreshConversationSummaryUseCase,
+    )
+    from app.conversation.infrastructure.llm.fake_llm_chat_adapter import FakeLlmChatAdapter
+    from app.conversation.infrastructure.orm.chat_message_orm import ChatMessageOrm
+    from app.conversation.infrastructure.orm.chat_room_orm import ChatRoomOrm
+    from app.conversation.infrastructure.orm.usage_ledger_orm import UsageLedgerOrm
+    from app.conversation.infrastructure.repository.conversation_summary_repository_impl import (
+        ConversationSummaryRepositoryImpl,
+    )
+    from app.conversation.infrastructure.repository.usage_ledger_repository_impl import UsageLedgerRepositoryImpl
+
+    class RecordingLlm(FakeLlmChatAdapter):
+        def __init__(self):
+            super().__init__(ttft_ms=0, tokens_per_second=0, response_tokens=20)
+            self.prompts: list[str] = []
+
+        async def stream_chat(self, messages, usage=None):
+            self.prompts.append("\n".join(m["content"] for m in messages))
+            async for chunk in super().stream_chat(messages, usage=usage):
+                yield chunk
+
+    tmp_dir = tempfile.TemporaryDirectory(prefix="summary-check-")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_dir.name}/check.db")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(bind=engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
+    crypto = AESEncryption()
+    room_id = str(uuid.uuid4())
+    filler = "요즘 연인과 대화가 자꾸 엇나가서 서운한 마음이 쌓이고, 어떻게 말을 꺼내야 할지 모르겠어요. "
+    try:
+        async with session_maker() as db:
+            db.add(ChatRoomOrm(
+                room_id=room_id, account_id=ACCOUNT_ID, title="check",
+                category="GENERAL", division="DEFAULT", out_api="FALSE", status="ACTIVE",
+            ))
+            await db.flush()
+            for i in range(args.messages):
+                text = f"[m{i}] " + (filler * (args.message_chars // len(filler) + 1))[:args.message_chars]
+                content_enc, iv = crypto.encrypt(text)
+                db.add(ChatMessageOrm(
+                    room_id=room_id, account_id=ACCOUNT_ID, role="USER" if i % 2 == 0 else "ASSISTANT",
+                    content_enc=content_enc, iv=iv, enc_version=crypto.get_version(), contents_type="TEXT",
+                ))
+            await db.commit()
+
+            messages = (await db.execute(
+                select(ChatMessageOrm).where(ChatMessageOrm.room_id == room_id).order_by(ChatMessageOrm.id)
+            )).scalars().all()
+        marker_of = {m.id: i for i, m in enumerate(messages)}
+
+        # 턴마다 하듯 직전 요약 이후의 메시지로 갱신을 반복 (새로 접을 게 없으면 None)
+        llm = RecordingLlm()
+        summary = None
+        calls_per_refresh: list[int] = []
+        while True:
+            tail = [m for m in messages if summary is None or m.id > summary.covered_message_id]
+            calls_before = len(llm.prompts)
+            async with session_maker() as db:
+                uc = RefreshConversationSummaryUseCase(
+                    summary_repo=ConversationSummaryRepositoryImpl(db),
+                    llm_chat_port=llm,
+                    crypto_service=crypto,
+                    usage_ledger_repo=UsageLedgerRepositoryImpl(db),
+                )
+                refreshed = await uc.execute(room_id, ACCOUNT_ID, summary, tail)
+            if refreshed is None:
+                break
+            calls_per_refresh.append(len(llm.prompts) - calls_before)
+            summary = refreshed
+
+        async with session_maker() as db:
+            ledger_rows = (await db.execute(
+                select(func.count()).select_from(UsageLedgerOrm)
+                .where(UsageLedgerOrm.room_id == room_id, UsageLedgerOrm.account_id == ACCOUNT_ID)
+            )).scalar_one()
+    finally:
+        await engine.dispose()
+        tmp_dir.cleanup()
+
+    covered = summary.covered_message_id if summary else None
+    seen = {int(n) for prompt in llm.prompts for n in MARKER.findall(prompt)}
+    missing = [m.id for m in messages if covered is not None and m.id <= covered and marker_of[m.id] not in seen]
+    # 다 접고 남은 꼬리는 다음 갱신 기준에 못 미쳐야 함
+    tail = [m for m in messages if covered is None or m.id > covered]
+    left_to_fold = SummaryPolicy.messages_to_fold(
+        tail,
+        refresh_every_turns=settings.CONVERSATION_SUMMARY_EVERY_TURNS,
+        keep_recent=settings.CONVERSATION_SUMMARY_KEEP_RECENT,
+    )
+    max_folds = max(settings.CONVERSATION_SUMMARY_MAX_FOLDS, 1)
+
+    print(
+        f"messages={len(messages)}  refreshes={len(calls_per_refresh)}  llm_calls={len(llm.prompts)}  "
+        f"calls_per_refresh max={max(calls_per_refresh, default=0)} (limit {max_folds})  "
+        f"covered_message_id={covered}  tail={len(tail)}  ledger_rows={ledger_rows}  "
+        f"missing={missing[:10]}{'...' if len(missing) > 10 else ''}"
+    )
+    failed = (
+        covered is None
+        or bool(missing)
+        or bool(left_to_fold)
+        or max(calls_per_refresh) > max_folds
+        or ledger_rows != len(llm.prompts)
+    )
+    print("PASS" if not failed else "FAIL")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
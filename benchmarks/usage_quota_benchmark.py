@@ -0,0 +1,157 @@
+"""UsageMeterImpl 사용량 쿼터 확인 / 기록 비용 벤치마크.
+
+- check:  check_available 한 번의 지연 시간과 Redis 왕복 수 (허용되는 계정)
+- record: record_usage 한 번의 지연 시간과 Redis 왕복 수
+- shed:   한도를 넘겨 로컬에서 거부되는 계정의 check_available 지연 시간 (Redis 왕복 0 이어야 함)
+
+요금제 조회는 워커 로컬 캐시에 적중한 상태를 가정하고 고정값으로 대신한다.
+기본은 fakeredis(프로세스 내)이므로 지연 시간에는 네트워크가 빠져 있다. 실제 수치는 --redis-url 로 측정한다.
+
+사용 예:
+    python benchmarks/usage_quota_benchmark.py
+    python benchmarks/usage_quota_benchmark.py --redis-url redis://localhost:6379/0 --iterations 5000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from stream_chat_benchmark import BENCH_ENV, RESULTS_DIR, ROOT, git_commit, percentile
+
+
+class FixedPlan:
+    def __init__(self, plan: str):
+        self.plan = plan
+
+    async def get_plan(self, account_id: int) -> str:
+        return self.plan
+
+
+def count_round_trips(redis_client) -> list[int]:
+    """단일 명령과 파이프라인 실행을 각각 왕복 1회로 센다"""
+    counter = [0]
+    execute_command = redis_client.execute_command
+    pipeline = redis_client.pipeline
+
+    async def counted_execute_command(*args, **kwargs):
+        counter[0] += 1
+        return await execute_command(*args, **kwargs)
+
+    def counted_pipeline(*args, **kwargs):
+        pipe = pipeline(*args, **kwargs)
+        execute = pipe.execute
+
+        async def counted_execute(*a, **k):
+            counter[0] += 1
+            return await execute(*a, **k)
+
+        pipe.execute = counted_execute
+        return pipe
+
+    redis_client.execute_command = counted_execute_command
+    redis_client.pipeline = counted_pipeline
+    return counter
+
+
+async def measure(call, iterations: int, counter: list[int]) -> dict:
+    await call(0)  # 스크립트 적재 등 첫 호출 비용 제외
+    latencies = []
+    counter[0] = 0
+    for i in range(iterations):
+        started = time.perf_counter()
+        await call(i)
+        latencies.append(time.perf_counter() - started)
+    return {
+        "p50_ms": round(percentile(latencies, 50) * 1000, 4),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 4),
+        "round_trips_per_call": round(counter[0] / iterations, 2),
+    }
+
+
+async def run(args: argparse.Namespace) -> dict:
+    import fakeredis
+    import redis.asyncio as aioredis
+
+    from app.conversation.application.exception.quota_exception import QuotaExceededException
+    from app.conversation.infrastructure.repository.usage_meter_impl import UsageMeterImpl
+
+    redis_client = (
+        aioredis.from_url(args.redis_url, decode_responses=True) if args.redis_url
+        else fakeredis.FakeAsyncRedis(decode_responses=True)
+    )
+    counter = count_round_trips(redis_client)
+    meter = UsageMeterImpl(FixedPlan("TEAM"), redis_client=redis_client)
+    base = 10_000_000  # 실제 데이터와 겹치지 않는 계정 id
+
+    # 계정을 돌려 가며 사용해 분당 요청 한도에 걸리지 않게 함
+    async def check(i: int):
+        await meter.check_available(base + i % 50_000)
+
+    async def record(i: int):
+        await meter.record_usage(base + i % 50_000, 800, 200)
+
+    # 한도를 넘긴 계정 하나를 계속 확인
+    blocked_account = base - 1
+    free_meter = UsageMeterImpl(FixedPlan("FREE"), redis_client=redis_client)
+    try:
+        while True:
+            await free_meter.check_available(blocked_account)
+    except QuotaExceededException:
+        pass
+
+    async def shed(i: int):
+        try:
+            await free_meter.check_available(blocked_account)
+        except QuotaExceededException:
+            pass
+
+    try:
+        return {
+            "check": await measure(check, args.iterations, counter),
+            "record": await measure(record, args.iterations, counter),
+            "shed": await measure(shed, args.iterations, counter),
+        }
+    finally:
+        await redis_client.aclose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--redis-url", default=None, help="실제 Redis URL (기본: fakeredis)")
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    for key, value in BENCH_ENV.items():
+        os.environ.setdefault(key, value)
+    sys.path.insert(0, str(ROOT))
+
+    results = asyncio.run(run(args))
+    for name, result in results.items():
+        print(f"{name:<7} p50={result['p50_ms']}ms  p99={result['p99_ms']}ms  "
+              f"Redis 왕복/호출={result['round_trips_per_call']}")
+
+    commit = git_commit()
+    report = {
+        "benchmark": "usage_quota",
+        "commit": commit,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "redis": "real" if args.redis_url else "fakeredis",
+        "iterations": args.iterations,
+        "results": results,
+    }
+    output = Path(args.output) if args.output else (
+        RESULTS_DIR / f"usage_quota-{commit or 'local'}-{datetime.now():%Y%m%d-%H%M%S}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=2))
+    print(f"\n결과 저장: {output}")
+
+
+if __name__ == "__main__":
+    main()